@@ -8,7 +8,7 @@ from datetime import datetime
 
 import maplestory.utils.date as date_util
 import maplestory.utils.kst as kst
-from maplestory.enums import QueryableDateEnum
+from maplestory.enums import HistoryTypeEnum, QueryableDateEnum
 from maplestory.models.history import Account, CubeHistory, StarforceHistory
 from maplestory.models.history.potential import PotentialHistory
 from maplestory.models.types import PageCursor
@@ -63,23 +63,29 @@ def validate_count(count: int) -> None:
         raise ValueError("count must be between 10 and 1000")
 
 
-def get_starforce_history(
+def fetch_history_page(
+    history_type: str | HistoryTypeEnum,
     result_count: int = 1000,
-    date: datetime | None = kst.yesterday(),
+    date: datetime | None = None,
     page_cursor: PageCursor | None = None,
-) -> StarforceHistory:
-    """스타포스 강화 결과를 조회합니다.
+) -> dict:
+    """확률 정보 히스토리 한 페이지를 조회하여 검증하지 않은 응답을 그대로 반환합니다.
 
     Args:
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
         result_count (int): 한번에 가져오려는 결과의 갯수. (최소 10, 최대 1000)
         date (datetime, optional): 조회 기준일(KST). (cursor가 없는 경우 필수이며 cursor와 함께 사용 불가)
         page_cursor (str, optional): 페이징 처리를 위한 cursor. (date가 없는 경우 필수이며 date와 함께 사용 불가)
 
-    Notes:
-        - 스타포스 확률 정보는 최대 5분 후 확인 가능합니다.
-        - 2023년 12월 27일 데이터부터 조회할 수 있습니다.
+    Returns:
+        dict: API 응답
+
+    Note:
+        응답 전체를 검증하지 않으므로, 다음 페이지 요청에 필요한 `next_cursor`를 바로 읽을 수 있습니다.
     """
 
+    history_type = HistoryTypeEnum(history_type)
+
     validate_count(result_count)
 
     if page_cursor is not None:
@@ -88,16 +94,37 @@ def get_starforce_history(
     validate_date_and_cursor(date, page_cursor)
 
     if isinstance(date, datetime):
-        date_util.is_valid(date, QueryableDateEnum.스타포스)
+        date_util.is_valid(date, QueryableDateEnum[history_type.name])
 
-    path = "/maplestory/v1/history/starforce"
+    path = f"/maplestory/v1/history/{history_type.value}"
     query = {
         "count": result_count,
         "date": date_util.to_string(date),
         "cursor": page_cursor,
     }
-    response = fetch(path, query)
+    return fetch(path, query)
+
+
+def get_starforce_history(
+    result_count: int = 1000,
+    date: datetime | None = kst.yesterday(),
+    page_cursor: PageCursor | None = None,
+) -> StarforceHistory:
+    """스타포스 강화 결과를 조회합니다.
 
+    Args:
+        result_count (int): 한번에 가져오려는 결과의 갯수. (최소 10, 최대 1000)
+        date (datetime, optional): 조회 기준일(KST). (cursor가 없는 경우 필수이며 cursor와 함께 사용 불가)
+        page_cursor (str, optional): 페이징 처리를 위한 cursor. (date가 없는 경우 필수이며 date와 함께 사용 불가)
+
+    Notes:
+        - 스타포스 확률 정보는 최대 5분 후 확인 가능합니다.
+        - 2023년 12월 27일 데이터부터 조회할 수 있습니다.
+    """
+
+    response = fetch_history_page(
+        HistoryTypeEnum.STARFORCE, result_count, date, page_cursor
+    )
     return StarforceHistory.model_validate(response)
 
 
@@ -121,24 +148,7 @@ def get_cube_usage_history(
         - 2022년 11월 25일 데이터부터 조회할 수 있습니다.
     """
 
-    validate_count(result_count)
-
-    if page_cursor is not None:
-        date = None
-
-    validate_date_and_cursor(date, page_cursor)
-
-    if isinstance(date, datetime):
-        date_util.is_valid(date, QueryableDateEnum.큐브)
-
-    path = "/maplestory/v1/history/cube"
-    query = {
-        "count": result_count,
-        "date": date_util.to_string(date),
-        "cursor": page_cursor,
-    }
-    response = fetch(path, query)
-
+    response = fetch_history_page(HistoryTypeEnum.CUBE, result_count, date, page_cursor)
     return CubeHistory.model_validate(response)
 
 
@@ -159,22 +169,7 @@ def get_potential_history(
         - 2024년 1월 25일 데이터부터 조회할 수 있습니다.
     """
 
-    validate_count(result_count)
-
-    if page_cursor is not None:
-        date = None
-
-    validate_date_and_cursor(date, page_cursor)
-
-    if isinstance(date, datetime):
-        date_util.is_valid(date, QueryableDateEnum.잠재능력)
-
-    path = "/maplestory/v1/history/potential"
-    query = {
-        "count": result_count,
-        "date": date_util.to_string(date),
-        "cursor": page_cursor,
-    }
-    response = fetch(path, query)
-
+    response = fetch_history_page(
+        HistoryTypeEnum.POTENTIAL, result_count, date, page_cursor
+    )
     return PotentialHistory.model_validate(response)
@@ -27,6 +27,9 @@ from maplestory.models.types import JobClass, WorldName
 from maplestory.types.union import UnionWorldName
 from maplestory.utils.network import fetch
 
+RANKING_PAGE_SIZE = 200
+"""랭킹 조회 API가 한 페이지에 반환하는 최대 랭킹 정보 수"""
+
 
 def get_overall_ranking_by_id(
     world_name: WorldName | None = None,
@@ -142,6 +142,34 @@ class GuildRankTypeEnum(BaseEnum):
     지하수로 = 2
 
 
+class CharacterRankTypeEnum(BaseEnum):
+    """캐릭터 랭킹 타입을 나타내는 Enum 클래스입니다."""
+
+    OVERALL = "overall"
+    UNION = "union"
+    DOJANG = "dojang"
+    THESEED = "theseed"
+    ACHIEVEMENT = "achievement"
+
+    종합 = "overall"
+    유니온 = "union"
+    무릉도장 = "dojang"
+    더시드 = "theseed"
+    업적 = "achievement"
+
+
+class HistoryTypeEnum(BaseEnum):
+    """확률 정보 조회 API의 히스토리 타입을 나타내는 Enum 클래스입니다."""
+
+    STARFORCE = "starforce"
+    CUBE = "cube"
+    POTENTIAL = "potential"
+
+    스타포스 = "starforce"
+    큐브 = "cube"
+    잠재능력 = "potential"
+
+
 class DojangDifficultyEnum(BaseEnum):
     """무릉도장 구간를 나타내는 Enum 클래스입니다."""
 
@@ -1,13 +1,71 @@
+from __future__ import annotations
+
+import re
 from datetime import datetime
+from typing import Annotated, Any
+
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, PrivateAttr
 
-from pydantic import BaseModel, Field
+from maplestory.utils.intern import InternTable
 
 from ..types import CubePotenialGrade, ItemSlotName, PageCursor
 
+OPTION_VALUE_PATTERN = re.compile(r"[+-]?\d+(?:\.\d+)?")
+
+MAX_OPTION_LINES = 3
+"""잠재능력 옵션 목록 하나의 최대 줄 수"""
+
+
+class ParsedOption:
+    """잠재능력 옵션 문자열을 옵션 명, 값, 단위로 나눈 결과
+
+    "STR : +12%"처럼 콜론 앞을 옵션 명으로, 콜론 뒤의 첫 번째 숫자를 값으로 읽습니다.
+    "<쓸만한 헤이스트> 스킬 사용 가능"처럼 숫자가 없는 옵션은 콜론이 없어도 전체를 옵션 명으로 하고 값은 None입니다.
+
+    Attributes:
+        id: 옵션 번호. `ParsedOption.of`가 처음 본 옵션 문자열에 0부터 차례로 부여합니다.
+        option: 옵션 문자열
+        name: 옵션 명
+        value: 옵션 값. 숫자가 없는 옵션인 경우 None
+        percent: 옵션 값이 % 단위인지 여부
+    """
+
+    __slots__ = ("id", "option", "name", "value", "percent")
+
+    def __init__(self, id: int, option: str):
+        name, _, value = option.partition(":")
+        number = OPTION_VALUE_PATTERN.search(value)
+
+        self.id = id
+        self.option = option
+        self.name = name.strip()
+        self.value = (
+            None
+            if number is None
+            else float(number[0]) if "." in number[0] else int(number[0])
+        )
+        self.percent = option.endswith("%")
+
+    @classmethod
+    def of(cls, option: str) -> ParsedOption:
+        """옵션 문자열을 해석한 결과를 반환합니다. 같은 옵션 문자열이면 같은 객체를 반환합니다."""
+        return _parsed_options.get(option)
+
+    def __repr__(self) -> str:
+        return f"ParsedOption(id={self.id}, name={self.name!r}, value={self.value!r}, percent={self.percent})"
+
+
+_parsed_options: InternTable[str, ParsedOption] = InternTable(
+    lambda option: ParsedOption(len(_parsed_options), option)
+)
+
 
 class PotentialOption(BaseModel):
     """잠재능력 옵션 정보
 
+    `name`, `value`, `percent`는 옵션 문자열을 해석한 `ParsedOption`에서 읽습니다.
+    큐브 히스토리를 읽을 때 같은 (옵션, 등급)의 옵션은 하나의 객체로 만들어 둡니다.
+
     Attributes:
         option: 옵션 명
         grade: 옵션 등급
@@ -31,20 +89,51 @@ class PotentialOption(BaseModel):
         }
     """
 
+    model_config = ConfigDict(frozen=True)
+
     option: str = Field(alias="value")
     grade: CubePotenialGrade
 
+    _parsed: ParsedOption = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._parsed = ParsedOption.of(self.option)
+
+    @property
+    def option_id(self) -> int:
+        return self._parsed.id
+
     @property
     def name(self) -> str:
-        return self.option.split(":")[0].strip()
+        return self._parsed.name
 
     @property
-    def value(self) -> int:
-        return int(self.option.split(":")[1].replace("%", "").strip())
+    def value(self) -> int | float | None:
+        return self._parsed.value
 
     @property
     def percent(self) -> bool:
-        return self.option.endswith("%")
+        return self._parsed.percent
+
+
+_interned_options: InternTable[tuple[str, str], PotentialOption] = InternTable(
+    lambda key: PotentialOption.model_validate({"value": key[0], "grade": key[1]})
+)
+
+
+def _intern_option(data: Any) -> Any:
+    # 히스토리에는 같은 옵션이 반복해서 등장하므로, 같은 (옵션, 등급)은 하나의 객체를 공유합니다.
+    if not isinstance(data, dict):
+        return data
+
+    option, grade = data.get("value"), data.get("grade")
+    if not isinstance(option, str) or not isinstance(grade, str):
+        return data
+
+    return _interned_options.get((option, grade))
+
+
+PotentialOptions = list[Annotated[PotentialOption, BeforeValidator(_intern_option)]]
 
 
 class CubeHistoryInfo(BaseModel):
@@ -85,15 +174,19 @@ class CubeHistoryInfo(BaseModel):
     additional_potential_option_grade: CubePotenialGrade
     upgrade_guarantee: bool
     upgrade_guarantee_count: int
-    before_potential_option: list[PotentialOption]
-    before_additional_potential_option: list[PotentialOption]
-    after_potential_option: list[PotentialOption]
-    after_additional_potential_option: list[PotentialOption]
+    before_potential_option: PotentialOptions
+    before_additional_potential_option: PotentialOptions
+    after_potential_option: PotentialOptions
+    after_additional_potential_option: PotentialOptions
 
     @property
     def is_miracle_time(self) -> bool:
         return self.miracle_time_flag != "이벤트 적용되지 않음"
 
+    @property
+    def is_upgraded(self) -> bool:
+        return self.item_upgrade_result == "성공"
+
 
 class CubeHistory(BaseModel):
     """큐브 사용 결과
@@ -145,10 +238,18 @@ class PotentialHistoryInfo(BaseModel):
     additional_potential_option_grade: str
     upgrade_guarantee: bool
     upgrade_guarantee_count: float
-    before_potential_option: list[PotentialOption]
-    before_additional_potential_option: list[PotentialOption]
-    after_potential_option: list[PotentialOption]
-    after_additional_potential_option: list[PotentialOption]
+    before_potential_option: PotentialOptions
+    before_additional_potential_option: PotentialOptions
+    after_potential_option: PotentialOptions
+    after_additional_potential_option: PotentialOptions
+
+    @property
+    def is_miracle_time(self) -> bool:
+        return self.miracle_time_flag != "이벤트 적용되지 않음"
+
+    @property
+    def is_upgraded(self) -> bool:
+        return self.item_upgrade_result == "성공"
 
 
 class PotentialHistory(BaseModel):
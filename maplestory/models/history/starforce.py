@@ -1,4 +1,5 @@
 from datetime import datetime
+from functools import cached_property, lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field, field_validator
@@ -6,8 +7,53 @@ from pydantic import BaseModel, Field, field_validator
 from maplestory.models.types import PageCursor
 
 
+@lru_cache(maxsize=None)
+def parse_numbers(value: str | None) -> tuple[int, ...]:
+    """쉼표로 구분된 숫자 문자열을 정수 튜플로 변환합니다. 숫자가 아닌 값이 있으면 빈 튜플을 반환합니다.
+
+    Examples:
+        >>> parse_numbers("100,100,100")
+        (100, 100, 100)
+        >>> parse_numbers(None)
+        ()
+        >>> parse_numbers("100,?")
+        ()
+    """
+
+    if not value:
+        return ()
+    try:
+        return tuple(int(number) for number in value.split(",") if number.strip())
+    except ValueError:
+        return ()
+
+
+@lru_cache(maxsize=None)
+def parse_star_range(value: str) -> tuple[int, ...]:
+    """스타포스 이벤트 적용 범위 문자열을 n성 튜플로 변환합니다. 형식이 맞지 않으면 빈 튜플을 반환합니다.
+
+    Examples:
+        >>> parse_star_range("5,10,15")
+        (5, 10, 15)
+        >>> parse_star_range("0~3")
+        (0, 1, 2, 3)
+        >>> parse_star_range("전체")
+        ()
+    """
+
+    stars = []
+    try:
+        for part in value.split(","):
+            start, _, end = part.partition("~")
+            if not start.strip():
+                continue
+            stars.extend(range(int(start), int(end or start) + 1))
+    except ValueError:
+        return ()
+    return tuple(stars)
+
+
 # FIXME: plus_value가 현재 str인데, int/float으로 변경하기. 현재 'null'밖에 보지 못함.
-# TODO: success_rate, event_range가 리스트인 경우 별도로 분리하기
 class StarforceHistoryEvent(BaseModel):
     """진행 중인 스타포스 강화 이벤트 정보
 
@@ -52,6 +98,34 @@ class StarforceHistoryEvent(BaseModel):
     def change_plus_value(cls, v: Any) -> Any:
         return None if v == "null" else v
 
+    # 문자열은 처음 조회할 때 해석합니다. 해석하지 못한 값은 빈 튜플이므로 히스토리 조회에는 영향이 없습니다.
+    @cached_property
+    def success_rates(self) -> tuple[int, ...]:
+        """이벤트 성공 확률 목록 (이벤트 적용 범위의 n성 순서와 같음)"""
+        return parse_numbers(self.success_rate)
+
+    @cached_property
+    def plus_values(self) -> tuple[int, ...]:
+        """이벤트 강화 수치 가중값 목록"""
+        return parse_numbers(self.plus_value)
+
+    @cached_property
+    def stars(self) -> tuple[int, ...]:
+        """이벤트 적용 강화 시도 가능한 n성 목록"""
+        return parse_star_range(self.starforce_event_range)
+
+    def applies_to(self, star: int) -> bool:
+        """강화 시도 전 스타포스 수치가 star일 때 이벤트가 적용되는지 여부"""
+        return star in self.stars
+
+    def success_rate_at(self, star: int) -> int | None:
+        """강화 시도 전 스타포스 수치가 star일 때의 이벤트 성공 확률. 해당하는 확률이 없으면 None"""
+
+        stars, success_rates = self.stars, self.success_rates
+        if len(success_rates) != len(stars) or star not in stars:
+            return None
+        return success_rates[stars.index(star)]
+
 
 class StarforceHistoryInfo(BaseModel):
     """스타포스 히스토리 정보
@@ -94,6 +168,27 @@ class StarforceHistoryInfo(BaseModel):
     date_create: datetime
     starforce_event_list: list[StarforceHistoryEvent] | None
 
+    @property
+    def is_success(self) -> bool:
+        return self.item_upgrade_result.startswith("성공")
+
+    @property
+    def is_destroyed(self) -> bool:
+        return "파괴" in self.item_upgrade_result
+
+    @property
+    def is_starcatch(self) -> bool:
+        return self.starcatch_result == "성공"
+
+    @property
+    def applied_events(self) -> list[StarforceHistoryEvent]:
+        """강화 시도 전 스타포스 수치에 적용된 스타포스 강화 이벤트 목록"""
+        return [
+            event
+            for event in self.starforce_event_list or []
+            if event.applies_to(self.before_starforce_count)
+        ]
+
 
 class StarforceHistory(BaseModel):
     """스타포스 히스토리
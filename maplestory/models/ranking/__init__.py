@@ -1,6 +1,7 @@
 from .achievement import AchievementRanking, AchievementRankingInfo
 from .dojang import DojangRanking, DojangRankingInfo
 from .guild import GuildRanking, GuildRankingInfo
+from .index import RankingIndex
 from .overall import OverallRanking, OverallRankingInfo
 from .theseed import TheSeedRanking, TheSeedRankingInfo
 from .union import UnionRanking, UnionRankingInfo
@@ -14,6 +15,7 @@ __all__ = [
     "GuildRankingInfo",
     "OverallRanking",
     "OverallRankingInfo",
+    "RankingIndex",
     "TheSeedRanking",
     "TheSeedRankingInfo",
     "UnionRanking",
@@ -1,9 +1,17 @@
-from typing import Any, Generic, TypeVar
+from __future__ import annotations
+
+from bisect import insort
+from operator import attrgetter
+from typing import Any, Generic, Iterable, TypeVar
 
 from pydantic import BaseModel
 
+from maplestory.utils.order import merge_sorted, sorted_if_needed
+
 RankingInfoType = TypeVar("RankingInfoType")
 
+rank_key = attrgetter("ranking")
+
 
 class RankingModel(BaseModel, Generic[RankingInfoType]):
     """랭킹 모델의 기본 클래스
@@ -15,7 +23,32 @@ class RankingModel(BaseModel, Generic[RankingInfoType]):
     ranking: list[RankingInfoType]
 
     def model_post_init(self, __context: Any) -> None:
-        self.ranking = sorted(self.ranking, key=lambda x: x.ranking)
+        # API 응답은 이미 순위 순으로 정렬되어 있으므로, 정렬되지 않은 경우에만 정렬합니다.
+        self.ranking = sorted_if_needed(self.ranking, key=rank_key)
+
+    @classmethod
+    def merge(cls, pages: Iterable[RankingModel[RankingInfoType]]):
+        """여러 페이지의 랭킹 정보를 순위 순으로 병합합니다.
+
+        각 페이지는 이미 정렬되어 있으므로 전체를 다시 정렬하지 않고 k-way 병합합니다.
+
+        Args:
+            pages (Iterable[RankingModel]): 병합할 랭킹 정보 페이지 목록
+
+        Returns:
+            RankingModel: 병합된 랭킹 정보
+        """
+
+        return cls(ranking=merge_sorted((page.ranking for page in pages), rank_key))
+
+    def append(self, info: RankingInfoType) -> None:
+        """정렬 순서를 유지하며 랭킹 정보를 추가합니다.
+
+        Args:
+            info (RankingInfoType): 추가할 랭킹 정보
+        """
+
+        insort(self.ranking, info, key=rank_key)
 
     def __iter__(self):
         return iter(self.ranking)
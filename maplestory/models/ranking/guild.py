@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Iterable
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -106,14 +107,14 @@ class GuildTypeRankingInfo(GuildRankingInfo):
 
     @classmethod
     def from_info(
-        cls, info: GuildRankingInfo, type: GuildRankTypeEnum
+        cls, info: GuildRankingInfo, type: int | GuildRankTypeEnum
     ) -> GuildTypeRankingInfo:
         """
         Create a new instance of GuildTypeRankingInfo from a GuildRankingInfo object and a GuildRankTypeEnum.
 
         Args:
             info (GuildRankingInfo): The GuildRankingInfo object to create the GuildTypeRankingInfo from.
-            type (GuildRankTypeEnum): The GuildRankTypeEnum to assign to the 'type' attribute of the new GuildTypeRankingInfo instance.
+            type (int | GuildRankTypeEnum): The GuildRankTypeEnum (or its value) to assign to the 'type' attribute of the new GuildTypeRankingInfo instance.
 
         Returns:
             GuildTypeRankingInfo: A new instance of GuildTypeRankingInfo with the attributes copied from the GuildRankingInfo object and the 'type' attribute set to the provided GuildRankTypeEnum.
@@ -127,9 +128,9 @@ class GuildTypeRankingInfo(GuildRankingInfo):
             ```
         """
 
-        data = info.model_dump()
-        data["type"] = type
-        return cls(**data)
+        # info는 이미 검증된 객체이므로, 필드를 다시 직렬화하고 검증하지 않고 그대로 복사합니다.
+        # type만 GuildRankTypeEnum으로 변환하여 잘못된 값이면 ValueError가 발생합니다.
+        return cls.model_construct(**info.__dict__, type=GuildRankTypeEnum(type))
 
 
 class GuildTypeRanking(RankingModel[GuildTypeRankingInfo]):
@@ -153,11 +154,12 @@ class GuildTypeRanking(RankingModel[GuildTypeRankingInfo]):
             GuildTypeRanking: The created GuildTypeRanking instance.
         """
 
-        data = ranking.model_dump()
-        for info in data["ranking"]:
-            info["type"] = rank_type
-
-        return cls(**data)
+        return cls(
+            ranking=[
+                GuildTypeRankingInfo.from_info(info, rank_type)
+                for info in ranking.ranking
+            ]
+        )
 
 
 class GuildRankingTypePoint(BaseModel):
@@ -283,6 +285,43 @@ class AllGuildRankingInfo(DatetimeRepresentation, BaseModel):
 
         return cls(**data)
 
+    @classmethod
+    def from_rankings(
+        cls, rankings: Iterable[GuildTypeRankingInfo]
+    ) -> AllGuildRankingInfo:
+        """
+        Builds an 'AllGuildRankingInfo' directly from typed guild ranking information of the same guild.
+
+        The common guild information is taken from the first ranking information, and each ranking type's
+        rank and point are set from the ranking information of that type.
+
+        Parameters:
+            rankings (Iterable[GuildTypeRankingInfo]): The guild ranking information of one guild across ranking types.
+
+        Returns:
+            AllGuildRankingInfo: An instance of the 'AllGuildRankingInfo' class representing the guild ranking information.
+
+        Raises:
+            ValidationError: If no ranking information is given.
+        """
+
+        data = {}
+        for info in rankings:
+            if not data:
+                data = {
+                    "date": info.date,
+                    "guild_name": info.guild_name,
+                    "world_name": info.world_name,
+                    "guild_level": info.guild_level,
+                    "guild_master_name": info.guild_master_name,
+                    "guild_mark": info.guild_mark,
+                }
+            data[info.type.name.lower()] = GuildRankingTypePoint(
+                ranking=info.ranking, guild_point=info.guild_point
+            )
+
+        return cls(**data)
+
 
 class AllGuildRanking(RankingModel[AllGuildRankingInfo]):
     """길드 랭킹 정보
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from functools import cached_property
+from typing import Generic, Iterable, Iterator
+
+from maplestory.models.ranking.common import RankingInfoType, RankingModel, rank_key
+from maplestory.utils.order import merge_sorted, sorted_if_needed
+
+INDEXED_FIELDS = ("character_name", "guild_name", "world_name", "class_name")
+LEVEL_FIELDS = ("character_level", "union_level", "guild_level")
+
+
+class RankingIndex(Generic[RankingInfoType]):
+    """여러 페이지의 랭킹 정보를 한 번에 색인하는 인메모리 저장소
+
+    랭킹 정보를 한 번만 정렬/색인하여, 캐릭터 명, 길드 명, 월드 명, 직업 명 조회는
+    해시 색인으로, 순위 및 레벨 범위 조회는 정렬된 배열의 이진 탐색으로 처리합니다.
+
+    Attributes:
+        ranking: 순위 오름차순으로 정렬된 랭킹 목록
+
+    Examples:
+        >>> pages = [get_overall_ranking_by_id(page_number=n) for n in range(1, 4)]
+        >>> index = RankingIndex.from_pages(pages)
+        >>> index.find_character("온앤온")
+        OverallRankingInfo(...)
+        >>> index.guild_members("리더", world_name="스카니아")
+        [OverallRankingInfo(...), ...]
+    """
+
+    def __init__(self, ranking: Iterable[RankingInfoType]):
+        self.ranking: list[RankingInfoType] = sorted_if_needed(list(ranking), rank_key)
+        self._ranks = [info.ranking for info in self.ranking]
+
+        self._indexes: dict[str, dict[str, list[int]]] = {
+            field: defaultdict(list) for field in INDEXED_FIELDS
+        }
+        for position, info in enumerate(self.ranking):
+            for field, index in self._indexes.items():
+                if (value := getattr(info, field, None)) is not None:
+                    index[value].append(position)
+
+        self._level_field = next(
+            (
+                field
+                for field in LEVEL_FIELDS
+                if self.ranking and hasattr(self.ranking[0], field)
+            ),
+            None,
+        )
+        self._by_level = (
+            sorted(
+                range(len(self.ranking)),
+                key=lambda i: getattr(self.ranking[i], self._level_field),
+            )
+            if self._level_field
+            else []
+        )
+        self._levels = [
+            getattr(self.ranking[i], self._level_field) for i in self._by_level
+        ]
+
+    @classmethod
+    def from_pages(
+        cls, pages: Iterable[RankingModel[RankingInfoType]]
+    ) -> RankingIndex[RankingInfoType]:
+        """여러 페이지의 랭킹 정보로 색인을 생성합니다.
+
+        Args:
+            pages (Iterable[RankingModel]): 랭킹 조회 결과 페이지 목록
+
+        Returns:
+            RankingIndex: 색인된 랭킹 저장소
+        """
+
+        return cls(merge_sorted((page.ranking for page in pages), rank_key))
+
+    def __iter__(self) -> Iterator[RankingInfoType]:
+        return iter(self.ranking)
+
+    def __getitem__(self, index: int) -> RankingInfoType:
+        return self.ranking[index]
+
+    def __len__(self) -> int:
+        return len(self.ranking)
+
+    def _lookup(self, field: str, value: str) -> list[RankingInfoType]:
+        return [self.ranking[i] for i in self._indexes[field].get(value, [])]
+
+    def find_character(self, character_name: str) -> RankingInfoType | None:
+        """캐릭터 명으로 랭킹 정보를 조회합니다.
+
+        Args:
+            character_name (str): 캐릭터 명
+
+        Returns:
+            RankingInfoType | None: 랭킹 정보. 색인에 없는 경우 None
+        """
+
+        positions = self._indexes["character_name"].get(character_name)
+        return self.ranking[positions[0]] if positions else None
+
+    def guild_members(
+        self, guild_name: str, world_name: str | None = None
+    ) -> list[RankingInfoType]:
+        """길드 명으로 랭킹 정보를 조회합니다.
+
+        Args:
+            guild_name (str): 길드 명
+            world_name (str, optional): 월드 명. 같은 이름의 길드가 여러 월드에 있는 경우 사용합니다.
+
+        Returns:
+            list[RankingInfoType]: 순위 오름차순으로 정렬된 랭킹 정보 목록
+        """
+
+        members = self._lookup("guild_name", guild_name)
+        if world_name is None:
+            return members
+        return [info for info in members if info.world_name == world_name]
+
+    def by_world(self, world_name: str) -> list[RankingInfoType]:
+        """월드 명으로 랭킹 정보를 조회합니다."""
+        return self._lookup("world_name", world_name)
+
+    def by_class(self, class_name: str) -> list[RankingInfoType]:
+        """직업 명으로 랭킹 정보를 조회합니다."""
+        return self._lookup("class_name", class_name)
+
+    def rank_range(self, start: int, end: int) -> list[RankingInfoType]:
+        """순위가 start 이상 end 이하인 랭킹 정보를 조회합니다.
+
+        Args:
+            start (int): 시작 순위
+            end (int): 끝 순위
+
+        Returns:
+            list[RankingInfoType]: 순위 오름차순으로 정렬된 랭킹 정보 목록
+        """
+
+        lo = bisect_left(self._ranks, start)
+        hi = bisect_right(self._ranks, end)
+        return self.ranking[lo:hi]
+
+    def level_range(self, min_level: int, max_level: int) -> list[RankingInfoType]:
+        """레벨이 min_level 이상 max_level 이하인 랭킹 정보를 조회합니다.
+
+        캐릭터 레벨, 유니온 레벨, 길드 레벨 중 랭킹 정보에 있는 값을 기준으로 합니다.
+
+        Args:
+            min_level (int): 최소 레벨
+            max_level (int): 최대 레벨
+
+        Returns:
+            list[RankingInfoType]: 순위 오름차순으로 정렬된 랭킹 정보 목록
+
+        Raises:
+            ValueError: 레벨 정보가 없는 랭킹인 경우 발생합니다.
+        """
+
+        if self._level_field is None and self.ranking:
+            raise ValueError("This ranking does not have level information.")
+
+        lo = bisect_left(self._levels, min_level)
+        hi = bisect_right(self._levels, max_level)
+        return [self.ranking[i] for i in sorted(self._by_level[lo:hi])]
+
+    @cached_property
+    def character_names(self) -> frozenset[str]:
+        return frozenset(self._indexes["character_name"])
+
+    @cached_property
+    def guild_names(self) -> frozenset[str]:
+        return frozenset(self._indexes["guild_name"])
+
+    @cached_property
+    def world_names(self) -> frozenset[str]:
+        return frozenset(self._indexes["world_name"])
+
+    @cached_property
+    def class_names(self) -> frozenset[str]:
+        return frozenset(self._indexes["class_name"])
+
+    @cached_property
+    def sub_class_names(self) -> frozenset[str]:
+        return frozenset(
+            info.sub_class_name
+            for info in self.ranking
+            if getattr(info, "sub_class_name", None) is not None
+        )
@@ -1,4 +1,6 @@
-from datetime import datetime
+from __future__ import annotations
+
+from datetime import date, datetime
 
 from pydantic import BaseModel, Field, field_validator
 
@@ -75,3 +77,53 @@ class OverallRanking(RankingModel[OverallRankingInfo]):
     @property
     def sub_class_names(self) -> set[str]:
         return {rank.sub_class_name for rank in self.ranking}
+
+
+class OverallRankHistory(BaseModel):
+    """캐릭터의 날짜별 종합 랭킹 기록
+
+    그래프를 그리기 쉽도록 날짜, 순위, 레벨, 경험치를 같은 길이의 배열로 보관합니다.
+    해당 날짜의 랭킹 정보가 없는 경우 순위, 레벨, 경험치는 None입니다.
+
+    Attributes:
+        character_name: 캐릭터 명
+        dates: 랭킹 기준일 목록 (오름차순)
+        ranks: 날짜별 종합 랭킹 순위
+        levels: 날짜별 캐릭터 레벨
+        exps: 날짜별 캐릭터 경험치
+    """
+
+    character_name: str
+    dates: list[date] = []
+    ranks: list[int | None] = []
+    levels: list[int | None] = []
+    exps: list[int | None] = []
+
+    @classmethod
+    def from_infos(
+        cls,
+        character_name: str,
+        dates: list[date],
+        infos: list[OverallRankingInfo | None],
+    ) -> OverallRankHistory:
+        """날짜별 종합 랭킹 정보로 랭킹 기록을 생성합니다.
+
+        Args:
+            character_name (str): 캐릭터 명
+            dates (list[date]): 랭킹 기준일 목록
+            infos (list[OverallRankingInfo | None]): 날짜별 종합 랭킹 정보
+
+        Returns:
+            OverallRankHistory: 캐릭터의 날짜별 종합 랭킹 기록
+        """
+
+        return cls(
+            character_name=character_name,
+            dates=dates,
+            ranks=[info.ranking if info else None for info in infos],
+            levels=[info.character_level if info else None for info in infos],
+            exps=[info.character_exp if info else None for info in infos],
+        )
+
+    def __len__(self) -> int:
+        return len(self.dates)
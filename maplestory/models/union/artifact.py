@@ -1,16 +1,95 @@
 import re
 from datetime import datetime, timedelta
 from enum import Enum
+from functools import lru_cache
+from typing import NamedTuple
 
 from pydantic import BaseModel, Field, computed_field, field_validator
 
 import maplestory.utils.kst as kst
+from maplestory.utils.intern import InternTable
 
 from ..types import ArtifactCrystalOption
 
 StatTuple = tuple[str, int | float]
 UNION_ARTIFACT_MAX_LEVEL = 10
 
+STAT_PATTERN = re.compile(r"([가-힣A-Za-z\s]+)\s(\d+(\.\d+)?%?)?(\s증가)?")
+
+_stat_names: list[str] = []
+
+
+def _new_stat_name_id(name: str) -> int:
+    # InternTable의 잠금 안에서 호출되므로 번호와 이름 목록의 순서가 항상 같습니다.
+    _stat_names.append(name)
+    return len(_stat_names) - 1
+
+
+_stat_name_ids: InternTable[str, int] = InternTable(_new_stat_name_id)
+
+
+def stat_name_id(name: str) -> int:
+    """효과 이름의 번호를 반환합니다. 처음 보는 이름이면 새 번호를 부여합니다."""
+
+    return _stat_name_ids.get(name)
+
+
+def stat_name(name_id: int) -> str:
+    """효과 이름 번호에 해당하는 효과 이름을 반환합니다."""
+
+    return _stat_names[name_id]
+
+
+class ArtifactStat(NamedTuple):
+    """아티팩트 효과 문자열을 해석한 능력치 하나
+
+    Attributes:
+        name_id: 효과 이름 번호 (`stat_name`으로 이름을 얻을 수 있습니다)
+        value: 효과 값. % 단위 효과는 비율 (15.00% -> 0.15)
+        is_ratio: % 단위 효과인지 여부
+    """
+
+    name_id: int
+    value: int | float
+    is_ratio: bool
+
+    @property
+    def name(self) -> str:
+        return stat_name(self.name_id)
+
+
+@lru_cache(maxsize=None)
+def parse_artifact_effect(effect: str) -> tuple[ArtifactStat, ...]:
+    """아티팩트 효과 문자열을 능력치 튜플로 해석합니다.
+
+    같은 문자열은 한 번만 해석하고 결과를 재사용합니다.
+
+    Raises:
+        ValueError: 효과 문자열의 형식이 맞지 않는 경우 발생합니다.
+
+    Examples:
+        >>> parse_artifact_effect("최대 HP 2250, 최대 MP 2250 증가")
+        (ArtifactStat(name_id=0, value=2250, is_ratio=False), ArtifactStat(name_id=1, value=2250, is_ratio=False))
+    """
+
+    matches = STAT_PATTERN.findall(effect)
+    if not matches:
+        raise ValueError(f"Invalid stat string: {effect}")
+
+    results = []
+    for match in matches:
+        name, value = match[0].strip(), match[1]
+        if not value:
+            raise ValueError(f"Invalid stat string: {effect}")
+        elif "%" in value:
+            results.append(
+                ArtifactStat(stat_name_id(name), float(value.rstrip("%")) / 100.0, True)
+            )
+        else:
+            results.append(ArtifactStat(stat_name_id(name), int(value), False))
+
+    return tuple(results)
+
 
 def parse_stat_string(stat_str: str) -> StatTuple | list[StatTuple]:
     """
@@ -50,26 +129,44 @@ def parse_stat_string(stat_str: str) -> StatTuple | list[StatTuple]:
         ('크리티컬 데미지', 0.024)
     """
 
-    stat_pattern = r"([가-힣\s]+)\s(\d+(\.\d+)?%?)?(\s증가)?"
+    results = [(stat.name, stat.value) for stat in parse_artifact_effect(stat_str)]
+    return results[0] if len(results) == 1 else results
 
-    matches = re.findall(stat_pattern, stat_str)
-    if not matches:
-        raise ValueError(f"Invalid stat string: {stat_str}")
 
-    results = []
-    for match in matches:
-        stat_name = match[0].strip()
-        stat_value = match[1]
-
-        if stat_value is None:
-            raise ValueError(f"Invalid stat string: {stat_str}")
-        elif "%" in stat_value:
-            stat_value = float(stat_value.rstrip("%")) / 100.0
-            results.append((stat_name, stat_value))
-        else:
-            results.append((stat_name, int(stat_value)))
+@lru_cache(maxsize=4096)
+def parse_date_expire(value: str) -> kst.KSTAwareDatetime:
+    """크리스탈 유효 기간 문자열을 KST datetime으로 변환합니다.
 
-    return results[0] if len(results) == 1 else results
+    다섯 번째 글자(날짜 구분 문자)로 형식을 골라 한 번만 파싱합니다.
+    여러 계정의 크리스탈은 유효 기간이 겹치는 경우가 많으므로 결과를 캐시합니다.
+
+    - `2024-01-26T00:00+09:00`
+    - `2024/02/20 19:26:00:000` (시간대 정보가 없으면 KST로 간주합니다.)
+
+    Raises:
+        ValueError: 형식이 맞지 않는 경우 발생합니다.
+    """
+
+    separator = value[4:5]
+    if separator == "-":
+        date = datetime.fromisoformat(value)
+    elif separator == "/" and len(value) > 20 and value[19] == ":":
+        # 자릿수가 고정된 형식이므로 strptime 대신 잘라서 변환합니다.
+        date = datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            int(value[20:26].ljust(6, "0")),
+        )
+    elif separator == "/":
+        date = datetime.strptime(value, "%Y/%m/%d %H:%M:%S:%f")
+    else:
+        raise ValueError(f"Invalid date_expire format: {value}")
+
+    return date if kst.is_aware(date) else date.replace(tzinfo=kst.KST_TZ)
 
 
 class UnionArtifactEffect(BaseModel):
@@ -137,6 +234,10 @@ class UnionArtifactEffect(BaseModel):
     def stat(self) -> StatTuple | list[StatTuple]:
         return parse_stat_string(self.name)
 
+    @property
+    def stats(self) -> tuple[ArtifactStat, ...]:
+        return parse_artifact_effect(self.name)
+
     def is_max_level(self) -> bool:
         return self.level == UNION_ARTIFACT_MAX_LEVEL
 
@@ -168,17 +269,7 @@ class UnionArtifactCrystal(BaseModel):
         if isinstance(v, datetime):
             return kst.to_kst(v)
 
-        try:
-            # 2024-01-26T00:00+09:00
-            date = datetime.strptime(v, "%Y-%m-%dT%H:%M%z")
-        except ValueError:
-            # 2024/02/20 19:26:00:000
-            try:
-                date = datetime.strptime(v, "%Y/%m/%d %H:%M:%S:%f")
-            except ValueError as error:
-                raise error
-
-        return date
+        return parse_date_expire(v)
 
     @computed_field
     @property
@@ -197,16 +288,21 @@ class UnionArtifactCrystal(BaseModel):
     def options(self) -> list[ArtifactCrystalOption]:
         return [self.option1, self.option2, self.option3]
 
+    def remaining_time_at(self, reference: datetime) -> timedelta:
+        """기준 시각부터 유효 기간까지 남은 시간을 반환합니다."""
+        return self.date_expire - reference
+
     @computed_field
     @property
     def remaining_time(self) -> timedelta:
-        return self.date_expire - kst.now()
+        return self.remaining_time_at(kst.now())
 
     @computed_field
     @property
     def remaining_time_str(self) -> str:
-        days = self.remaining_time.days
-        seconds = self.remaining_time.seconds
+        remaining_time = self.remaining_time
+        days = remaining_time.days
+        seconds = remaining_time.seconds
         hours = seconds // 3600
         minutes = (seconds % 3600) // 60
         seconds = seconds % 60
@@ -215,13 +311,14 @@ class UnionArtifactCrystal(BaseModel):
     @computed_field
     @property
     def remaining_time_short_str(self) -> str:
-        days = self.remaining_time.days + self.remaining_time.seconds // 3600 / 24
+        remaining_time = self.remaining_time
+        days = remaining_time.days + remaining_time.seconds // 3600 / 24
         return f"{days:.1f}일"
 
     @computed_field
     @property
     def remaining_days(self) -> int:
-        return (self.date_expire - kst.now()).days
+        return self.remaining_time.days
 
 
 class ArtifactCrystalRequiredAP(Enum):
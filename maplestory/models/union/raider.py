@@ -3,6 +3,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from maplestory.utils.order import sorted_if_needed
+
 
 class UnionRaiderBlockPosition(BaseModel):
     """블록이 차지하고 있는 영역 좌표들
@@ -97,8 +99,8 @@ class UnionRaider(BaseModel):
     blocks: list[UnionRaiderBlock] = Field(alias="union_block")
 
     def model_post_init(self, __context: Any) -> None:
-        self.raider_stats = sorted(self.raider_stats)
-        self.occupied_stats = sorted(self.occupied_stats)
+        self.raider_stats = sorted_if_needed(self.raider_stats)
+        self.occupied_stats = sorted_if_needed(self.occupied_stats)
 
     @property
     def 공격대원_효과(self) -> list[str]:
@@ -0,0 +1,362 @@
+"""유니온 아티팩트 정보를 분석하는 기능을 제공하는 모듈입니다.
+
+- `aggregate_artifact_effects` 함수는 여러 유니온 아티팩트 정보의 효과를 효과 이름별 열로 모읍니다.
+- `optimize_artifact_ap` 함수는 남은 아티팩트 AP를 어느 크리스탈에 쓸지 정합니다.
+- `evaluate_crystal_expiry` 함수는 여러 계정의 크리스탈 유효 기간을 한 기준 시각으로 계산해 만료 구간별로 나눕니다.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from functools import lru_cache
+from typing import Iterable, Mapping
+
+from pydantic import BaseModel
+
+import maplestory.utils.kst as kst
+from maplestory.models.union.artifact import (
+    UNION_ARTIFACT_MAX_LEVEL,
+    ArtifactCrystalRequiredAP,
+    UnionArtifact,
+    UnionArtifactCrystal,
+    parse_artifact_effect,
+    stat_name,
+)
+
+MAX_CRYSTAL_LEVEL = 5
+
+CRYSTAL_EXPIRY_WINDOWS = (1, 3, 7)
+"""크리스탈 만료 구간(일)의 기본값"""
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+
+def aggregate_artifact_effects(
+    artifacts: Iterable[UnionArtifact],
+) -> dict[str, array]:
+    """여러 유니온 아티팩트 정보의 효과 값을 효과 이름별로 모읍니다.
+
+    효과 문자열은 `parse_artifact_effect`로 한 번만 해석하며, 효과 이름마다
+    아티팩트 정보 순서대로 값이 담긴 배열(열)을 만듭니다. 효과가 없는 아티팩트의 값은 0입니다.
+    % 단위 효과의 값은 비율입니다. (15.00% -> 0.15)
+
+    Args:
+        artifacts (Iterable[UnionArtifact]): 유니온 아티팩트 정보 (예: 여러 계정 또는 여러 날짜)
+
+    Returns:
+        dict[str, array]: 효과 이름별 값 배열. 배열의 i번째 값은 i번째 아티팩트 정보의 효과 값입니다.
+
+    Examples:
+        >>> columns = aggregate_artifact_effects([artifact_a, artifact_b])
+        >>> columns["올스탯"]
+        array('d', [150.0, 120.0])
+        >>> sum(columns["올스탯"]) / len(columns["올스탯"])
+        135.0
+    """
+
+    artifacts = list(artifacts)
+    columns: dict[int, array] = {}
+    for i, artifact in enumerate(artifacts):
+        for effect in artifact.effects:
+            for name_id, value, _ in parse_artifact_effect(effect.name):
+                if (column := columns.get(name_id)) is None:
+                    column = columns[name_id] = array("d", bytes(8 * len(artifacts)))
+                column[i] += value
+
+    return {stat_name(name_id): column for name_id, column in columns.items()}
+
+
+def crystal_upgrade_cost(level: int, target_level: int) -> int:
+    """크리스탈을 `level`에서 `target_level`로 올리는 데 필요한 AP를 반환합니다.
+
+    Raises:
+        KeyError: 크리스탈 등급이 1 ~ 5가 아닌 경우 발생합니다.
+    """
+
+    return (
+        ArtifactCrystalRequiredAP.from_level(target_level).cumulative
+        - ArtifactCrystalRequiredAP.from_level(level).cumulative
+    )
+
+
+def artifact_effect_levels(
+    crystals: Iterable[UnionArtifactCrystal], include_expired: bool = False
+) -> dict[str, int]:
+    """크리스탈 옵션별 아티팩트 효과 레벨을 반환합니다.
+
+    효과 레벨은 그 옵션을 가진 크리스탈 등급의 합이며 최대 레벨은 10입니다.
+    """
+
+    levels: dict[str, int] = {}
+    for crystal in crystals:
+        if crystal.expired and not include_expired:
+            continue
+        for option in crystal.options:
+            levels[option] = levels.get(option, 0) + crystal.level
+    return {
+        option: min(level, UNION_ARTIFACT_MAX_LEVEL) for option, level in levels.items()
+    }
+
+
+class ArtifactAllocation(BaseModel):
+    """아티팩트 AP 배분 결과
+
+    Attributes:
+        levels: 크리스탈 이름별 배분 후 등급
+        upgrades: 등급이 오르는 크리스탈 이름별 (현재 등급, 배분 후 등급)
+        spent_ap: 사용한 AP
+        gain: 배분으로 늘어나는 효과 가치
+        effect_levels: 배분 후 크리스탈 옵션별 아티팩트 효과 레벨
+    """
+
+    levels: dict[str, int]
+    upgrades: dict[str, tuple[int, int]]
+    spent_ap: int
+    gain: float
+    effect_levels: dict[str, int]
+
+
+CrystalKey = tuple[int, tuple[str, ...]]
+"""(크리스탈 등급, 크리스탈 옵션들)"""
+
+_Allocation = tuple[float, int, tuple[int, ...]]
+"""(늘어나는 가치, 사용한 AP, 크리스탈별 올릴 등급)"""
+
+
+@lru_cache(maxsize=256)
+def _allocate(
+    crystals: tuple[CrystalKey, ...],
+    remain_ap: int,
+    option_values: tuple[tuple[str, float], ...],
+) -> _Allocation:
+    # 크리스탈별로 올릴 등급을 차례로 정하는 배낭 문제입니다.
+    # 효과 레벨 상한(10) 때문에 크리스탈끼리 가치가 서로 영향을 주므로, 남은 AP와 옵션별 효과 레벨을 상태로 메모합니다.
+    # 상한을 넘는 레벨은 가치에 영향이 없으므로 상한으로 잘라 상태 수를 줄입니다.
+    values = dict(option_values)
+    options = sorted(
+        {option for _, crystal_options in crystals for option in crystal_options}
+    )
+    index = {option: i for i, option in enumerate(options)}
+
+    levels = [0] * len(options)
+    for level, crystal_options in crystals:
+        for option in crystal_options:
+            levels[index[option]] += level
+    levels = [min(level, UNION_ARTIFACT_MAX_LEVEL) for level in levels]
+
+    # 크리스탈별 (올릴 등급, 필요 AP) 후보. 필요 AP 오름차순입니다.
+    choices = [
+        [
+            (target - level, crystal_upgrade_cost(level, target))
+            for target in range(level, MAX_CRYSTAL_LEVEL + 1)
+        ]
+        for level, _ in crystals
+    ]
+    # 가치가 0인 옵션은 효과 레벨이 바뀌어도 가치가 같으므로 상태와 등급 선택에서 제외합니다.
+    weights = [values.get(option, 0.0) for option in options]
+    option_indices = [
+        [index[option] for option in crystal_options if weights[index[option]]]
+        for _, crystal_options in crystals
+    ]
+    # i번째 이후 크리스탈에 남은 옵션만 남은 배분에 영향을 줍니다.
+    live = [()] * (len(crystals) + 1)
+    # i번째 이후 크리스탈을 모두 최고 등급으로 올리는 AP. 이보다 많은 AP는 모두 같은 상태입니다.
+    max_costs = [0] * (len(crystals) + 1)
+    for i in reversed(range(len(crystals))):
+        live[i] = tuple(sorted({*live[i + 1], *option_indices[i]}))
+        max_costs[i] = max_costs[i + 1] + choices[i][-1][1]
+
+    memo: dict[tuple[int, int, tuple[int, ...]], _Allocation] = {}
+
+    def solve(i: int, ap: int, levels: list[int]) -> _Allocation:
+        if i == len(crystals):
+            return 0.0, 0, ()
+        ap = min(ap, max_costs[i])
+        if (key := (i, ap, tuple(levels[j] for j in live[i]))) in memo:
+            return memo[key]
+
+        best = None
+        for delta, cost in choices[i]:
+            if cost > ap:
+                break
+            gain, next_levels = 0.0, list(levels)
+            for j in option_indices[i]:
+                before = next_levels[j]
+                next_levels[j] = min(before + delta, UNION_ARTIFACT_MAX_LEVEL)
+                gain += weights[j] * (next_levels[j] - before)
+
+            rest_gain, rest_spent, rest = solve(i + 1, ap - cost, next_levels)
+            candidate = (gain + rest_gain, cost + rest_spent, (delta, *rest))
+            # 가치가 같으면 AP를 적게 쓰는 배분을 고릅니다.
+            if best is None or (candidate[0], -candidate[1]) > (best[0], -best[1]):
+                best = candidate
+            # 옵션이 모두 상한에 닿으면 등급을 더 올려도 AP만 더 쓰므로 더 보지 않습니다.
+            if all(
+                next_levels[j] == UNION_ARTIFACT_MAX_LEVEL for j in option_indices[i]
+            ):
+                break
+
+        memo[key] = best
+        return best
+
+    return solve(0, remain_ap, levels)
+
+
+def optimize_artifact_ap(
+    crystals: Iterable[UnionArtifactCrystal],
+    remain_ap: int,
+    option_values: dict[str, float],
+    include_expired: bool = False,
+) -> ArtifactAllocation:
+    """남은 AP로 효과 가치가 가장 크게 늘어나도록 크리스탈 등급을 올리는 배분을 찾습니다.
+
+    크리스탈 등급마다 필요한 AP는 `ArtifactCrystalRequiredAP`를 따르고, 아티팩트 효과 레벨은 그 옵션을 가진
+    크리스탈 등급의 합(최대 10)입니다. 같은 (크리스탈 구성, 남은 AP, 옵션 가치)에 대한 결과는 메모하여
+    다시 계산하지 않습니다.
+
+    Args:
+        crystals (Iterable[UnionArtifactCrystal]): 아티팩트 크리스탈 정보
+        remain_ap (int): 잔여 아티팩트 AP
+        option_values (dict[str, float]): 크리스탈 옵션별 효과 레벨 1의 가치 (예: {"보스 몬스터 공격 시 데미지 증가": 3})
+        include_expired (bool): 유효 기간이 지난 크리스탈도 배분 대상에 포함할지 여부. 기본값은 False입니다.
+
+    Returns:
+        ArtifactAllocation: AP 배분 결과
+
+    Raises:
+        ValueError: remain_ap가 0보다 작은 경우 발생합니다.
+
+    Examples:
+        >>> artifact = get_union_artifact_info("온앤온")
+        >>> allocation = optimize_artifact_ap(
+        ...     artifact.crystals,
+        ...     artifact.remain_ap,
+        ...     {"크리티컬 데미지 증가": 4, "공격력/마력 증가": 3, "아이템 드롭률 증가": 1},
+        ... )
+        >>> allocation.upgrades
+        {'크리스탈 : 발록': (2, 4)}
+    """
+
+    if remain_ap < 0:
+        raise ValueError("remain_ap must be greater than or equal to 0")
+
+    crystals = [
+        crystal for crystal in crystals if include_expired or not crystal.expired
+    ]
+    gain, spent_ap, deltas = _allocate(
+        tuple((crystal.level, tuple(crystal.options)) for crystal in crystals),
+        remain_ap,
+        tuple(sorted(option_values.items())),
+    )
+
+    levels, upgrades, effect_levels = {}, {}, {}
+    for crystal, delta in zip(crystals, deltas):
+        levels[crystal.name] = crystal.level + delta
+        if delta:
+            upgrades[crystal.name] = (crystal.level, crystal.level + delta)
+        for option in crystal.options:
+            effect_levels[option] = effect_levels.get(option, 0) + crystal.level + delta
+
+    return ArtifactAllocation(
+        levels=levels,
+        upgrades=upgrades,
+        spent_ap=spent_ap,
+        gain=gain,
+        effect_levels={
+            option: min(level, UNION_ARTIFACT_MAX_LEVEL)
+            for option, level in effect_levels.items()
+        },
+    )
+
+
+def crystal_remaining_seconds(
+    crystals: Iterable[UnionArtifactCrystal], reference: datetime
+) -> array:
+    """기준 시각부터 크리스탈별 유효 기간까지 남은 시간(초) 배열을 반환합니다. 이미 지났으면 음수입니다."""
+
+    now = reference.timestamp()
+    return array("d", (crystal.date_expire.timestamp() - now for crystal in crystals))
+
+
+class CrystalExpiryReport(BaseModel):
+    """여러 계정의 크리스탈 만료 정보
+
+    Attributes:
+        reference: 남은 시간을 계산한 기준 시각
+        accounts: 계정 이름 목록
+        remaining_seconds: 계정별로 가장 먼저 만료되는 크리스탈까지 남은 시간(초).
+            유효하지 않다고 표시된 크리스탈은 0 이하이며, 크리스탈이 없으면 inf입니다.
+        buckets: 만료 구간(일)별 계정 이름 목록. 계정은 남은 시간 이상인 가장 작은 구간에 속하며,
+            0 구간은 이미 만료된 크리스탈이 있는 계정입니다. 가장 큰 구간보다 많이 남은 계정은 포함하지 않습니다.
+    """
+
+    reference: datetime
+    accounts: list[str]
+    remaining_seconds: list[float]
+    buckets: dict[int, list[str]]
+
+
+def evaluate_crystal_expiry(
+    accounts: Mapping[str, Iterable[UnionArtifactCrystal]],
+    windows: Iterable[int] = CRYSTAL_EXPIRY_WINDOWS,
+    reference: datetime | None = None,
+) -> CrystalExpiryReport:
+    """여러 계정의 크리스탈 유효 기간을 하나의 기준 시각으로 계산해 만료 구간별로 나눕니다.
+
+    크리스탈마다 `kst.now()`를 다시 호출하지 않으므로 모든 계정의 남은 시간이 같은 시각을 기준으로 합니다.
+    유효하지 않다고 표시된 크리스탈(`expired`)은 유효 기간과 관계없이 이미 만료된 것으로 보고 0 구간에 넣습니다.
+
+    Args:
+        accounts (Mapping[str, Iterable[UnionArtifactCrystal]]): 계정 이름별 아티팩트 크리스탈 정보
+        windows (Iterable[int]): 만료 구간(일). 기본값은 1일, 3일, 7일입니다.
+        reference (datetime, optional): 기준 시각. 없으면 현재 시각(KST)입니다.
+
+    Returns:
+        CrystalExpiryReport: 크리스탈 만료 정보
+
+    Raises:
+        ValueError: 만료 구간이 0 이하인 경우 발생합니다.
+
+    Examples:
+        >>> report = evaluate_crystal_expiry(
+        ...     {name: get_union_artifact_info(name).crystals for name in names}
+        ... )
+        >>> report.buckets
+        {0: [], 1: ['온앤온'], 3: [], 7: ['아델']}
+    """
+
+    windows = sorted(set(windows))
+    if windows and windows[0] <= 0:
+        raise ValueError("windows must be greater than 0")
+
+    reference = kst.now() if reference is None else reference
+    bounds = [0, *(window * SECONDS_PER_DAY for window in windows)]
+    labels = [0, *windows]
+    buckets: dict[int, list[str]] = {label: [] for label in labels}
+
+    names, soonest = [], []
+    for name, crystals in accounts.items():
+        crystals = list(crystals)
+        remaining = min(
+            (
+                min(seconds, 0) if crystal.expired else seconds
+                for crystal, seconds in zip(
+                    crystals, crystal_remaining_seconds(crystals, reference)
+                )
+            ),
+            default=math.inf,
+        )
+        names.append(name)
+        soonest.append(remaining)
+        if (i := bisect_left(bounds, remaining)) < len(bounds):
+            buckets[labels[i]].append(name)
+
+    return CrystalExpiryReport(
+        reference=reference,
+        accounts=names,
+        remaining_seconds=soonest,
+        buckets=buckets,
+    )
@@ -0,0 +1,239 @@
+"""큐브 사용 결과로 등급 상승 확률과 천장 통계를 계산하는 기능을 제공하는 모듈입니다.
+
+- `CubeColumns` 클래스는 히스토리를 한 번만 읽어 열 단위 배열로 보관합니다.
+- `tier_up_rate`, `tier_up_rates` 함수는 등급 상승 확률과 신뢰 구간을 계산합니다.
+- `guarantee_distribution` 함수는 천장 스택의 분포를 계산합니다.
+- `expected_cubes_to_legendary` 함수는 등급별로 레전드리까지 필요한 큐브 수의 기댓값을 계산합니다.
+
+Examples:
+    >>> columns = CubeColumns.from_history(iter_cube_usage_history(date=kst.datetime(2024, 1, 23)))
+    >>> tier_up_rates(columns, by="grade")
+    {'레어': TierUpRate(count=..., upgraded=..., guaranteed=...), ...}
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import Counter
+from itertools import compress
+from math import sqrt
+from typing import Iterable
+
+from pydantic import BaseModel
+
+from maplestory.models.history import CubeHistoryInfo
+from maplestory.models.history.potential import PotentialHistoryInfo
+
+GRADES = ("노멀", "레어", "에픽", "유니크", "레전드리")
+"""낮은 등급부터 정렬된 잠재능력 등급"""
+
+GRADE_CODES = {grade: code for code, grade in enumerate(GRADES)}
+
+
+class TierUpRate(BaseModel):
+    """등급 상승 확률
+
+    Attributes:
+        count: 사용 횟수
+        upgraded: 등급 상승 횟수
+        guaranteed: 천장에 도달하여 등급 상승한 횟수
+        z: 신뢰 구간에 사용할 표준 정규 분포의 z 값 (기본값 1.96, 95% 신뢰 구간)
+    """
+
+    count: int
+    upgraded: int
+    guaranteed: int = 0
+    z: float = 1.96
+
+    @property
+    def rate(self) -> float:
+        return self.upgraded / self.count if self.count else 0.0
+
+    @property
+    def confidence_interval(self) -> tuple[float, float]:
+        """윌슨 점수 구간으로 계산한 등급 상승 확률의 신뢰 구간"""
+
+        if not self.count:
+            return 0.0, 1.0
+
+        n, p, z2 = self.count, self.rate, self.z * self.z
+        center = (p + z2 / (2 * n)) / (1 + z2 / n)
+        margin = self.z * sqrt(p * (1 - p) / n + z2 / (4 * n * n)) / (1 + z2 / n)
+        return max(0.0, center - margin), min(1.0, center + margin)
+
+
+class CubeColumns:
+    """큐브 사용 결과를 열 단위 배열로 보관하는 클래스
+
+    히스토리 정보 객체를 보관하지 않고, 집계에 필요한 값만 정수 배열로 보관합니다.
+    큐브 종류는 번호로 바꾸어 저장하며, `cube_types`에서 번호에 해당하는 이름을 찾을 수 있습니다.
+
+    Attributes:
+        cube_types: 번호 순서대로 정렬된 큐브 종류
+        cube_type: 큐브 종류 번호
+        from_grade: 사용 전 등급 번호 (`GRADES`의 위치)
+        upgraded: 등급 상승 여부
+        guarantee: 천장에 도달하여 등급 상승한 여부
+        guarantee_count: 사용 시점의 천장 스택
+    """
+
+    def __init__(self):
+        self.cube_types: list[str] = []
+        self._cube_type_codes: dict[str, int] = {}
+        self.cube_type = array("H")
+        self.from_grade = array("b")
+        self.upgraded = array("b")
+        self.guarantee = array("b")
+        self.guarantee_count = array("i")
+
+    @classmethod
+    def from_history(
+        cls, records: Iterable[CubeHistoryInfo | PotentialHistoryInfo]
+    ) -> CubeColumns:
+        """히스토리를 한 번 읽어 열 단위 배열을 만듭니다."""
+
+        columns = cls()
+        for info in records:
+            columns.append(info)
+        return columns
+
+    def append(self, info: CubeHistoryInfo | PotentialHistoryInfo) -> None:
+        """히스토리 한 건을 추가합니다.
+
+        에디셔널 큐브는 에디셔널 잠재능력 등급을, 그 외에는 잠재능력 등급을 사용합니다.
+        히스토리에는 사용 후 등급만 있으므로, 등급이 상승한 경우 한 단계 낮은 등급을 사용 전 등급으로 봅니다.
+        """
+
+        cube_type = getattr(info, "cube_type", None) or info.potential_type
+        if (code := self._cube_type_codes.get(cube_type)) is None:
+            code = self._cube_type_codes[cube_type] = len(self.cube_types)
+            self.cube_types.append(cube_type)
+
+        grade = (
+            info.additional_potential_option_grade
+            if "에디셔널" in cube_type
+            else info.potential_option_grade
+        )
+        upgraded = info.is_upgraded
+
+        self.cube_type.append(code)
+        self.from_grade.append(GRADE_CODES[grade] - upgraded)
+        self.upgraded.append(upgraded)
+        self.guarantee.append(info.upgrade_guarantee)
+        self.guarantee_count.append(int(info.upgrade_guarantee_count))
+
+    def __len__(self) -> int:
+        return len(self.upgraded)
+
+
+def tier_up_rate(columns: CubeColumns, z: float = 1.96) -> TierUpRate:
+    """전체 등급 상승 확률을 계산합니다.
+
+    Args:
+        columns (CubeColumns): 큐브 사용 결과
+        z (float): 신뢰 구간에 사용할 z 값
+
+    Returns:
+        TierUpRate: 등급 상승 확률
+    """
+
+    return TierUpRate(
+        count=len(columns),
+        upgraded=sum(columns.upgraded),
+        guaranteed=sum(columns.guarantee),
+        z=z,
+    )
+
+
+def tier_up_rates(
+    columns: CubeColumns, by: str = "cube_type", z: float = 1.96
+) -> dict[str, TierUpRate]:
+    """큐브 종류 또는 사용 전 등급별로 등급 상승 확률을 계산합니다.
+
+    Args:
+        columns (CubeColumns): 큐브 사용 결과
+        by (str): 묶을 기준 (cube_type, grade)
+        z (float): 신뢰 구간에 사용할 z 값
+
+    Returns:
+        dict[str, TierUpRate]: 큐브 종류 또는 등급별 등급 상승 확률. 등급은 낮은 등급부터 정렬됩니다.
+
+    Raises:
+        ValueError: 묶을 수 없는 기준인 경우 발생합니다.
+    """
+
+    match by:
+        case "cube_type":
+            keys, names = columns.cube_type, columns.cube_types
+        case "grade":
+            keys, names = columns.from_grade, GRADES
+        case _:
+            raise ValueError("by must be cube_type or grade")
+
+    counts = Counter(keys)
+    upgraded = Counter(compress(keys, columns.upgraded))
+    guaranteed = Counter(compress(keys, columns.guarantee))
+
+    return {
+        names[key]: TierUpRate(
+            count=counts[key], upgraded=upgraded[key], guaranteed=guaranteed[key], z=z
+        )
+        for key in sorted(counts)
+    }
+
+
+def guarantee_distribution(columns: CubeColumns) -> dict[int, int]:
+    """사용 시점의 천장 스택별 사용 횟수를 계산합니다.
+
+    Args:
+        columns (CubeColumns): 큐브 사용 결과
+
+    Returns:
+        dict[int, int]: 천장 스택 오름차순으로 정렬된 스택별 사용 횟수
+    """
+
+    return dict(sorted(Counter(columns.guarantee_count).items()))
+
+
+def expected_cubes_to_legendary(
+    rates: dict[str, float], ceilings: dict[str, int] | None = None
+) -> dict[str, float]:
+    """등급별로 레전드리 등급까지 필요한 큐브 수의 기댓값을 계산합니다.
+
+    각 등급에서 다음 등급까지 필요한 큐브 수는 기하 분포를 따르며,
+    천장이 있는 등급은 천장 횟수에서 반드시 등급이 상승한다고 봅니다.
+
+    Args:
+        rates (dict[str, float]): 등급별 다음 등급으로의 등급 상승 확률
+        ceilings (dict[str, int], optional): 등급별 천장 횟수
+
+    Returns:
+        dict[str, float]: 등급별 레전드리 등급까지 필요한 큐브 수의 기댓값.
+            등급 상승 확률을 모르는 등급보다 낮은 등급은 제외됩니다.
+
+    Examples:
+        >>> expected_cubes_to_legendary({"에픽": 0.05, "유니크": 0.01})
+        {'레전드리': 0.0, '유니크': 100.0, '에픽': 120.0}
+    """
+
+    ceilings = ceilings or {}
+    expected = {"레전드리": 0.0}
+    total = 0.0
+    for grade in reversed(GRADES[:-1]):
+        rate = rates.get(grade, 0.0)
+        ceiling = ceilings.get(grade)
+        if rate <= 0 and ceiling is None:
+            break
+
+        if ceiling is None:
+            cubes = 1 / rate
+        elif rate <= 0:
+            cubes = float(ceiling)
+        else:
+            # 천장 직전까지 실패할 확률을 고려한 절단 기하 분포의 기댓값
+            cubes = (1 - (1 - rate) ** ceiling) / rate
+
+        total += cubes
+        expected[grade] = total
+
+    return expected
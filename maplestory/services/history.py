@@ -0,0 +1,509 @@
+"""확률 정보 히스토리를 페이지 구분 없이 조회하는 API를 제공하는 모듈입니다.
+
+- `iter_history` 함수는 `next_cursor`를 따라가며 히스토리를 한 건씩 반환합니다.
+- `aiter_history` 함수는 `iter_history`와 같은 동작을 비동기 이터레이터로 제공합니다.
+- `backfill_history` 함수는 여러 날짜의 히스토리를 동시에 조회하고, 진행 상황을 체크포인트 파일에 저장합니다.
+- `sync_history` 함수는 마지막으로 확인한 히스토리 이후에 새로 생긴 히스토리만 조회합니다.
+- `fetch_all_history` 함수는 같은 날짜의 여러 히스토리를 동시에 조회하여 시간 순으로 합칩니다.
+
+Note:
+    - 큐브, 스타포스, 잠재능력 각각 조회 가능한 날짜가 다릅니다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from operator import attrgetter
+from pathlib import Path
+from threading import Lock
+from typing import AsyncIterator, Callable, Iterable, Iterator
+
+from pydantic import BaseModel
+
+import maplestory.utils.date as date_util
+import maplestory.utils.kst as kst
+from maplestory.apis.history import fetch_history_page
+from maplestory.enums import HistoryTypeEnum, QueryableDateEnum
+from maplestory.models.history import CubeHistoryInfo, StarforceHistoryInfo
+from maplestory.models.history.potential import PotentialHistoryInfo
+from maplestory.models.types import PageCursor
+from maplestory.utils.order import merge_sorted
+from maplestory.utils.parallel import DEFAULT_MAX_WORKERS, map_concurrently
+from maplestory.utils.persist import write_atomic
+
+HISTORY_MODELS: dict[HistoryTypeEnum, tuple[str, type[BaseModel]]] = {
+    HistoryTypeEnum.STARFORCE: ("starforce_history", StarforceHistoryInfo),
+    HistoryTypeEnum.CUBE: ("cube_history", CubeHistoryInfo),
+    HistoryTypeEnum.POTENTIAL: ("potential_history", PotentialHistoryInfo),
+}
+"""히스토리 타입별 응답의 목록 키와 히스토리 정보 모델"""
+
+
+def iter_history(
+    history_type: str | HistoryTypeEnum,
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> Iterator[BaseModel]:
+    """`next_cursor`를 따라가며 히스토리를 한 건씩 반환합니다.
+
+    현재 페이지를 검증하는 동안 다음 페이지를 미리 요청하고, 한 번에 한 페이지의 응답만 메모리에 보관합니다.
+
+    Args:
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
+        date (datetime, optional): 조회 기준일(KST). (cursor가 없는 경우 필수이며 cursor와 함께 사용 불가)
+        page_cursor (str, optional): 조회를 시작할 cursor. (date가 없는 경우 필수이며 date와 함께 사용 불가)
+        result_count (int): 한 페이지에 가져오려는 결과의 갯수. (최소 10, 최대 1000)
+
+    Yields:
+        StarforceHistoryInfo | CubeHistoryInfo | PotentialHistoryInfo: 히스토리 정보
+
+    Examples:
+        >>> for info in iter_history("cube", date=kst.datetime(2024, 1, 1)):
+        ...     print(info.target_item)
+    """
+
+    history_type = HistoryTypeEnum(history_type)
+    key, model = HISTORY_MODELS[history_type]
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(
+            fetch_history_page, history_type, result_count, date, page_cursor
+        )
+        while future is not None:
+            page = future.result()
+            next_cursor = page.get("next_cursor")
+            future = (
+                executor.submit(
+                    fetch_history_page, history_type, result_count, None, next_cursor
+                )
+                if next_cursor
+                else None
+            )
+
+            for record in page[key]:
+                yield model.model_validate(record)
+
+
+async def aiter_history(
+    history_type: str | HistoryTypeEnum,
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> AsyncIterator[BaseModel]:
+    """`next_cursor`를 따라가며 히스토리를 한 건씩 반환하는 비동기 이터레이터입니다.
+
+    요청은 별도의 스레드에서 처리되며, 현재 페이지를 검증하는 동안 다음 페이지를 미리 요청합니다.
+
+    Args:
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
+        date (datetime, optional): 조회 기준일(KST). (cursor가 없는 경우 필수이며 cursor와 함께 사용 불가)
+        page_cursor (str, optional): 조회를 시작할 cursor. (date가 없는 경우 필수이며 date와 함께 사용 불가)
+        result_count (int): 한 페이지에 가져오려는 결과의 갯수. (최소 10, 최대 1000)
+
+    Yields:
+        StarforceHistoryInfo | CubeHistoryInfo | PotentialHistoryInfo: 히스토리 정보
+
+    Examples:
+        >>> async for info in aiter_history("cube", date=kst.datetime(2024, 1, 1)):
+        ...     print(info.target_item)
+    """
+
+    history_type = HistoryTypeEnum(history_type)
+    key, model = HISTORY_MODELS[history_type]
+
+    task = asyncio.ensure_future(
+        asyncio.to_thread(
+            fetch_history_page, history_type, result_count, date, page_cursor
+        )
+    )
+    try:
+        while task is not None:
+            page = await task
+            next_cursor = page.get("next_cursor")
+            task = (
+                asyncio.ensure_future(
+                    asyncio.to_thread(
+                        fetch_history_page,
+                        history_type,
+                        result_count,
+                        None,
+                        next_cursor,
+                    )
+                )
+                if next_cursor
+                else None
+            )
+
+            for record in page[key]:
+                yield model.model_validate(record)
+    finally:
+        if task is not None:
+            task.cancel()
+
+
+def iter_starforce_history(
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> Iterator[StarforceHistoryInfo]:
+    """스타포스 강화 결과를 한 건씩 반환합니다.
+
+    Notes:
+        - 스타포스 확률 정보는 최대 5분 후 확인 가능합니다.
+        - 2023년 12월 27일 데이터부터 조회할 수 있습니다.
+    """
+    return iter_history(HistoryTypeEnum.STARFORCE, date, page_cursor, result_count)
+
+
+def iter_cube_usage_history(
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> Iterator[CubeHistoryInfo]:
+    """큐브 사용 결과를 한 건씩 반환합니다.
+
+    Notes:
+        - 데이터는 매일 오전 4시, 전일 데이터가 갱신됩니다.
+        - 2022년 11월 25일 데이터부터 조회할 수 있습니다.
+    """
+    return iter_history(HistoryTypeEnum.CUBE, date, page_cursor, result_count)
+
+
+def iter_potential_history(
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> Iterator[PotentialHistoryInfo]:
+    """잠재능력 재설정 이용 결과를 한 건씩 반환합니다.
+
+    Notes:
+        - 데이터는 매일 오전 4시, 전일 데이터가 갱신됩니다.
+        - 2024년 1월 25일 데이터부터 조회할 수 있습니다.
+    """
+    return iter_history(HistoryTypeEnum.POTENTIAL, date, page_cursor, result_count)
+
+
+def aiter_starforce_history(
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> AsyncIterator[StarforceHistoryInfo]:
+    """스타포스 강화 결과를 한 건씩 반환하는 비동기 이터레이터입니다."""
+    return aiter_history(HistoryTypeEnum.STARFORCE, date, page_cursor, result_count)
+
+
+def aiter_cube_usage_history(
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> AsyncIterator[CubeHistoryInfo]:
+    """큐브 사용 결과를 한 건씩 반환하는 비동기 이터레이터입니다."""
+    return aiter_history(HistoryTypeEnum.CUBE, date, page_cursor, result_count)
+
+
+def aiter_potential_history(
+    date: datetime | None = None,
+    page_cursor: PageCursor | None = None,
+    result_count: int = 1000,
+) -> AsyncIterator[PotentialHistoryInfo]:
+    """잠재능력 재설정 이용 결과를 한 건씩 반환하는 비동기 이터레이터입니다."""
+    return aiter_history(HistoryTypeEnum.POTENTIAL, date, page_cursor, result_count)
+
+
+class BackfillCheckpoint(BaseModel):
+    """히스토리 백필 진행 상황
+
+    날짜별로 다음에 요청할 cursor를 저장합니다. 날짜가 없으면 아직 시작하지 않은 날짜이고,
+    cursor가 None이면 모든 페이지를 조회한 날짜입니다.
+
+    Attributes:
+        history_type: 히스토리 타입
+        cursors: 날짜(YYYY-MM-DD)별 다음에 요청할 cursor
+    """
+
+    history_type: HistoryTypeEnum
+    cursors: dict[str, PageCursor | None] = {}
+
+    @classmethod
+    def load(
+        cls, path: str | Path, history_type: str | HistoryTypeEnum
+    ) -> "BackfillCheckpoint":
+        """체크포인트 파일을 읽습니다. 파일이 없으면 빈 체크포인트를 반환합니다.
+
+        Raises:
+            ValueError: 체크포인트 파일의 히스토리 타입이 다른 경우 발생합니다.
+        """
+
+        history_type = HistoryTypeEnum(history_type)
+        path = Path(path)
+        if not path.exists():
+            return cls(history_type=history_type)
+
+        checkpoint = cls.model_validate_json(path.read_text(encoding="utf-8"))
+        if checkpoint.history_type != history_type:
+            raise ValueError(
+                f"checkpoint is for {checkpoint.history_type.value}, not {history_type.value}"
+            )
+        return checkpoint
+
+    def save(self, path: str | Path) -> None:
+        """체크포인트 파일을 저장합니다. 저장 중 중단되어도 이전 파일이 깨지지 않도록 교체 방식으로 씁니다."""
+
+        write_atomic(path, self.model_dump_json())
+
+    def is_done(self, date: str) -> bool:
+        return date in self.cursors and self.cursors[date] is None
+
+
+def backfill_history(
+    history_type: str | HistoryTypeEnum,
+    sink: Callable[[str, list[BaseModel]], None],
+    start_date: kst.KSTAwareDatetime | None = None,
+    end_date: kst.KSTAwareDatetime = kst.yesterday(),
+    checkpoint_path: str | Path | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    result_count: int = 1000,
+) -> dict[str, int]:
+    """여러 날짜의 히스토리를 동시에 조회합니다.
+
+    날짜별로 최대 `max_workers`개씩 동시에 조회하며, 하루 안의 페이지는 cursor를 따라 순서대로 조회합니다.
+    한 페이지를 `sink`에 전달할 때마다 다음 cursor를 체크포인트 파일에 저장하므로,
+    중단된 백필을 같은 체크포인트 파일로 다시 실행하면 중단된 페이지부터 이어서 조회합니다.
+
+    Args:
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
+        sink (Callable[[str, list], None]): 날짜(YYYY-MM-DD)와 한 페이지의 히스토리 정보를 받는 함수.
+            여러 스레드에서 호출되지만 동시에 호출되지는 않습니다.
+        start_date (datetime, optional): 조회 시작일(KST). 기본값은 히스토리 타입의 조회 가능한 최소 날짜입니다.
+        end_date (datetime): 조회 종료일(KST). 기본값은 어제입니다.
+        checkpoint_path (str | Path, optional): 체크포인트 파일 경로. 없으면 진행 상황을 저장하지 않습니다.
+        max_workers (int): 최대 동시 요청 수
+        result_count (int): 한 페이지에 가져오려는 결과의 갯수. (최소 10, 최대 1000)
+
+    Returns:
+        dict[str, int]: 이번 실행에서 조회한 날짜별 히스토리 건 수
+
+    Raises:
+        ValueError: 조회 시작일이 조회 종료일보다 늦거나, 조회할 수 없는 날짜인 경우 발생합니다.
+
+    Examples:
+        >>> backfill_history(
+        ...     "cube",
+        ...     lambda date, records: store.extend(records),
+        ...     checkpoint_path="cube_backfill.json",
+        ... )
+        {'2022-11-25': 0, ...}
+    """
+
+    history_type = HistoryTypeEnum(history_type)
+    key, model = HISTORY_MODELS[history_type]
+
+    if start_date is None:
+        start_date = QueryableDateEnum[history_type.name].value
+    date_util.is_valid(start_date, QueryableDateEnum[history_type.name])
+    if start_date.date() > end_date.date():
+        raise ValueError("start_date must be earlier than or equal to end_date.")
+
+    start = kst.datetime(start_date.year, start_date.month, start_date.day)
+    days = (end_date.date() - start.date()).days + 1
+    dates = [start + timedelta(days=day) for day in range(days)]
+
+    checkpoint = (
+        BackfillCheckpoint.load(checkpoint_path, history_type)
+        if checkpoint_path is not None
+        else BackfillCheckpoint(history_type=history_type)
+    )
+    lock = Lock()
+
+    def backfill_day(date: datetime) -> int:
+        day = date_util.to_string(date)
+        if checkpoint.is_done(day):
+            return 0
+
+        count = 0
+        cursor = checkpoint.cursors.get(day)
+        while True:
+            page = fetch_history_page(
+                history_type, result_count, None if cursor else date, cursor
+            )
+            records = [model.model_validate(record) for record in page[key]]
+            cursor = page.get("next_cursor")
+            count += len(records)
+
+            with lock:
+                sink(day, records)
+                checkpoint.cursors[day] = cursor
+                if checkpoint_path is not None:
+                    checkpoint.save(checkpoint_path)
+
+            if not cursor:
+                return count
+
+    counts = map_concurrently(backfill_day, dates, max_workers)
+    return {date_util.to_string(date): count for date, count in zip(dates, counts)}
+
+
+class HistorySyncMarker(BaseModel):
+    """마지막으로 확인한 히스토리
+
+    Attributes:
+        id: 히스토리 식별자
+        date_create: 히스토리 생성 일시 (KST)
+    """
+
+    id: str
+    date_create: datetime
+
+
+class HistorySyncState(BaseModel):
+    """히스토리 타입별로 마지막으로 확인한 히스토리
+
+    Attributes:
+        markers: 히스토리 타입별 마지막으로 확인한 히스토리
+    """
+
+    markers: dict[HistoryTypeEnum, HistorySyncMarker] = {}
+
+    @classmethod
+    def load(cls, path: str | Path) -> "HistorySyncState":
+        """상태 파일을 읽습니다. 파일이 없으면 빈 상태를 반환합니다."""
+
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        return cls.model_validate_json(path.read_text(encoding="utf-8"))
+
+    def save(self, path: str | Path) -> None:
+        """상태 파일을 저장합니다."""
+        write_atomic(path, self.model_dump_json())
+
+
+def sync_history(
+    history_type: str | HistoryTypeEnum,
+    sink: Callable[[list[BaseModel]], None],
+    state: HistorySyncState,
+    date: kst.KSTAwareDatetime | None = None,
+    state_path: str | Path | None = None,
+    result_count: int = 1000,
+) -> int:
+    """마지막으로 확인한 히스토리 이후에 새로 생긴 히스토리만 조회합니다.
+
+    히스토리는 최신순으로 반환되므로, 첫 페이지부터 조회하다가 이미 확인한 히스토리를 만나면 더 이상 조회하지 않습니다.
+    새 히스토리가 한 페이지 안에 있으면 한 번의 요청으로 끝납니다.
+    `date`를 지정하지 않으면 오늘부터 마지막으로 확인한 히스토리의 날짜까지 거꾸로 조회하므로,
+    마지막 실행 이후 자정이 지나도 전날의 새 히스토리를 놓치지 않습니다.
+    새 히스토리를 `sink`에 전달한 뒤에 `state`를 갱신하므로, `sink`에서 예외가 발생하면 다음 실행에서 다시 전달합니다.
+
+    Args:
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
+        sink (Callable[[list], None]): 오래된 순으로 정렬된 새 히스토리 정보를 받는 함수. 새 히스토리가 없으면 호출하지 않습니다.
+        state (HistorySyncState): 히스토리 타입별로 마지막으로 확인한 히스토리. 조회 후 갱신됩니다.
+        date (datetime, optional): 조회 기준일(KST). 지정하면 이 날짜만 조회합니다.
+            기본값은 오늘부터 마지막으로 확인한 히스토리의 날짜까지입니다.
+        state_path (str | Path, optional): 갱신된 상태를 저장할 파일 경로
+        result_count (int): 한 페이지에 가져오려는 결과의 갯수. (최소 10, 최대 1000)
+
+    Returns:
+        int: 새 히스토리 건 수
+
+    Examples:
+        >>> state = HistorySyncState.load("sync.json")
+        >>> sync_history("starforce", store.extend, state, state_path="sync.json")
+        3
+    """
+
+    history_type = HistoryTypeEnum(history_type)
+    key, model = HISTORY_MODELS[history_type]
+    marker = state.markers.get(history_type)
+
+    if date is not None:
+        dates = [date]
+    else:
+        # 마지막 실행 이후 자정이 지났으면 그 사이의 날짜도 최신 날짜부터 확인합니다.
+        today = kst.today()
+        since = kst.to_kst(marker.date_create).date() if marker else today.date()
+        dates = [
+            today - timedelta(days=day)
+            for day in range(max((today.date() - since).days, 0) + 1)
+        ]
+
+    new_records = []
+    for day in dates:
+        cursor = None
+        reached_marker = False
+        while True:
+            page = fetch_history_page(
+                history_type, result_count, None if cursor else day, cursor
+            )
+            for record in page[key]:
+                info = model.model_validate(record)
+                if marker is not None and (
+                    info.id == marker.id or info.date_create < marker.date_create
+                ):
+                    reached_marker = True
+                    break
+                new_records.append(info)
+            else:
+                cursor = page.get("next_cursor")
+
+            if reached_marker or not cursor:
+                break
+
+        if reached_marker:
+            break
+
+    if not new_records:
+        return 0
+
+    new_records.reverse()
+    sink(new_records)
+
+    latest = new_records[-1]
+    state.markers[history_type] = HistorySyncMarker(
+        id=latest.id, date_create=latest.date_create
+    )
+    if state_path is not None:
+        state.save(state_path)
+
+    return len(new_records)
+
+
+def fetch_all_history(
+    date: kst.KSTAwareDatetime = kst.yesterday(),
+    history_types: Iterable[str | HistoryTypeEnum] = tuple(HistoryTypeEnum),
+    result_count: int = 1000,
+) -> list[BaseModel]:
+    """같은 날짜의 여러 히스토리를 동시에 조회하여 하나의 시간 순 목록으로 합칩니다.
+
+    히스토리 타입별 cursor 조회는 동시에 진행하고, 한 타입 안의 페이지는 순서대로 조회합니다.
+    각 타입의 히스토리는 이미 시간 순으로 정렬되어 있으므로 힙 기반으로 병합합니다.
+
+    Args:
+        date (datetime): 조회 기준일(KST). 기본값은 어제입니다.
+        history_types (Iterable[str | HistoryTypeEnum]): 조회할 히스토리 타입 목록 (기본값은 전체)
+        result_count (int): 한 페이지에 가져오려는 결과의 갯수. (최소 10, 최대 1000)
+
+    Returns:
+        list: 사용 일시(date_create) 오름차순으로 정렬된 히스토리 정보
+
+    Raises:
+        ValueError: 히스토리 타입의 조회 가능한 날짜보다 이전 날짜인 경우 발생합니다.
+
+    Examples:
+        >>> timeline = fetch_all_history(kst.datetime(2024, 2, 17))
+        >>> [type(info).__name__ for info in timeline[:2]]
+        ['StarforceHistoryInfo', 'CubeHistoryInfo']
+    """
+
+    types = list(dict.fromkeys(HistoryTypeEnum(t) for t in history_types))
+    for history_type in types:
+        date_util.is_valid(date, QueryableDateEnum[history_type.name])
+
+    chains = map_concurrently(
+        lambda history_type: list(
+            iter_history(history_type, date, result_count=result_count)
+        )[::-1],
+        types,
+    )
+    return merge_sorted(chains, key=attrgetter("date_create"))
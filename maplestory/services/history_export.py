@@ -0,0 +1,194 @@
+"""확률 정보 히스토리를 JSON Lines 또는 CSV 파일로 내보내는 기능을 제공하는 모듈입니다.
+
+- `flatten_history` 함수는 히스토리 한 건을 옵션 목록이 고정된 열로 펼쳐진 딕셔너리로 변환합니다.
+- `export_jsonl`, `export_csv` 함수는 히스토리를 받는 즉시 한 줄씩 파일에 씁니다.
+- `export_history` 함수는 여러 날짜의 히스토리를 cursor를 따라가며 조회하여 파일로 내보냅니다.
+
+파일 경로가 `.gz`로 끝나면 gzip으로 압축하여 저장합니다.
+"""
+
+import csv
+import gzip
+import json
+from datetime import datetime
+from itertools import chain
+from pathlib import Path
+from typing import IO, Any, Iterable
+
+from pydantic import BaseModel
+
+from maplestory.enums import HistoryTypeEnum
+from maplestory.models.history.potential import MAX_OPTION_LINES
+from maplestory.services.history import HISTORY_MODELS, iter_history
+
+OPTION_LIST_FIELDS = (
+    "before_potential_option",
+    "before_additional_potential_option",
+    "after_potential_option",
+    "after_additional_potential_option",
+)
+"""고정된 열로 펼칠 잠재능력 옵션 목록 필드"""
+
+
+def _open(path: str | Path, compress: bool | None) -> IO[str]:
+    path = Path(path)
+    if compress is None:
+        compress = path.suffix == ".gz"
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def history_columns(history_type: str | HistoryTypeEnum) -> list[str]:
+    """히스토리 타입의 CSV 열 이름 목록을 반환합니다.
+
+    Args:
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
+
+    Returns:
+        list[str]: 옵션 목록 필드를 `{필드}_{n}`, `{필드}_{n}_grade` 열로 펼친 열 이름 목록.
+            JSON Lines와 같이 API 응답의 필드 이름(alias)을 사용합니다.
+    """
+
+    _, model = HISTORY_MODELS[HistoryTypeEnum(history_type)]
+
+    columns = []
+    for name, field in model.model_fields.items():
+        column = field.alias or name
+        if column in OPTION_LIST_FIELDS:
+            for line in range(1, MAX_OPTION_LINES + 1):
+                columns.extend((f"{column}_{line}", f"{column}_{line}_grade"))
+        else:
+            columns.append(column)
+    return columns
+
+
+def flatten_history(info: BaseModel) -> dict[str, Any]:
+    """히스토리 한 건을 CSV 한 행으로 쓸 수 있는 딕셔너리로 변환합니다.
+
+    열 이름은 `export_jsonl`과 같이 API 응답의 필드 이름(alias)을 사용합니다.
+    잠재능력 옵션 목록은 `{필드}_{n}`, `{필드}_{n}_grade` 열로 펼치고,
+    스타포스 강화 이벤트 목록은 JSON 문자열로 저장합니다.
+
+    Args:
+        info (BaseModel): 히스토리 정보
+
+    Returns:
+        dict[str, Any]: 열 이름과 값
+    """
+
+    row = {}
+    for name, field in type(info).model_fields.items():
+        value = getattr(info, name)
+        column = field.alias or name
+        if column in OPTION_LIST_FIELDS:
+            for line, option in enumerate(value[:MAX_OPTION_LINES], start=1):
+                row[f"{column}_{line}"] = option.option
+                row[f"{column}_{line}_grade"] = option.grade
+        elif isinstance(value, datetime):
+            row[column] = value.isoformat()
+        elif isinstance(value, list):
+            row[column] = json.dumps(
+                [item.model_dump(by_alias=True) for item in value], ensure_ascii=False
+            )
+        else:
+            row[column] = value
+    return row
+
+
+def export_jsonl(
+    records: Iterable[BaseModel],
+    path: str | Path,
+    flatten: bool = False,
+    compress: bool | None = None,
+) -> int:
+    """히스토리를 JSON Lines 파일로 내보냅니다.
+
+    Args:
+        records (Iterable[BaseModel]): 히스토리 정보. 스트리밍 이터레이터를 넘기면 한 건씩 씁니다.
+        path (str | Path): 파일 경로
+        flatten (bool): True이면 `flatten_history`로 펼친 행을, False이면 API 응답과 같은 필드 이름으로 씁니다.
+        compress (bool, optional): gzip 압축 여부. 기본값은 경로가 `.gz`로 끝나는지 여부입니다.
+
+    Returns:
+        int: 내보낸 히스토리 건 수
+    """
+
+    count = 0
+    with _open(path, compress) as file:
+        for info in records:
+            if flatten:
+                line = json.dumps(flatten_history(info), ensure_ascii=False)
+            else:
+                line = info.model_dump_json(by_alias=True)
+            file.write(line + "\n")
+            count += 1
+    return count
+
+
+def export_csv(
+    records: Iterable[BaseModel],
+    path: str | Path,
+    history_type: str | HistoryTypeEnum,
+    compress: bool | None = None,
+) -> int:
+    """히스토리를 CSV 파일로 내보냅니다.
+
+    Args:
+        records (Iterable[BaseModel]): 히스토리 정보. 스트리밍 이터레이터를 넘기면 한 건씩 씁니다.
+        path (str | Path): 파일 경로
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
+        compress (bool, optional): gzip 압축 여부. 기본값은 경로가 `.gz`로 끝나는지 여부입니다.
+
+    Returns:
+        int: 내보낸 히스토리 건 수
+    """
+
+    count = 0
+    with _open(path, compress) as file:
+        writer = csv.DictWriter(file, fieldnames=history_columns(history_type))
+        writer.writeheader()
+        for info in records:
+            writer.writerow(flatten_history(info))
+            count += 1
+    return count
+
+
+def export_history(
+    history_type: str | HistoryTypeEnum,
+    path: str | Path,
+    dates: Iterable[datetime],
+    format: str = "jsonl",
+    compress: bool | None = None,
+) -> int:
+    """여러 날짜의 히스토리를 조회하는 대로 파일에 씁니다.
+
+    날짜 수와 관계없이 한 번에 한 페이지의 응답만 메모리에 보관합니다.
+
+    Args:
+        history_type (str | HistoryTypeEnum): 히스토리 타입 (starforce, cube, potential)
+        path (str | Path): 파일 경로
+        dates (Iterable[datetime]): 조회 기준일(KST) 목록
+        format (str): 파일 형식 (jsonl, csv)
+        compress (bool, optional): gzip 압축 여부. 기본값은 경로가 `.gz`로 끝나는지 여부입니다.
+
+    Returns:
+        int: 내보낸 히스토리 건 수
+
+    Raises:
+        ValueError: 지원하지 않는 파일 형식인 경우 발생합니다.
+
+    Examples:
+        >>> dates = [kst.datetime(2024, 1, day) for day in range(1, 32)]
+        >>> export_history("cube", "cube_2024_01.csv.gz", dates, format="csv")
+        1234
+    """
+
+    records = chain.from_iterable(iter_history(history_type, date) for date in dates)
+    match format:
+        case "jsonl":
+            return export_jsonl(records, path, compress=compress)
+        case "csv":
+            return export_csv(records, path, history_type, compress=compress)
+        case _:
+            raise ValueError("format must be jsonl or csv")
@@ -0,0 +1,239 @@
+"""큐브 사용 결과와 잠재능력 재설정 결과를 SQLite에 저장하고 집계하는 기능을 제공하는 모듈입니다.
+
+- `PotentialHistoryStore` 클래스는 히스토리를 사용 기록(uses)과 옵션(options) 테이블로 나누어 저장합니다.
+- `GradeUpRate` 클래스는 등급 상승 확률 집계 결과를 나타냅니다.
+
+Examples:
+    >>> with PotentialHistoryStore("history.db") as store:
+    ...     store.insert(iter_cube_usage_history(date=kst.datetime(2024, 1, 23)))
+    ...     store.grade_up_rate(by="cube_type")
+    [GradeUpRate(key='수상한 에디셔널 큐브', count=..., upgraded=...), ...]
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+from maplestory.models.history import CubeHistoryInfo
+from maplestory.models.history.potential import PotentialHistoryInfo
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS uses (
+    id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    character_name TEXT NOT NULL,
+    date_create TEXT NOT NULL,
+    cube_type TEXT NOT NULL,
+    item_upgrade_result TEXT NOT NULL,
+    upgraded INTEGER NOT NULL,
+    miracle_time INTEGER NOT NULL,
+    item_equipment_part TEXT NOT NULL,
+    item_level INTEGER NOT NULL,
+    target_item TEXT NOT NULL,
+    potential_option_grade TEXT NOT NULL,
+    additional_potential_option_grade TEXT NOT NULL,
+    upgrade_guarantee INTEGER NOT NULL,
+    upgrade_guarantee_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS options (
+    use_id TEXT NOT NULL REFERENCES uses(id),
+    stage TEXT NOT NULL,
+    additional INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    option TEXT NOT NULL,
+    grade TEXT NOT NULL,
+    PRIMARY KEY (use_id, stage, additional, position)
+);
+CREATE INDEX IF NOT EXISTS uses_date_create ON uses (date_create);
+CREATE INDEX IF NOT EXISTS options_option ON options (option);
+"""
+
+GROUP_COLUMNS = (
+    "kind",
+    "cube_type",
+    "item_level",
+    "miracle_time",
+    "item_equipment_part",
+    "potential_option_grade",
+    "character_name",
+)
+"""`grade_up_rate`에서 묶을 수 있는 열 목록"""
+
+OPTION_FIELDS = (
+    ("before", 0, "before_potential_option"),
+    ("before", 1, "before_additional_potential_option"),
+    ("after", 0, "after_potential_option"),
+    ("after", 1, "after_additional_potential_option"),
+)
+
+HistoryInfo = CubeHistoryInfo | PotentialHistoryInfo
+
+
+class GradeUpRate(BaseModel):
+    """등급 상승 확률 집계 결과
+
+    Attributes:
+        key: 묶은 열의 값
+        count: 사용 횟수
+        upgraded: 등급 상승 횟수
+    """
+
+    key: Any
+    count: int
+    upgraded: int
+
+    @property
+    def rate(self) -> float:
+        return self.upgraded / self.count if self.count else 0.0
+
+
+def _use_row(info: HistoryInfo) -> tuple:
+    if isinstance(info, CubeHistoryInfo):
+        kind, cube_type = "cube", info.cube_type
+    else:
+        kind, cube_type = "potential", info.potential_type
+
+    return (
+        info.id,
+        kind,
+        info.character_name,
+        info.date_create.isoformat(),
+        cube_type,
+        info.item_upgrade_result,
+        info.is_upgraded,
+        info.is_miracle_time,
+        info.item_equipment_part,
+        int(info.item_level),
+        info.target_item,
+        info.potential_option_grade,
+        info.additional_potential_option_grade,
+        info.upgrade_guarantee,
+        int(info.upgrade_guarantee_count),
+    )
+
+
+def _option_rows(info: HistoryInfo) -> Iterable[tuple]:
+    for stage, additional, field in OPTION_FIELDS:
+        for position, option in enumerate(getattr(info, field)):
+            yield (info.id, stage, additional, position, option.option, option.grade)
+
+
+class PotentialHistoryStore:
+    """큐브 사용 결과와 잠재능력 재설정 결과를 정규화하여 저장하는 SQLite 저장소
+
+    히스토리 한 건은 `uses` 테이블의 한 행으로, 사용 전후의 잠재능력 옵션은 `options` 테이블의 행으로 저장합니다.
+    같은 식별자의 히스토리는 한 번만 저장되므로 같은 날짜를 여러 번 저장해도 됩니다.
+
+    Args:
+        path (str | Path): 데이터베이스 파일 경로. 기본값은 메모리 데이터베이스입니다.
+    """
+
+    def __init__(self, path: str | Path = ":memory:"):
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self) -> PotentialHistoryStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.connection.execute("SELECT COUNT(*) FROM uses").fetchone()[0]
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def insert(self, records: Iterable[HistoryInfo], batch_size: int = 1000) -> int:
+        """히스토리를 `batch_size`건씩 나누어 저장합니다.
+
+        스트리밍 이터레이터를 그대로 넘기면 한 번에 `batch_size`건만 메모리에 보관합니다.
+
+        Args:
+            records (Iterable[CubeHistoryInfo | PotentialHistoryInfo]): 저장할 히스토리
+            batch_size (int): 한 트랜잭션에 저장할 히스토리 건 수
+
+        Returns:
+            int: 새로 저장된 히스토리 건 수
+        """
+
+        inserted = 0
+        records = iter(records)
+        while batch := list(islice(records, batch_size)):
+            with self.connection:
+                cursor = self.connection.executemany(
+                    f"INSERT OR IGNORE INTO uses VALUES ({', '.join('?' * 15)})",
+                    map(_use_row, batch),
+                )
+                self.connection.executemany(
+                    "INSERT OR IGNORE INTO options VALUES (?, ?, ?, ?, ?, ?)",
+                    (row for info in batch for row in _option_rows(info)),
+                )
+            inserted += cursor.rowcount
+        return inserted
+
+    def query(self, sql: str, parameters: Iterable = ()) -> list[tuple]:
+        """SQL로 저장된 히스토리를 조회합니다."""
+        return self.connection.execute(sql, tuple(parameters)).fetchall()
+
+    def grade_up_rate(
+        self, by: str = "cube_type", kind: str | None = None
+    ) -> list[GradeUpRate]:
+        """열 값별 등급 상승 확률을 집계합니다.
+
+        Args:
+            by (str): 묶을 열 이름
+                Available values : kind, cube_type, item_level, miracle_time, item_equipment_part,
+                    potential_option_grade, character_name
+            kind (str, optional): 히스토리 종류 (cube, potential). 없으면 모두 집계합니다.
+
+        Returns:
+            list[GradeUpRate]: 열 값 오름차순으로 정렬된 집계 결과
+
+        Raises:
+            ValueError: 묶을 수 없는 열 이름인 경우 발생합니다.
+        """
+
+        if by not in GROUP_COLUMNS:
+            raise ValueError(f"by must be one of {', '.join(GROUP_COLUMNS)}")
+
+        where, parameters = ("WHERE kind = ?", (kind,)) if kind else ("", ())
+        rows = self.query(
+            f"SELECT {by}, COUNT(*), SUM(upgraded) FROM uses {where} "
+            f"GROUP BY {by} ORDER BY {by}",
+            parameters,
+        )
+        return [
+            GradeUpRate(
+                key=bool(key) if by == "miracle_time" else key,
+                count=count,
+                upgraded=upgraded,
+            )
+            for key, count, upgraded in rows
+        ]
+
+    def option_counts(
+        self, stage: str = "after", grade: str | None = None
+    ) -> dict[str, int]:
+        """잠재능력 옵션별 등장 횟수를 집계합니다.
+
+        Args:
+            stage (str): 사용 전(before) 또는 사용 후(after) 옵션
+            grade (str, optional): 옵션 등급. 없으면 모든 등급을 집계합니다.
+
+        Returns:
+            dict[str, int]: 등장 횟수 내림차순으로 정렬된 옵션별 등장 횟수
+        """
+
+        sql = "SELECT option, COUNT(*) AS n FROM options WHERE stage = ?"
+        parameters = [stage]
+        if grade is not None:
+            sql += " AND grade = ?"
+            parameters.append(grade)
+        sql += " GROUP BY option ORDER BY n DESC, option"
+        return dict(self.query(sql, parameters))
@@ -0,0 +1,275 @@
+"""큐브 사용 결과로 잠재능력 옵션의 등장 빈도를 색인하는 기능을 제공하는 모듈입니다.
+
+- `PotentialOptionIndex` 클래스는 (큐브 종류, 장비 분류, 레벨 구간, 등급, 옵션 줄) 별 옵션 등장 횟수를 보관합니다.
+
+Examples:
+    >>> index = PotentialOptionIndex.load("options.json")
+    >>> index.update(iter_cube_usage_history(date=kst.yesterday()))
+    >>> index.frequency("STR : +12%", "수상한 에디셔널 큐브", "모자", 160)
+    0.041
+    >>> index.save("options.json")
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable
+
+import maplestory.utils.kst as kst
+from maplestory.models.history import CubeHistoryInfo
+from maplestory.models.history.potential import (
+    MAX_OPTION_LINES,
+    PotentialHistoryInfo,
+)
+from maplestory.services.cube_analytics import GRADES
+from maplestory.utils.persist import ensure_disjoint, write_atomic
+
+CellKey = tuple[str, str, int, str, int]
+"""(큐브 종류, 장비 분류, 레벨 구간, 등급, 옵션 줄)"""
+
+
+IngestMarker = tuple[datetime, str]
+"""(생성 일시, 히스토리 식별자)"""
+
+
+class PotentialOptionIndex:
+    """잠재능력 옵션 등장 횟수 색인
+
+    큐브 사용 후 옵션을 (큐브 종류, 장비 분류, 레벨 구간, 등급, 옵션 줄) 칸으로 나누고,
+    칸마다 옵션별 등장 횟수를 보관합니다. 에디셔널 큐브는 에디셔널 잠재능력 옵션을, 그 외에는 잠재능력 옵션을 색인합니다.
+    조회는 칸을 바로 찾아 읽으므로 전체 히스토리를 다시 읽지 않습니다.
+
+    `sync_history`의 상태처럼 날짜(KST)별로 마지막으로 색인한 히스토리(`markers`)만 보관하고,
+    그보다 오래된 히스토리는 이미 색인한 것으로 보고 건너뜁니다. 따라서 한 번의 `update`에는
+    그날 가장 최근 히스토리까지의 모든 히스토리를 넘겨야 합니다. (예: `iter_cube_usage_history(date=...)`)
+    같은 날짜를 다시 색인하면 새로 생긴 히스토리만 더합니다.
+
+    Args:
+        level_bucket_size (int): 레벨 구간 크기. 기본값 10이면 160 ~ 169 레벨을 160 구간으로 묶습니다.
+    """
+
+    def __init__(self, level_bucket_size: int = 10):
+        if level_bucket_size < 1:
+            raise ValueError("level_bucket_size must be greater than 0")
+
+        self.level_bucket_size = level_bucket_size
+        self.cells: dict[CellKey, Counter[str]] = {}
+        self.markers: dict[str, IngestMarker] = {}
+
+    def level_bucket(self, item_level: float) -> int:
+        return int(item_level) // self.level_bucket_size * self.level_bucket_size
+
+    def add(self, info: CubeHistoryInfo | PotentialHistoryInfo) -> bool:
+        """히스토리 한 건의 사용 후 옵션을 색인에 추가합니다. 이미 색인된 히스토리이면 False를 반환합니다."""
+
+        return self._ingest((info,)) == 1
+
+    def update(
+        self, records: Iterable[CubeHistoryInfo | PotentialHistoryInfo]
+    ) -> PotentialOptionIndex:
+        """여러 히스토리를 색인에 추가합니다. 스트리밍 이터레이터를 그대로 넘길 수 있습니다.
+
+        날짜별로 이 호출 전에 마지막으로 색인한 히스토리보다 새로운 히스토리만 더하며,
+        모든 히스토리를 읽은 뒤에 한 번에 반영하므로 중간에 예외가 발생하면 색인이 바뀌지 않습니다.
+        """
+
+        self._ingest(records)
+        return self
+
+    def _ingest(self, records: Iterable[CubeHistoryInfo | PotentialHistoryInfo]) -> int:
+        counts: dict[CellKey, Counter[str]] = {}
+        markers: dict[str, IngestMarker] = {}
+        added = 0
+        for info in records:
+            day = kst.to_kst(info.date_create).date().isoformat()
+            marker = (info.date_create, info.id)
+            if (last := self.markers.get(day)) is not None and marker <= last:
+                continue
+            if day not in markers or marker > markers[day]:
+                markers[day] = marker
+
+            cube_type = getattr(info, "cube_type", None) or info.potential_type
+            if "에디셔널" in cube_type:
+                grade, options = (
+                    info.additional_potential_option_grade,
+                    info.after_additional_potential_option,
+                )
+            else:
+                grade, options = (
+                    info.potential_option_grade,
+                    info.after_potential_option,
+                )
+
+            bucket = self.level_bucket(info.item_level)
+            for position, option in enumerate(options[:MAX_OPTION_LINES], start=1):
+                key = (cube_type, info.item_equipment_part, bucket, grade, position)
+                if (cell := counts.get(key)) is None:
+                    cell = counts[key] = Counter()
+                cell[option.option] += 1
+            added += 1
+
+        for key, cell in counts.items():
+            self.cells.setdefault(key, Counter()).update(cell)
+        self.markers.update(markers)
+        return added
+
+    def merge(self, other: PotentialOptionIndex) -> PotentialOptionIndex:
+        """다른 색인의 등장 횟수를 더합니다. (예: 날짜별로 나누어 색인한 색인)
+
+        Raises:
+            ValueError: 레벨 구간 크기가 다르거나, 같은 날짜를 양쪽 모두 색인한 경우 발생합니다.
+        """
+
+        if other.level_bucket_size != self.level_bucket_size:
+            raise ValueError("Cannot merge indexes with different level_bucket_size")
+        ensure_disjoint(sorted(self.markers.keys() & other.markers.keys()), "date")
+
+        self.markers.update(other.markers)
+        for key, counts in other.cells.items():
+            self.cells.setdefault(key, Counter()).update(counts)
+        return self
+
+    def _matching_cells(
+        self,
+        cube_type: str,
+        part: str,
+        item_level: float,
+        grade: str | None,
+        position: int | None,
+    ) -> Iterable[Counter[str]]:
+        bucket = self.level_bucket(item_level)
+        grades = GRADES if grade is None else (grade,)
+        positions = range(1, MAX_OPTION_LINES + 1) if position is None else (position,)
+        for g in grades:
+            for p in positions:
+                if (
+                    cell := self.cells.get((cube_type, part, bucket, g, p))
+                ) is not None:
+                    yield cell
+
+    def count(
+        self,
+        option: str,
+        cube_type: str,
+        part: str,
+        item_level: float,
+        grade: str | None = None,
+        position: int | None = None,
+    ) -> int:
+        """옵션의 등장 횟수를 반환합니다.
+
+        Args:
+            option (str): 옵션 (예: "STR : +12%")
+            cube_type (str): 큐브 종류
+            part (str): 장비 분류
+            item_level (float): 장비 레벨. 레벨 구간으로 바꾸어 조회합니다.
+            grade (str, optional): 잠재능력 등급. 없으면 모든 등급을 더합니다.
+            position (int, optional): 옵션 줄 (1 ~ 3). 없으면 모든 줄을 더합니다.
+
+        Returns:
+            int: 등장 횟수
+        """
+
+        return sum(
+            cell[option]
+            for cell in self._matching_cells(
+                cube_type, part, item_level, grade, position
+            )
+        )
+
+    def total(
+        self,
+        cube_type: str,
+        part: str,
+        item_level: float,
+        grade: str | None = None,
+        position: int | None = None,
+    ) -> int:
+        """조건에 맞는 옵션 줄의 수를 반환합니다."""
+
+        return sum(
+            cell.total()
+            for cell in self._matching_cells(
+                cube_type, part, item_level, grade, position
+            )
+        )
+
+    def frequency(
+        self,
+        option: str,
+        cube_type: str,
+        part: str,
+        item_level: float,
+        grade: str | None = None,
+        position: int | None = None,
+    ) -> float:
+        """조건에 맞는 옵션 줄 중 옵션이 등장한 비율을 반환합니다. 색인된 줄이 없으면 0을 반환합니다."""
+
+        total = self.total(cube_type, part, item_level, grade, position)
+        if not total:
+            return 0.0
+        return self.count(option, cube_type, part, item_level, grade, position) / total
+
+    def most_common(
+        self,
+        cube_type: str,
+        part: str,
+        item_level: float,
+        grade: str | None = None,
+        position: int | None = None,
+        n: int | None = None,
+    ) -> list[tuple[str, int]]:
+        """조건에 맞는 옵션을 등장 횟수가 많은 순서대로 반환합니다."""
+
+        counts = Counter()
+        for cell in self._matching_cells(cube_type, part, item_level, grade, position):
+            counts.update(cell)
+        return counts.most_common(n)
+
+    def save(self, path: str | Path) -> None:
+        """색인을 JSON 파일로 저장합니다. 저장 중 중단되어도 이전 파일이 깨지지 않도록 교체 방식으로 씁니다."""
+
+        data = {
+            "level_bucket_size": self.level_bucket_size,
+            "cells": [[*key, dict(counts)] for key, counts in self.cells.items()],
+            "markers": {
+                day: [date_create.isoformat(), id]
+                for day, (date_create, id) in self.markers.items()
+            },
+        }
+        write_atomic(path, json.dumps(data, ensure_ascii=False))
+
+    @classmethod
+    def load(
+        cls, path: str | Path, level_bucket_size: int | None = None
+    ) -> PotentialOptionIndex:
+        """JSON 파일에서 색인을 읽습니다. 파일이 없으면 빈 색인을 반환합니다.
+
+        Args:
+            path (str | Path): 파일 경로
+            level_bucket_size (int, optional): 레벨 구간 크기. 없으면 파일에 저장된 값을, 파일도 없으면 10을 사용합니다.
+
+        Raises:
+            ValueError: level_bucket_size가 파일에 저장된 값과 다른 경우 발생합니다.
+        """
+
+        path = Path(path)
+        if not path.exists():
+            return cls(10 if level_bucket_size is None else level_bucket_size)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if level_bucket_size not in (None, data["level_bucket_size"]):
+            raise ValueError(
+                f"{path} has level_bucket_size {data['level_bucket_size']}, "
+                f"not {level_bucket_size}"
+            )
+
+        index = cls(data["level_bucket_size"])
+        for *key, counts in data["cells"]:
+            index.cells[tuple(key)] = Counter(counts)
+        for day, (date_create, id) in data["markers"].items():
+            index.markers[day] = (datetime.fromisoformat(date_create), id)
+        return index
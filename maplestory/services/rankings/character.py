@@ -0,0 +1,146 @@
+"""여러 캐릭터의 랭킹 정보를 한 번에 조회하는 API를 제공하는 모듈입니다.
+
+Note:
+    - 2023년 12월 22일 데이터부터 조회할 수 있습니다.
+    - 오전 8시 30분부터 오늘의 랭킹 정보를 조회할 수 있습니다.
+    - 게임 콘텐츠 변경으로 ocid가 변경될 수 있습니다. ocid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
+"""
+
+from typing import Iterable
+
+from pydantic import BaseModel
+
+import maplestory.utils.kst as kst
+from maplestory.apis.ranking import (
+    get_achievement_ranking_by_id,
+    get_dojang_ranking_by_id,
+    get_overall_ranking_by_id,
+    get_theseed_ranking_by_id,
+    get_union_ranking_by_id,
+)
+from maplestory.enums import CharacterRankTypeEnum, DojangDifficultyEnum
+from maplestory.models.ranking import (
+    AchievementRankingInfo,
+    DojangRankingInfo,
+    OverallRankingInfo,
+    TheSeedRankingInfo,
+    UnionRankingInfo,
+)
+from maplestory.services.character import get_character_id
+from maplestory.utils.parallel import DEFAULT_MAX_WORKERS, map_concurrently
+
+
+class CharacterRank(BaseModel):
+    """캐릭터 한 명의 랭킹 정보
+
+    Attributes:
+        character_name: 캐릭터 명
+        ocid: 캐릭터 식별자. 조회에 실패한 경우 None
+        overall: 종합 랭킹 정보
+        union: 유니온 랭킹 정보
+        dojang: 무릉도장 랭킹 정보
+        theseed: 더 시드 랭킹 정보
+        achievement: 업적 랭킹 정보
+        errors: 조회에 실패한 항목과 에러 메시지 ("ocid" 또는 랭킹 타입 값)
+    """
+
+    character_name: str
+    ocid: str | None = None
+    overall: OverallRankingInfo | None = None
+    union: UnionRankingInfo | None = None
+    dojang: DojangRankingInfo | None = None
+    theseed: TheSeedRankingInfo | None = None
+    achievement: AchievementRankingInfo | None = None
+    errors: dict[str, str] = {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _get_rank_by_id(
+    rank_type: CharacterRankTypeEnum,
+    character_id: str,
+    difficulty_level: int | DojangDifficultyEnum,
+    date: kst.KSTAwareDatetime,
+):
+    match rank_type:
+        case CharacterRankTypeEnum.OVERALL:
+            ranking = get_overall_ranking_by_id(character_id=character_id, date=date)
+        case CharacterRankTypeEnum.UNION:
+            ranking = get_union_ranking_by_id(character_id=character_id, date=date)
+        case CharacterRankTypeEnum.DOJANG:
+            ranking = get_dojang_ranking_by_id(
+                character_id=character_id,
+                difficulty_level=difficulty_level,
+                date=date,
+            )
+        case CharacterRankTypeEnum.THESEED:
+            ranking = get_theseed_ranking_by_id(character_id=character_id, date=date)
+        case CharacterRankTypeEnum.ACHIEVEMENT:
+            ranking = get_achievement_ranking_by_id(
+                character_id=character_id, date=date
+            )
+
+    return ranking[0] if len(ranking) == 1 else None
+
+
+def get_character_ranks(
+    character_names: Iterable[str],
+    rank_types: Iterable[str | CharacterRankTypeEnum] = tuple(CharacterRankTypeEnum),
+    difficulty_level: int | DojangDifficultyEnum = DojangDifficultyEnum.통달,
+    date: kst.KSTAwareDatetime = kst.yesterday(),
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> list[CharacterRank]:
+    """여러 캐릭터의 랭킹 정보를 동시에 조회합니다.
+
+    캐릭터 식별자(ocid) 조회와 랭킹 조회를 각각 최대 `max_workers`개씩 동시에 요청합니다.
+    일부 캐릭터나 랭킹 조회에 실패하더라도 나머지 결과는 반환하며, 실패 내용은 각 행의 `errors`에 기록됩니다.
+
+    Args:
+        character_names (Iterable[str]): 캐릭터 명 목록. 중복된 이름은 한 번만 조회합니다.
+        rank_types (Iterable[str | CharacterRankTypeEnum], optional): 조회할 랭킹 타입 목록.
+            Available values : overall, union, dojang, theseed, achievement (기본값은 전체)
+        difficulty_level (int | DojangDifficultyEnum): 무릉도장 구간 (0:일반, 1:통달)
+        date (datetime): 조회 기준일(KST)
+        max_workers (int): 최대 동시 요청 수
+
+    Returns:
+        list[CharacterRank]: 입력 순서대로 정렬된 캐릭터별 랭킹 정보
+
+    Note:
+        - 2023년 12월 22일 데이터부터 조회할 수 있습니다.
+        - 오전 8시 30분부터 오늘의 랭킹 정보를 조회할 수 있습니다.
+        - 게임 콘텐츠 변경으로 ocid가 변경될 수 있습니다. ocid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
+    """
+
+    names = list(dict.fromkeys(character_names))
+    types = list(dict.fromkeys(CharacterRankTypeEnum(t) for t in rank_types))
+
+    rows = [CharacterRank(character_name=name) for name in names]
+    ocids = map_concurrently(
+        get_character_id, names, max_workers, return_exceptions=True
+    )
+
+    tasks = []
+    for row, ocid in zip(rows, ocids):
+        if isinstance(ocid, Exception):
+            row.errors["ocid"] = str(ocid)
+            continue
+        row.ocid = ocid
+        tasks.extend((row, rank_type) for rank_type in types)
+
+    results = map_concurrently(
+        lambda task: _get_rank_by_id(task[1], task[0].ocid, difficulty_level, date),
+        tasks,
+        max_workers,
+        return_exceptions=True,
+    )
+
+    for (row, rank_type), result in zip(tasks, results):
+        if isinstance(result, Exception):
+            row.errors[rank_type.value] = str(result)
+        else:
+            setattr(row, rank_type.value, result)
+
+    return rows
@@ -6,13 +6,22 @@ Note:
     - 게임 콘텐츠 변경으로 ocid가 변경될 수 있습니다. ocid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
 """
 
+import warnings
 from collections import defaultdict
+from typing import Callable, Iterable, TypeVar
 
 import maplestory.utils.kst as kst
-from maplestory.apis.ranking import get_guild_ranking_by_id
+from maplestory.apis.ranking import RANKING_PAGE_SIZE, get_guild_ranking_by_id
 from maplestory.enums import GuildRankTypeEnum
-from maplestory.models.ranking.guild import AllGuildRankingInfo, GuildTypeRanking
+from maplestory.models.ranking.guild import (
+    AllGuildRankingInfo,
+    GuildTypeRanking,
+    GuildTypeRankingInfo,
+)
 from maplestory.models.types import WorldName
+from maplestory.utils.parallel import map_concurrently
+
+T = TypeVar("T")
 
 
 def get_world_guild_ranking(
@@ -84,12 +93,98 @@ def get_guild_ranking(
     )
 
 
+def _group_by_guild_world(
+    rankings: Iterable[T], key: Callable[[T], tuple[str, str]]
+) -> dict[tuple[str, str], list[T]]:
+    # 같은 이름의 길드가 여러 월드에 있을 수 있으므로 (길드 명, 월드 명)으로 묶습니다.
+    groups = defaultdict(list)
+    for ranking in rankings:
+        groups[key(ranking)].append(ranking)
+    return dict(groups)
+
+
 def group_by_guild(all_rankings: list[dict]) -> dict:
-    datas_by_key = defaultdict(list)
-    for ranking in all_rankings:
-        key = f"{ranking['guild_name']} ({ranking['world_name']})"
-        datas_by_key[key].append(ranking)
-    return dict(datas_by_key)
+    """길드 랭킹 정보를 "길드 명 (월드 명)"별로 묶습니다.
+
+    Deprecated:
+        `get_all_type_guild_rankings`가 랭킹 타입별 정보를 `AllGuildRankingInfo.from_rankings`로 바로 합치므로
+        더 이상 사용하지 않습니다.
+    """
+
+    warnings.warn(
+        "group_by_guild is deprecated. Use get_all_type_guild_rankings instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    groups = _group_by_guild_world(
+        all_rankings, lambda ranking: (ranking["guild_name"], ranking["world_name"])
+    )
+    return {
+        f"{guild_name} ({world_name})": rankings
+        for (guild_name, world_name), rankings in groups.items()
+    }
+
+
+def _get_all_pages(
+    ranking_type: GuildRankTypeEnum,
+    guild: str,
+    world_name: WorldName | None,
+    date: kst.KSTAwareDatetime,
+) -> list[GuildTypeRankingInfo]:
+    rankings = []
+    page_number = 1
+    while True:
+        page = get_guild_ranking_by_id(
+            ranking_type=ranking_type,
+            world_name=world_name,
+            guild=guild,
+            page_number=page_number,
+            date=date,
+        )
+        rankings.extend(page.ranking)
+        if len(page) < RANKING_PAGE_SIZE:
+            return rankings
+        page_number += 1
+
+
+def get_all_type_guild_rankings(
+    guild: str,
+    world_name: WorldName | None = None,
+    date: kst.KSTAwareDatetime = kst.yesterday(),
+) -> list[AllGuildRankingInfo]:
+    """모든 랭킹 타입의 길드 랭킹 정보를 동시에 조회하여 월드별로 합칩니다.
+
+    주간 명성치, 플래그 레이스, 지하 수로 랭킹을 동시에 요청하고, 각 랭킹 타입의 모든 페이지를 조회합니다.
+    같은 이름의 길드가 여러 월드에 있는 경우, 월드별로 하나의 랭킹 정보를 반환합니다.
+
+    Args:
+        guild (str): 길드 명
+        world_name (str, optional): 월드 명
+            Available values : 스카니아, 베라, 루나, 제니스, 크로아, 유니온, 엘리시움,
+                이노시스, 레드, 오로라, 아케인, 노바, 리부트, 리부트2, 버닝, 버닝2, 버닝3
+        date : 조회 기준일(KST)
+
+    Returns:
+        list[AllGuildRankingInfo]: 월드별 길드 랭킹 정보. 랭킹에 없는 길드인 경우 빈 목록
+
+    Note:
+        - 2023년 12월 22일 데이터부터 조회할 수 있습니다.
+        - 오전 8시 30분부터 오늘의 랭킹 정보를 조회할 수 있습니다.
+        - 게임 콘텐츠 변경으로 ocid가 변경될 수 있습니다. ocid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
+    """
+
+    results = map_concurrently(
+        lambda ranking_type: _get_all_pages(ranking_type, guild, world_name, date),
+        list(GuildRankTypeEnum),
+    )
+
+    infos_by_guild = _group_by_guild_world(
+        (info for rankings in results for info in rankings),
+        lambda info: (info.guild_name, info.world_name),
+    )
+    return [
+        AllGuildRankingInfo.from_rankings(infos) for infos in infos_by_guild.values()
+    ]
 
 
 def get_all_type_guild_ranking(
@@ -97,18 +192,20 @@ def get_all_type_guild_ranking(
     world_name: WorldName | None = None,
     date: kst.KSTAwareDatetime = kst.yesterday(),
 ) -> AllGuildRankingInfo:
-    """길드 랭킹 정보를 조회합니다.
+    """모든 랭킹 타입의 길드 랭킹 정보를 조회합니다.
 
     Args:
         guild (str): 길드 명
-        ranking_type (int | GuildRankType): 랭킹 타입 (0:주간 명성치, 1:플래그 레이스, 2:지하 수로)
         world_name (str, optional): 월드 명
             Available values : 스카니아, 베라, 루나, 제니스, 크로아, 유니온, 엘리시움,
                 이노시스, 레드, 오로라, 아케인, 노바, 리부트, 리부트2, 버닝, 버닝2, 버닝3
         date : 조회 기준일(KST)
 
     Returns:
-        AllGuildRankingInfo: 길드 랭킹 정보
+        AllGuildRankingInfo: 길드 랭킹 정보. 같은 이름의 길드가 여러 월드에 있는 경우 첫 번째 길드
+
+    Raises:
+        ValidationError: 랭킹에 없는 길드인 경우 발생합니다.
 
     Note:
         - 2023년 12월 22일 데이터부터 조회할 수 있습니다.
@@ -116,74 +213,8 @@ def get_all_type_guild_ranking(
         - 게임 콘텐츠 변경으로 ocid가 변경될 수 있습니다. ocid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
     """
 
-    all_rankings = []
-    for ranking_type in [
-        GuildRankTypeEnum.주간명성치,
-        GuildRankTypeEnum.플래그레이스,
-        GuildRankTypeEnum.지하수로,
-    ]:
-        result = get_guild_ranking_by_id(
-            ranking_type=ranking_type, world_name=world_name, guild=guild, date=date
-        )
-        all_rankings.extend(result.model_dump()["ranking"])
-
-    group_by_guild(all_rankings)
-    # {
-    #     '온앤온 (스카니아)': [
-    #         {
-    #             'date': '2024-02-25',
-    #             'ranking': 25279,
-    #             'guild_name': '온앤온',
-    #             'world_name': '스카니아',
-    #             'guild_level': 11,
-    #             'guild_master_name': '온앤온',
-    #             'guild_mark': '',
-    #             'guild_point': 11600,
-    #             'type': <GuildRankTypeEnum.WEEKLY_FAME: 0>
-    #         },
-    #         {
-    #             'date': '2024-02-25',
-    #             'ranking': 3721,
-    #             'guild_name': '온앤온',
-    #             'world_name': '스카니아',
-    #             'guild_level': 11,
-    #             'guild_master_name': '온앤온',
-    #             'guild_mark': '',
-    #             'guild_point': 15596,
-    #             'type': <GuildRankTypeEnum.SEWER: 2>
-    #         }
-    #     ]
-    # }
-
-    all_data = {"ranking": all_rankings}
-    # all_data = {
-    #     'ranking': [
-    #         {
-    #             'date': '2024-02-25',
-    #             'ranking': 25279,
-    #             'guild_name': '온앤온',
-    #             'world_name': '스카니아',
-    #             'guild_level': 11,
-    #             'guild_master_name': '온앤온',
-    #             'guild_mark': '',
-    #             'guild_point': 11600,
-    #             'type': <GuildRankTypeEnum.주간명성치: 0>
-    #         },
-    #         {
-    #             'date': '2024-02-25',
-    #             'ranking': 3721,
-    #             'guild_name': '온앤온',
-    #             'world_name': '스카니아',
-    #             'guild_level': 11,
-    #             'guild_master_name': '온앤온',
-    #             'guild_mark': '',
-    #             'guild_point': 15596,
-    #             'type': <GuildRankTypeEnum.지하수로: 2>
-    #         }
-    #     ]
-    # }
-
-    return AllGuildRankingInfo.from_dict(all_data)
+    rankings = get_all_type_guild_rankings(guild, world_name, date)
+    return rankings[0] if rankings else AllGuildRankingInfo.from_rankings([])
 
 
 def get_weekly_fame_guild_ranking(
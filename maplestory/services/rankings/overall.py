@@ -6,13 +6,19 @@ Note:
     - 게임 콘텐츠 변경으로 ocid가 변경될 수 있습니다. ocid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
 """
 
+from datetime import date as _date
+from datetime import timedelta
+from functools import lru_cache
+
+import maplestory.utils.date as date_util
 import maplestory.utils.kst as kst
 from maplestory.apis.ranking import get_overall_ranking_by_id
-from maplestory.enums import WorldTypeEnum
+from maplestory.enums import QueryableDateEnum, WorldTypeEnum
 from maplestory.models.ranking import OverallRanking
-from maplestory.models.ranking.overall import OverallRankingInfo
+from maplestory.models.ranking.overall import OverallRankHistory, OverallRankingInfo
 from maplestory.models.types import JobClass, WorldName
 from maplestory.services.character import get_character_id
+from maplestory.utils.parallel import DEFAULT_MAX_WORKERS, map_concurrently
 
 
 def get_overall_ranking(
@@ -239,3 +245,80 @@ def get_character_overall_rank(
 
     rank = get_overall_ranking(character_name=character_name, date=date)
     return rank[0] if len(rank) == 1 else None
+
+
+def _fetch_overall_rank_by_id(
+    character_id: str, date: kst.KSTAwareDatetime
+) -> OverallRankingInfo | None:
+    ranking = get_overall_ranking_by_id(character_id=character_id, date=date)
+    return ranking[0] if len(ranking) == 1 else None
+
+
+# 지난 날짜의 랭킹 정보는 바뀌지 않으므로, 최근 조회한 (ocid, 날짜)의 결과를 다시 사용합니다.
+@lru_cache(maxsize=4096)
+def _get_past_overall_rank_by_id(
+    character_id: str, date: _date
+) -> OverallRankingInfo | None:
+    return _fetch_overall_rank_by_id(
+        character_id, kst.datetime(date.year, date.month, date.day)
+    )
+
+
+def _get_overall_rank_by_id(
+    character_id: str, date: kst.KSTAwareDatetime
+) -> OverallRankingInfo | None:
+    if date < kst.today():
+        return _get_past_overall_rank_by_id(character_id, date.date())
+    return _fetch_overall_rank_by_id(character_id, date)
+
+
+def get_character_overall_rank_history(
+    character_name: str,
+    start_date: kst.KSTAwareDatetime,
+    end_date: kst.KSTAwareDatetime = kst.yesterday(),
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> OverallRankHistory:
+    """기간 동안 캐릭터의 날짜별 종합 랭킹 정보를 조회합니다.
+
+    캐릭터 식별자(ocid)는 한 번만 조회하고, 날짜별 랭킹은 최대 `max_workers`개씩 동시에 요청합니다.
+    지난 날짜의 랭킹 정보는 바뀌지 않으므로 한 번 조회한 결과를 다시 사용합니다.
+
+    Args:
+        character_name (str): 캐릭터명
+        start_date : 조회 시작일(KST)
+        end_date : 조회 종료일(KST). 기본값은 어제입니다.
+        max_workers (int): 최대 동시 요청 수
+
+    Returns:
+        OverallRankHistory: 날짜 오름차순으로 정렬된 종합 랭킹 기록
+
+    Raises:
+        ValueError: 조회 시작일이 조회 종료일보다 늦거나, 조회할 수 없는 날짜인 경우 발생합니다.
+
+    Note:
+        - 2023년 12월 22일 데이터부터 조회할 수 있습니다.
+        - 오전 8시 30분부터 오늘의 랭킹 정보를 조회할 수 있습니다.
+        - 게임 콘텐츠 변경으로 ocid가 변경될 수 있습니다. ocid 기반 서비스 갱신 시 유의해 주시길 바랍니다.
+
+    Examples:
+        >>> history = get_character_overall_rank_history("온앤온", kst.datetime(2024, 1, 1))
+        >>> history.dates[0], history.ranks[0]
+        (datetime.date(2024, 1, 1), ...)
+    """
+
+    date_util.is_valid(start_date, QueryableDateEnum.랭킹)
+    if start_date.date() > end_date.date():
+        raise ValueError("start_date must be earlier than or equal to end_date.")
+
+    start = kst.datetime(start_date.year, start_date.month, start_date.day)
+    days = (end_date.date() - start.date()).days + 1
+    dates = [start + timedelta(days=day) for day in range(days)]
+
+    character_id = get_character_id(character_name)
+    infos = map_concurrently(
+        lambda date: _get_overall_rank_by_id(character_id, date), dates, max_workers
+    )
+
+    return OverallRankHistory.from_infos(
+        character_name, [date.date() for date in dates], infos
+    )
@@ -0,0 +1,410 @@
+"""유니온 랭킹으로 월드별 유니온 레벨, 유니온 파워 분포를 색인하는 기능을 제공하는 모듈입니다.
+
+- `UnionRankingIndex` 클래스는 (월드 명, 날짜)별 유니온 레벨, 유니온 파워 히스토그램을 보관하고,
+  백분위와 분위수를 이진 탐색으로 조회합니다.
+- `RankCoverage` 클래스는 색인한 순위를 연속 구간으로 보관하여, 같은 페이지를 다시 추가해도 중복으로 세지 않도록 합니다.
+
+Examples:
+    >>> index = UnionRankingIndex.load("union_levels.json")
+    >>> for page_number in range(1, 11):
+    ...     index.update(get_world_union_ranking("스카니아", page_number))
+    >>> index.percentile("스카니아", kst.yesterday(), union_level=8871)
+    99.2
+    >>> index.quantile("스카니아", kst.yesterday(), 0.5)
+    8120
+    >>> index.save("union_levels.json")
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right
+from datetime import date as _date
+from datetime import datetime
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable, Literal
+
+from maplestory.models.ranking.union import UnionRanking, UnionRankingInfo
+from maplestory.utils.persist import ensure_disjoint, write_atomic
+
+HistogramField = Literal["union_level", "union_power"]
+
+CellKey = tuple[str, str]
+"""(월드 명, 날짜 YYYY-MM-DD)"""
+
+
+def _date_key(date: datetime | _date | str) -> str:
+    if isinstance(date, datetime):
+        date = date.date()
+    return date if isinstance(date, str) else date.isoformat()
+
+
+class Histogram:
+    """구간별 개수를 세는 히스토그램
+
+    값은 `bucket_size` 단위 구간의 하한으로 묶어 셉니다. 누적 개수는 조회할 때 한 번만 계산하고
+    값이 추가될 때까지 재사용하므로, 백분위와 분위수 조회는 구간 수에 대해 O(log n)입니다.
+
+    Args:
+        bucket_size (int): 구간 크기. 1이면 값을 그대로 셉니다.
+    """
+
+    def __init__(self, bucket_size: int = 1):
+        if bucket_size < 1:
+            raise ValueError("bucket_size must be greater than 0")
+
+        self.bucket_size = bucket_size
+        self.counts: dict[int, int] = {}
+        self._keys: list[int] | None = None
+        self._cumulative: list[int] = []
+
+    def __len__(self) -> int:
+        """센 값의 개수"""
+        return self._sorted()[1][-1] if self.counts else 0
+
+    def bucket(self, value: int) -> int:
+        return value // self.bucket_size * self.bucket_size
+
+    def add(self, value: int, count: int = 1) -> None:
+        bucket = self.bucket(value)
+        self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self._keys = None
+
+    def _sorted(self) -> tuple[list[int], list[int]]:
+        if self._keys is None:
+            self._keys = sorted(self.counts)
+            self._cumulative = list(accumulate(self.counts[k] for k in self._keys))
+        return self._keys, self._cumulative
+
+    def count_below(self, value: int) -> int:
+        """구간이 value의 구간보다 낮은 값의 개수"""
+
+        keys, cumulative = self._sorted()
+        i = bisect_left(keys, self.bucket(value))
+        return cumulative[i - 1] if i else 0
+
+    def count_at_most(self, value: int) -> int:
+        """구간이 value의 구간 이하인 값의 개수"""
+
+        keys, cumulative = self._sorted()
+        i = bisect_right(keys, self.bucket(value))
+        return cumulative[i - 1] if i else 0
+
+    def quantile(self, q: float) -> int:
+        """누적 비율이 q 이상이 되는 가장 낮은 구간의 하한을 반환합니다.
+
+        Raises:
+            ValueError: q가 0 ~ 1이 아니거나 히스토그램이 비어 있는 경우 발생합니다.
+        """
+
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if not self.counts:
+            raise ValueError("Histogram is empty.")
+
+        keys, cumulative = self._sorted()
+        i = bisect_left(cumulative, max(q * cumulative[-1], 1))
+        return keys[min(i, len(keys) - 1)]
+
+
+class RankCoverage:
+    """색인한 랭킹 순위를 연속 구간으로 보관합니다.
+
+    랭킹 페이지는 연속된 순위이므로, 페이지를 몇 개 추가해도 구간은 몇 개뿐입니다.
+    구간은 시작 순위 오름차순이며, 서로 겹치거나 맞닿지 않습니다.
+
+    Attributes:
+        starts: 구간별 시작 순위
+        ends: 구간별 마지막 순위 (포함)
+    """
+
+    def __init__(self, ranges: Iterable[tuple[int, int]] = ()):
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        for start, end in sorted(ranges):
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def __len__(self) -> int:
+        """색인한 순위의 수"""
+        return sum(end - start + 1 for start, end in self.ranges)
+
+    def __contains__(self, rank: int) -> bool:
+        i = bisect_right(self.starts, rank)
+        return i > 0 and rank <= self.ends[i - 1]
+
+    @property
+    def ranges(self) -> list[tuple[int, int]]:
+        return list(zip(self.starts, self.ends))
+
+    def add(self, rank: int) -> bool:
+        """순위를 추가합니다. 이미 색인한 순위이면 False를 반환합니다."""
+
+        i = bisect_right(self.starts, rank)
+        if i > 0 and rank <= self.ends[i - 1]:
+            return False
+
+        join_left = i > 0 and self.ends[i - 1] == rank - 1
+        join_right = i < len(self.starts) and self.starts[i] == rank + 1
+        if join_left and join_right:
+            self.ends[i - 1] = self.ends.pop(i)
+            del self.starts[i]
+        elif join_left:
+            self.ends[i - 1] = rank
+        elif join_right:
+            self.starts[i] = rank
+        else:
+            self.starts.insert(i, rank)
+            self.ends.insert(i, rank)
+        return True
+
+    def overlaps(self, other: RankCoverage) -> list[tuple[int, int]]:
+        """두 구간 목록에 함께 포함된 순위 구간을 반환합니다."""
+
+        result = []
+        i = j = 0
+        while i < len(self.starts) and j < len(other.starts):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start <= end:
+                result.append((start, end))
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return result
+
+    def union(self, other: RankCoverage) -> RankCoverage:
+        return RankCoverage([*self.ranges, *other.ranges])
+
+
+class UnionRankingCell:
+    """한 (월드, 날짜)의 유니온 레벨, 유니온 파워 분포
+
+    같은 순위는 한 번만 셉니다. 중단된 크롤링을 이어서 같은 페이지를 다시 추가해도 분포가 바뀌지 않습니다.
+    """
+
+    def __init__(self, power_bucket_size: int):
+        self.ranks = RankCoverage()
+        self.union_level = Histogram()
+        self.union_power = Histogram(power_bucket_size)
+
+    def __len__(self) -> int:
+        return len(self.ranks)
+
+    def add(self, info: UnionRankingInfo) -> bool:
+        """랭킹 정보를 추가합니다. 이미 센 순위이면 False를 반환합니다."""
+
+        if not self.ranks.add(info.ranking):
+            return False
+        self.union_level.add(info.union_level)
+        self.union_power.add(info.union_power)
+        return True
+
+
+class UnionRankingIndex:
+    """(월드 명, 날짜)별 유니온 레벨, 유니온 파워 분포 색인
+
+    크롤링한 유니온 랭킹 페이지를 순서와 관계없이 여러 번에 나누어 추가할 수 있고, JSON 파일로 저장해 두면
+    전체 랭킹을 다시 조회하지 않고 분포와 백분위를 조회할 수 있습니다.
+    유니온 레벨은 값 그대로, 유니온 파워는 `power_bucket_size` 단위 구간으로 셉니다.
+
+    Args:
+        power_bucket_size (int): 유니온 파워 구간 크기. 기본값은 100,000입니다.
+    """
+
+    def __init__(self, power_bucket_size: int = 100_000):
+        if power_bucket_size < 1:
+            raise ValueError("power_bucket_size must be greater than 0")
+
+        self.power_bucket_size = power_bucket_size
+        self.cells: dict[CellKey, UnionRankingCell] = {}
+
+    def add(self, info: UnionRankingInfo) -> bool:
+        """랭킹 정보 한 건을 색인에 추가합니다. 이미 색인된 순위이면 False를 반환합니다."""
+
+        key = (info.world_name, _date_key(info.date))
+        if (cell := self.cells.get(key)) is None:
+            cell = self.cells[key] = UnionRankingCell(self.power_bucket_size)
+        return cell.add(info)
+
+    def update(
+        self, records: UnionRanking | Iterable[UnionRankingInfo]
+    ) -> UnionRankingIndex:
+        """유니온 랭킹 페이지 또는 랭킹 정보들을 색인에 추가합니다."""
+
+        if isinstance(records, UnionRanking):
+            records = records.ranking
+        for info in records:
+            self.add(info)
+        return self
+
+    def merge(self, other: UnionRankingIndex) -> UnionRankingIndex:
+        """다른 색인의 분포를 더합니다. (예: 월드별로 나누어 크롤링한 색인)
+
+        Raises:
+            ValueError: 유니온 파워 구간 크기가 다르거나, 같은 (월드, 날짜)에 양쪽 모두 색인된 순위가 있는 경우 발생합니다.
+        """
+
+        if other.power_bucket_size != self.power_bucket_size:
+            raise ValueError("Cannot merge indexes with different power_bucket_size")
+        ensure_disjoint(
+            (
+                f"{world_name} {date} {start}~{end}"
+                for (world_name, date), other_cell in other.cells.items()
+                if (cell := self.cells.get((world_name, date))) is not None
+                for start, end in cell.ranks.overlaps(other_cell.ranks)
+            ),
+            "rankings",
+        )
+
+        for key, other_cell in other.cells.items():
+            if (cell := self.cells.get(key)) is None:
+                cell = self.cells[key] = UnionRankingCell(self.power_bucket_size)
+            cell.ranks = cell.ranks.union(other_cell.ranks)
+            for source, target in [
+                (other_cell.union_level, cell.union_level),
+                (other_cell.union_power, cell.union_power),
+            ]:
+                for bucket, count in source.counts.items():
+                    target.add(bucket, count)
+        return self
+
+    def cell(self, world_name: str, date: datetime | _date | str) -> UnionRankingCell:
+        """
+        Raises:
+            KeyError: 색인되지 않은 (월드, 날짜)인 경우 발생합니다.
+        """
+        return self.cells[(world_name, _date_key(date))]
+
+    def count(self, world_name: str, date: datetime | _date | str) -> int:
+        """색인된 캐릭터 수를 반환합니다. 색인되지 않았으면 0을 반환합니다."""
+
+        cell = self.cells.get((world_name, _date_key(date)))
+        return len(cell) if cell else 0
+
+    def distribution(
+        self,
+        world_name: str,
+        date: datetime | _date | str,
+        field: HistogramField = "union_level",
+    ) -> dict[int, int]:
+        """구간 하한 오름차순으로 구간별 캐릭터 수를 반환합니다."""
+
+        histogram: Histogram = getattr(self.cell(world_name, date), field)
+        return {bucket: histogram.counts[bucket] for bucket in sorted(histogram.counts)}
+
+    def percentile(
+        self,
+        world_name: str,
+        date: datetime | _date | str,
+        union_level: int | None = None,
+        union_power: int | None = None,
+    ) -> float:
+        """유니온 레벨 또는 유니온 파워가 주어진 값보다 낮은 캐릭터의 비율(%)을 반환합니다.
+
+        같은 값(구간)의 캐릭터는 절반을 낮은 쪽으로 셉니다. 예를 들어 모든 캐릭터가 같은 레벨이면 50입니다.
+
+        Args:
+            world_name (str): 월드 명
+            date (datetime | date | str): 랭킹 날짜
+            union_level (int, optional): 유니온 레벨
+            union_power (int, optional): 유니온 파워. 구간 단위로 계산합니다.
+
+        Returns:
+            float: 백분위 (0 ~ 100)
+
+        Raises:
+            ValueError: union_level, union_power 중 하나만 주어지지 않은 경우 발생합니다.
+            KeyError: 색인되지 않은 (월드, 날짜)인 경우 발생합니다.
+        """
+
+        if (union_level is None) == (union_power is None):
+            raise ValueError("Specify exactly one of union_level or union_power.")
+
+        cell = self.cell(world_name, date)
+        histogram, value = (
+            (cell.union_level, union_level)
+            if union_power is None
+            else (cell.union_power, union_power)
+        )
+        if not (total := len(histogram)):
+            return 0.0
+
+        below = histogram.count_below(value)
+        equal = histogram.count_at_most(value) - below
+        return (below + equal / 2) / total * 100
+
+    def quantile(
+        self,
+        world_name: str,
+        date: datetime | _date | str,
+        q: float,
+        field: HistogramField = "union_level",
+    ) -> int:
+        """분위수를 반환합니다. (예: q=0.5이면 중앙값)
+
+        Raises:
+            ValueError: q가 0 ~ 1이 아닌 경우 발생합니다.
+            KeyError: 색인되지 않은 (월드, 날짜)인 경우 발생합니다.
+        """
+
+        return getattr(self.cell(world_name, date), field).quantile(q)
+
+    def save(self, path: str | Path) -> None:
+        """색인을 JSON 파일로 저장합니다. 저장 중 중단되어도 이전 파일이 깨지지 않도록 교체 방식으로 씁니다."""
+
+        data = {
+            "power_bucket_size": self.power_bucket_size,
+            "cells": [
+                {
+                    "world_name": world_name,
+                    "date": date,
+                    "ranks": cell.ranks.ranges,
+                    "union_level": cell.union_level.counts,
+                    "union_power": cell.union_power.counts,
+                }
+                for (world_name, date), cell in self.cells.items()
+            ],
+        }
+        write_atomic(path, json.dumps(data, ensure_ascii=False))
+
+    @classmethod
+    def load(
+        cls, path: str | Path, power_bucket_size: int | None = None
+    ) -> UnionRankingIndex:
+        """JSON 파일에서 색인을 읽습니다. 파일이 없으면 빈 색인을 반환합니다.
+
+        Args:
+            path (str | Path): 파일 경로
+            power_bucket_size (int, optional): 유니온 파워 구간 크기. 없으면 파일에 저장된 값을, 파일도 없으면 100,000을 사용합니다.
+
+        Raises:
+            ValueError: power_bucket_size가 파일에 저장된 값과 다른 경우 발생합니다.
+        """
+
+        path = Path(path)
+        if not path.exists():
+            return cls(100_000 if power_bucket_size is None else power_bucket_size)
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if power_bucket_size not in (None, data["power_bucket_size"]):
+            raise ValueError(
+                f"{path} has power_bucket_size {data['power_bucket_size']}, "
+                f"not {power_bucket_size}"
+            )
+
+        index = cls(data["power_bucket_size"])
+        for item in data["cells"]:
+            cell = UnionRankingCell(index.power_bucket_size)
+            cell.ranks = RankCoverage(map(tuple, item["ranks"]))
+            for field in ("union_level", "union_power"):
+                histogram: Histogram = getattr(cell, field)
+                for bucket, count in item[field].items():
+                    histogram.add(int(bucket), count)
+            index.cells[(item["world_name"], item["date"])] = cell
+        return index
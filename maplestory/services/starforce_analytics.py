@@ -0,0 +1,147 @@
+"""스타포스 강화 결과로 강화 확률과 비용을 집계하는 기능을 제공하는 모듈입니다.
+
+- `starforce_outcomes` 함수는 스타포스 히스토리를 한 번 읽어 기준별 성공/실패/파괴 횟수를 집계합니다.
+- `starforce_cost` 함수는 1회 강화 비용을 계산합니다.
+- `expected_meso_cost` 함수는 집계된 성공 확률로 n성별 1회 성공까지의 기대 비용을 계산합니다.
+
+Examples:
+    >>> outcomes = starforce_outcomes(iter_starforce_history(date=kst.datetime(2024, 2, 17)))
+    >>> outcomes[17].success_rate
+    0.3
+    >>> expected_meso_cost(outcomes, item_level=160)
+    {17: ..., ...}
+"""
+
+from collections import Counter
+from typing import Any, Callable, Iterable
+
+from pydantic import BaseModel
+
+from maplestory.models.history import StarforceHistoryInfo
+
+STARFORCE_COST_DIVISORS = {10: 400, 11: 220, 12: 150, 13: 110, 14: 75}
+"""10성부터 14성까지 강화 비용 공식의 나누는 값 (15성 이상은 200)"""
+
+OUTCOME_KEYS: dict[str, Callable[[StarforceHistoryInfo], Any]] = {
+    "before_starforce_count": lambda info: info.before_starforce_count,
+    "starcatch": lambda info: info.is_starcatch,
+    "event": lambda info: bool(info.applied_events),
+    "target_item": lambda info: info.target_item,
+}
+"""`starforce_outcomes`에서 묶을 수 있는 기준"""
+
+
+class StarforceOutcome(BaseModel):
+    """스타포스 강화 결과 집계
+
+    Attributes:
+        attempts: 강화 시도 횟수
+        success: 성공 횟수
+        destroyed: 파괴 횟수
+    """
+
+    attempts: int = 0
+    success: int = 0
+    destroyed: int = 0
+
+    @property
+    def fail(self) -> int:
+        """실패(유지, 하락) 횟수"""
+        return self.attempts - self.success - self.destroyed
+
+    @property
+    def success_rate(self) -> float:
+        return self.success / self.attempts if self.attempts else 0.0
+
+    @property
+    def fail_rate(self) -> float:
+        return self.fail / self.attempts if self.attempts else 0.0
+
+    @property
+    def destroy_rate(self) -> float:
+        return self.destroyed / self.attempts if self.attempts else 0.0
+
+
+def starforce_outcomes(
+    records: Iterable[StarforceHistoryInfo],
+    by: str | tuple[str, ...] = "before_starforce_count",
+) -> dict[Any, StarforceOutcome]:
+    """기준별로 스타포스 강화 결과를 집계합니다.
+
+    Args:
+        records (Iterable[StarforceHistoryInfo]): 스타포스 히스토리
+        by (str | tuple[str, ...]): 묶을 기준. 여러 기준을 주면 기준 값의 튜플로 묶습니다.
+            Available values : before_starforce_count, starcatch, event, target_item
+
+    Returns:
+        dict[Any, StarforceOutcome]: 기준 값 오름차순으로 정렬된 강화 결과 집계
+
+    Raises:
+        ValueError: 묶을 수 없는 기준인 경우 발생합니다.
+    """
+
+    names = (by,) if isinstance(by, str) else tuple(by)
+    if unknown := [name for name in names if name not in OUTCOME_KEYS]:
+        raise ValueError(f"Unknown keys: {', '.join(unknown)}")
+
+    key_funcs = [OUTCOME_KEYS[name] for name in names]
+    attempts, success, destroyed = Counter(), Counter(), Counter()
+    for info in records:
+        key = tuple(func(info) for func in key_funcs)
+        attempts[key] += 1
+        if info.is_success:
+            success[key] += 1
+        elif info.is_destroyed:
+            destroyed[key] += 1
+
+    return {
+        key if len(names) > 1 else key[0]: StarforceOutcome(
+            attempts=attempts[key], success=success[key], destroyed=destroyed[key]
+        )
+        for key in sorted(attempts)
+    }
+
+
+def starforce_cost(item_level: int, star: int, discount_rate: float = 0.0) -> int:
+    """1회 스타포스 강화 비용을 계산합니다.
+
+    Args:
+        item_level (int): 장비 레벨
+        star (int): 강화 시도 전 스타포스 수치
+        discount_rate (float): 비용 할인율 (예: 0.3)
+
+    Returns:
+        int: 100메소 단위로 내림한 강화 비용 (메소)
+    """
+
+    level_cubed = item_level**3
+    if star < 10:
+        cost = 1000 + level_cubed * (star + 1) / 25
+    else:
+        divisor = STARFORCE_COST_DIVISORS.get(star, 200)
+        cost = 1000 + level_cubed * (star + 1) ** 2.7 / divisor
+
+    return int(cost // 100 * 100 * (1 - discount_rate))
+
+
+def expected_meso_cost(
+    outcomes: dict[int, StarforceOutcome],
+    item_level: int,
+    discount_rate: float = 0.0,
+) -> dict[int, float]:
+    """n성별로 한 번 성공할 때까지 필요한 강화 비용의 기댓값을 계산합니다.
+
+    Args:
+        outcomes (dict[int, StarforceOutcome]): 강화 시도 전 스타포스 수치별 강화 결과 집계
+        item_level (int): 장비 레벨
+        discount_rate (float): 비용 할인율 (예: 0.3)
+
+    Returns:
+        dict[int, float]: n성별 1회 성공까지의 기대 비용 (메소). 성공한 적이 없는 n성은 제외됩니다.
+    """
+
+    return {
+        star: starforce_cost(item_level, star, discount_rate) / outcome.success_rate
+        for star, outcome in outcomes.items()
+        if outcome.success
+    }
@@ -15,9 +15,18 @@ from __future__ import annotations
 
 import re
 from datetime import datetime
-from typing import Any, Generator
-
-from pydantic import BaseModel, RootModel, computed_field, field_validator
+from typing import Any, Generator, Iterator
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    RootModel,
+    computed_field,
+    field_validator,
+    model_validator,
+)
 
 from maplestory.apis.union import (
     get_union_artifact_info_by_ocid,
@@ -27,16 +36,51 @@ from maplestory.apis.union import (
 from maplestory.models.union import UnionArtifact, UnionInfo, UnionRaider
 from maplestory.models.union.artifact import UnionArtifactEffect
 from maplestory.services.character import get_character_id
+from maplestory.services.union_board import UnionBoard
+from maplestory.utils.intern import InternTable
 from maplestory.utils.kst import yesterday
+from maplestory.utils.order import sorted_if_needed
+from maplestory.utils.parallel import map_concurrently
 
 
 class Union(BaseModel):
-    character_name: str
+    """유니온 정보
+
+    속성에 접근할 때마다 API를 호출합니다. `fetch_union_snapshot`으로 만든 유니온은
+    조회한 정보를 보관하고 있어 속성에 접근해도 API를 다시 호출하지 않습니다.
+
+    Attributes:
+        character_name: 캐릭터 이름
+        date: 조회 기준일 (KST)
+        ocid: 캐릭터 식별자. 있으면 캐릭터 이름 대신 사용합니다.
+    """
+
+    character_name: str | None = None
     date: datetime = yesterday()
+    ocid: str | None = Field(default=None, repr=False)
+
+    _union_info: UnionInfo | None = PrivateAttr(default=None)
+    _raider_info: UnionRaider | None = PrivateAttr(default=None)
+    _artifact: UnionArtifact | None = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def check_character(self) -> Union:
+        if self.character_name is None and self.ocid is None:
+            raise ValueError("character_name or ocid is required")
+        return self
+
+    @property
+    def is_snapshot(self) -> bool:
+        """조회한 정보를 모두 보관하고 있는지 여부"""
+        return None not in (self._union_info, self._raider_info, self._artifact)
 
     @computed_field(repr=False)
     @property
     def union_info(self) -> UnionInfo:
+        if self._union_info is not None:
+            return self._union_info
+        if self.ocid is not None:
+            return get_union_info_by_ocid(self.ocid, self.date)
         return get_union_info(self.character_name, self.date)
 
     @computed_field
@@ -52,8 +96,16 @@ class Union(BaseModel):
     @computed_field(repr=False)
     @property
     def raider_info(self) -> UnionRaider:
+        if self._raider_info is not None:
+            return self._raider_info
+        if self.ocid is not None:
+            return get_union_raider_info_by_ocid(self.ocid, self.date)
         return get_union_raider_info(self.character_name, self.date)
 
+    @property
+    def board(self) -> UnionBoard:
+        return UnionBoard.from_raider(self.raider_info)
+
     @computed_field
     @property
     def raider_stats(self) -> UnionStats:
@@ -77,6 +129,10 @@ class Union(BaseModel):
     @computed_field(repr=False)
     @property
     def artifact(self) -> UnionArtifact:
+        if self._artifact is not None:
+            return self._artifact
+        if self.ocid is not None:
+            return get_union_artifact_info_by_ocid(self.ocid, self.date)
         return get_union_artifact_info(self.character_name, self.date)
 
     @computed_field
@@ -135,18 +191,95 @@ def get_union_raider_info(
     return get_union_raider_info_by_ocid(character_ocid, date)
 
 
+STAT_PATTERN = re.compile(
+    r"(?P<name>.+) (?P<value>\d+(\.\d+)?)(?P<percent>%?) (?P<updown>.+)"
+)
+
+
 def summarize_union_stat(stat: str) -> dict[str, str]:
-    if m := re.search(
-        r"(?P<name>.+) (?P<value>\d+(\.\d+)?)(?P<percent>%?) (?P<updown>.+)", stat
-    ):
+    if m := STAT_PATTERN.search(stat):
         return m.groupdict()
 
     raise ValueError("Invalid stat format.")
 
 
+def to_number(value: str) -> int | float:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def split_stat_names(name: str) -> list[str] | None:
+    if "," in name:
+        # 'STR, DEX, LUK 40 증가'
+        return [s.strip() for s in name.split(",")]
+    elif "/" in name:
+        # '공격력/마력 20 증가'
+        return [s.strip() for s in name.split("/")]
+    return None
+
+
+class ParsedUnionStat:
+    """유니온 스탯 문자열을 이름, 값, 단위, 증감으로 나눈 결과
+
+    "STR, DEX, LUK 40 증가"처럼 쉼표나 "/"로 여러 스탯을 묶은 이름은 `multi_name`에 나누어 둡니다.
+    공격대원 효과 문자열의 종류는 수백 개 정도이므로, `ParsedUnionStat.of`로 문자열마다 한 번만 해석합니다.
+
+    Attributes:
+        stat: 스탯 문자열
+        groups: 스탯 문자열을 나눈 결과 (name, value, percent, updown)
+        name: 스탯 이름
+        value: 스탯 값
+        percent: 스탯 값이 % 단위이면 "%", 아니면 ""
+        updown: 증가 또는 감소 등
+        multi_name: 다중 이름 스탯을 나눈 이름 튜플. 다중 이름 스탯이 아니면 None
+    """
+
+    __slots__ = ("stat", "groups", "name", "value", "percent", "updown", "multi_name")
+
+    def __init__(self, stat: str):
+        self.stat = stat
+        self.groups = summarize_union_stat(stat)
+        self.name = self.groups["name"]
+        self.value = to_number(self.groups["value"])
+        self.percent = self.groups["percent"]
+        self.updown = self.groups["updown"]
+        names = split_stat_names(self.name)
+        self.multi_name = None if names is None else tuple(names)
+
+    @classmethod
+    def of(cls, stat: str) -> ParsedUnionStat | None:
+        """스탯 문자열을 해석한 결과를 반환합니다. 형식이 맞지 않으면 None을 반환합니다."""
+        return _parsed_stats.get(stat)
+
+    def __repr__(self) -> str:
+        return f"ParsedUnionStat(name={self.name!r}, value={self.value!r}, percent={self.percent!r}, updown={self.updown!r})"
+
+
+def _parse_union_stat(stat: str) -> ParsedUnionStat | None:
+    try:
+        return ParsedUnionStat(stat)
+    except ValueError:
+        return None
+
+
+_parsed_stats: InternTable[str, ParsedUnionStat | None] = InternTable(_parse_union_stat)
+
+
 class UnionStat(BaseModel):
+    """유니온 스탯
+
+    이름, 값 등은 스탯 문자열을 해석한 `ParsedUnionStat`에서 읽습니다.
+    여러 계정의 스탯을 합산할 때는 `UnionStat.of`로 같은 문자열의 스탯을 하나의 객체로 만들어 둡니다.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
     stat: str
 
+    _parsed: ParsedUnionStat | None = PrivateAttr(default=None)
+
     @field_validator("stat", mode="before")
     @classmethod
     def unify_format(cls, stat: str) -> str:
@@ -163,34 +296,49 @@ class UnionStat(BaseModel):
 
         return stat
 
+    def model_post_init(self, __context: Any) -> None:
+        self._parsed = ParsedUnionStat.of(self.stat)
+
+    @classmethod
+    def of(cls, stat: str) -> UnionStat:
+        """스탯 문자열로 유니온 스탯을 만듭니다. 이미 만든 문자열이면 공유된 객체를 반환합니다."""
+
+        return _interned_stats.get(stat)
+
+    @property
+    def parsed(self) -> ParsedUnionStat:
+        """
+        Raises:
+            ValueError: 스탯 문자열의 형식이 맞지 않는 경우 발생합니다.
+        """
+        if self._parsed is None:
+            raise ValueError("Invalid stat format.")
+        return self._parsed
+
     @computed_field(repr=False)
     @property
     def parsed_stat(self) -> dict[str, str]:
-        return summarize_union_stat(self.stat)
+        return dict(self.parsed.groups)
 
     @computed_field(repr=False)
     @property
     def name(self) -> str:
-        return self.parsed_stat.get("name")
+        return self.parsed.name
 
     @property
     def is_multi_name(self) -> bool:
-        return "," in self.name or "/" in self.name
+        return self.parsed.multi_name is not None
 
     @property
     def multi_name(self) -> list[str] | None:
-        if "," in self.name:
-            # 'STR, DEX, LUK 40 증가'
-            return [s.strip() for s in self.name.split(",")]
-        elif "/" in self.name:
-            # '공격력/마력 20 증가'
-            return [s.strip() for s in self.name.split("/")]
-        return None
+        if (names := self.parsed.multi_name) is None:
+            return None
+        return list(names)
 
     @computed_field(repr=False)
     @property
     def percent(self) -> str:
-        return self.parsed_stat.get("percent")
+        return self.parsed.percent
 
     @computed_field(repr=False)
     @property
@@ -200,15 +348,12 @@ class UnionStat(BaseModel):
     @computed_field(repr=False)
     @property
     def value(self) -> int | float:
-        try:
-            return int(self.parsed_stat.get("value"))
-        except ValueError:
-            return float(self.parsed_stat.get("value"))
+        return self.parsed.value
 
     @computed_field(repr=False)
     @property
     def updown(self) -> str:
-        return self.parsed_stat.get("updown")
+        return self.parsed.updown
 
     def __add__(self, other: UnionStat) -> UnionStat:
         if self.name != other.name:
@@ -231,6 +376,42 @@ class UnionStat(BaseModel):
         return self.__add__(other) if isinstance(other, UnionStat) else NotImplemented
 
 
+_interned_stats: InternTable[str, UnionStat] = InternTable(
+    lambda stat: UnionStat(stat=stat)
+)
+
+
+class _StatTotal:
+    """같은 이름의 스탯 값을 더하는 누산기. `UnionStat`은 마지막에 한 번만 만듭니다."""
+
+    __slots__ = ("stat", "name", "value", "percent", "updown")
+
+    def __init__(
+        self,
+        stat: UnionStat | None,
+        name: str,
+        value: int | float,
+        percent: str,
+        updown: str,
+    ):
+        self.stat = stat
+        self.name = name
+        self.value = value
+        self.percent = percent
+        self.updown = updown
+
+    def add(self, value: int | float, updown: str) -> None:
+        if updown != self.updown:
+            raise ValueError("Cannot add stats with different updown.")
+        self.value += value
+        self.stat = None
+
+    def to_stat(self) -> UnionStat:
+        if self.stat is not None:
+            return self.stat
+        return UnionStat.of(f"{self.name} {self.value}{self.percent} {self.updown}")
+
+
 class UnionStats(RootModel):
     root: list[UnionStat]
 
@@ -245,7 +426,7 @@ class UnionStats(RootModel):
         모델 생성 후 초기화를 수행합니다. 스탯의 이름을 기준으로 root를 정렬합니다.
         Initializes the model post creation. Sorts the root based on the name of the stat.
         """
-        self.root = sorted(self.root, key=lambda x: x.name)
+        self.root = sorted_if_needed(self.root, key=lambda x: x.name)
 
     def group_stats(
         self, split_multiple: bool = False
@@ -265,31 +446,27 @@ class UnionStats(RootModel):
             dict[str, list[UnionStat]]: 그룹화된 스탯.
                                         The grouped stats.
         """
-        stats = []
-        if split_multiple:
-            for stat in self.root:
-                if stat.is_multi_name:
-                    stats.extend(
-                        [
-                            UnionStat(
-                                stat=f"{name} {stat.value}{stat.percent} {stat.updown}"
-                            )
-                            for name in stat.multi_name
-                        ]
-                    )
-                else:
-                    stats.append(stat)
-        else:
-            stats = self.root
-
-        return {
-            (stat.name, stat.is_percent): [
-                s
-                for s in stats
-                if s.name == stat.name and s.is_percent == stat.is_percent
-            ]
-            for stat in stats
-        }
+        groups = {}
+        for stat, name, value, percent, updown in self._parsed_stats(split_multiple):
+            if stat is None:
+                stat = UnionStat.of(f"{name} {value}{percent} {updown}")
+            groups.setdefault((name, percent == "%"), []).append(stat)
+        return groups
+
+    def _parsed_stats(
+        self, split_multiple: bool
+    ) -> Iterator[tuple[UnionStat | None, str, int | float, str, str]]:
+        """
+        스탯마다 해석된 결과로 (스탯, 이름, 값, 퍼센트, 증감) 튜플을 생성합니다.
+        다중 이름 스탯을 분리한 경우 스탯은 None입니다.
+        """
+        for stat in self.root:
+            parsed = stat.parsed
+            if split_multiple and parsed.multi_name:
+                for name in parsed.multi_name:
+                    yield None, name, parsed.value, parsed.percent, parsed.updown
+            else:
+                yield stat, parsed.name, parsed.value, parsed.percent, parsed.updown
 
     def group_with_split_multiple(self) -> dict[str, list[UnionStat]]:
         """
@@ -316,7 +493,7 @@ class UnionStats(RootModel):
             UnionStats: 생성된 UnionStats 객체.
                         The created UnionStats object.
         """
-        return cls(root=[UnionStat(stat=stat) for stat in data])
+        return cls(root=[UnionStat.of(stat) for stat in data])
 
     def summarize(self, split_multiple: bool = False) -> UnionStats:
         """
@@ -332,17 +509,21 @@ class UnionStats(RootModel):
             UnionStats: 요약된 스탯.
                         The summarized stats.
         """
-        combined_stats = []
-        grouped_stats = self.group_stats(split_multiple)
-
-        for (stat_name, _), stats in grouped_stats.items():
-            if stat_name == "방어율 무시":
+        groups: dict[tuple[str, bool], list[_StatTotal]] = {}
+        for stat, name, value, percent, updown in self._parsed_stats(split_multiple):
+            key = (name, percent == "%")
+            if (totals := groups.get(key)) is None:
+                totals = groups[key] = []
+            if totals and name != "방어율 무시":
+                totals[0].add(value, updown)
+            else:
                 # '방어율 무시' (Ignore Defense Rate) is multiplied, not summed
                 # 방어율 무시는 합적용이 아니라 곱적용이라 별도로 처리
-                combined_stats.extend(stats)
-            else:
-                combined_stats.append(sum(stats))
+                totals.append(_StatTotal(stat, name, value, percent, updown))
 
+        combined_stats = [
+            total.to_stat() for totals in groups.values() for total in totals
+        ]
         return UnionStats(root=combined_stats)
 
 
@@ -367,3 +548,49 @@ def get_union_artifact_info(
 
     character_ocid = get_character_id(character_name)
     return get_union_artifact_info_by_ocid(character_ocid, date)
+
+
+def fetch_union_snapshot(
+    character_name: str | None = None,
+    date: datetime = yesterday(),
+    ocid: str | None = None,
+) -> Union:
+    """유니온, 유니온 공격대, 유니온 아티팩트 정보를 한 번에 조회합니다.
+
+    캐릭터 식별자(ocid)를 한 번만 조회하고, 세 API를 동시에 호출합니다.
+    반환된 유니온은 조회한 정보를 보관하므로 속성에 접근하거나 `model_dump`를 호출해도 API를 다시 호출하지 않습니다.
+
+    Args:
+        character_name (str, optional): 캐릭터 이름
+        date (datetime): 조회 기준일 (KST)
+        ocid (str, optional): 캐릭터 식별자. 있으면 캐릭터 식별자 조회를 생략합니다.
+
+    Returns:
+        Union: 조회한 정보를 보관하는 유니온
+
+    Raises:
+        ValueError: 캐릭터 이름과 캐릭터 식별자가 모두 없는 경우 발생합니다.
+
+    Examples:
+        >>> union = fetch_union_snapshot("온앤온")
+        >>> union.level, union.raider_stats, union.artifact_effects
+    """
+
+    if character_name is None and ocid is None:
+        raise ValueError("character_name or ocid is required")
+
+    character_ocid = ocid or get_character_id(character_name)
+    union_info, raider_info, artifact = map_concurrently(
+        lambda get_info: get_info(character_ocid, date),
+        [
+            get_union_info_by_ocid,
+            get_union_raider_info_by_ocid,
+            get_union_artifact_info_by_ocid,
+        ],
+    )
+
+    union = Union(character_name=character_name, date=date, ocid=character_ocid)
+    union._union_info = union_info
+    union._raider_info = raider_info
+    union._artifact = artifact
+    return union
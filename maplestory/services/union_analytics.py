@@ -0,0 +1,203 @@
+"""여러 계정의 유니온 효과를 비교하는 기능을 제공하는 모듈입니다.
+
+- `UnionStatMatrix` 클래스는 계정별 공격대원 효과, 공격대 점령 효과, 아티팩트 효과를
+  (계정 × 효과) 행렬로 모아 효과별 순위와 가중치 점수를 계산합니다.
+
+Examples:
+    >>> unions = map_concurrently(fetch_union_snapshot, ["온앤온", "아델"])
+    >>> matrix = UnionStatMatrix.from_unions(unions)
+    >>> matrix.rank("보스 몬스터 공격 시 데미지", percent=True)
+    [('온앤온', 38.0), ('아델', 35.0)]
+    >>> matrix.column("방어율 무시", percent=True)
+    array('d', [52.8, 46.0])
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable
+
+from maplestory.models.union.artifact import parse_artifact_effect, stat_name
+from maplestory.services.union import Union, UnionStat
+
+StatKey = tuple[str, bool]
+"""(효과 이름, % 단위 여부)"""
+
+IGNORE_DEFENSE = "방어율 무시"
+
+UNION_STAT_SOURCES = ("raider", "occupied", "artifact")
+"""행렬에 모을 수 있는 유니온 효과 (공격대원 효과, 공격대 점령 효과, 아티팩트 효과)"""
+
+
+def _normalize_name(name: str) -> str:
+    # UnionStat과 같이 '몬스터 방어율 무시'를 '방어율 무시'로 통일합니다.
+    return IGNORE_DEFENSE if name == f"몬스터 {IGNORE_DEFENSE}" else name
+
+
+class UnionStatMatrix:
+    """계정별 유니온 효과 행렬
+
+    효과는 (효과 이름, % 단위 여부) 열로 나누어 계정 순서대로 값을 담은 배열로 보관합니다.
+    % 단위 효과의 값은 퍼센트 값입니다. (15% -> 15.0)
+    '방어율 무시'는 합이 아닌 곱으로 적용되므로 `1 - (1 - a)(1 - b)...`로 합칩니다.
+
+    Attributes:
+        accounts: 계정 이름 목록 (행 순서)
+        columns: 효과별 값 배열. 배열의 i번째 값은 i번째 계정의 효과 값입니다.
+    """
+
+    def __init__(self):
+        self.accounts: list[str] = []
+        self.columns: dict[StatKey, array] = {}
+
+    def __len__(self) -> int:
+        return len(self.accounts)
+
+    @property
+    def keys(self) -> list[StatKey]:
+        return list(self.columns)
+
+    def add(
+        self,
+        account: str,
+        stats: Iterable[str] = (),
+        artifact_effects: Iterable[str] = (),
+    ) -> None:
+        """계정 하나의 효과를 행으로 추가합니다.
+
+        Args:
+            account (str): 계정 이름
+            stats (Iterable[str]): 공격대원 효과, 공격대 점령 효과 문자열 (예: "STR, DEX, LUK 40 증가")
+            artifact_effects (Iterable[str]): 아티팩트 효과 문자열 (예: "공격력 30, 마력 30 증가")
+
+        Raises:
+            ValueError: 효과 문자열의 형식이 맞지 않는 경우 발생합니다.
+        """
+
+        row: dict[StatKey, float] = {}
+        ignore_defense_remaining = 1.0
+
+        def accumulate(name: str, value: float, percent: bool) -> None:
+            nonlocal ignore_defense_remaining
+            if name == IGNORE_DEFENSE and percent:
+                ignore_defense_remaining *= 1 - value / 100
+            else:
+                row[(name, percent)] = row.get((name, percent), 0.0) + value
+
+        for stat in stats:
+            parsed = UnionStat.of(stat).parsed
+            percent = parsed.percent == "%"
+            for name in parsed.multi_name or (parsed.name,):
+                accumulate(name, parsed.value, percent)
+
+        for effect in artifact_effects:
+            for name_id, value, is_ratio in parse_artifact_effect(effect):
+                if is_ratio:
+                    value = round(value * 100, 10)
+                accumulate(_normalize_name(stat_name(name_id)), value, is_ratio)
+
+        if ignore_defense_remaining != 1.0:
+            row[(IGNORE_DEFENSE, True)] = round(
+                (1 - ignore_defense_remaining) * 100, 10
+            )
+
+        i = len(self.accounts)
+        self.accounts.append(account)
+        for key, value in row.items():
+            if (column := self.columns.get(key)) is None:
+                column = self.columns[key] = array("d", bytes(8 * i))
+            column.append(value)
+        for column in self.columns.values():
+            if len(column) == i:
+                column.append(0.0)
+
+    @classmethod
+    def from_unions(
+        cls,
+        unions: Iterable[Union],
+        sources: Iterable[str] = UNION_STAT_SOURCES,
+    ) -> UnionStatMatrix:
+        """유니온 정보로 행렬을 만듭니다.
+
+        `fetch_union_snapshot`으로 조회한 유니온을 넘기면 API를 다시 호출하지 않습니다.
+
+        Args:
+            unions (Iterable[Union]): 유니온 정보
+            sources (Iterable[str]): 모을 효과 (raider, occupied, artifact). 기본값은 모두입니다.
+
+        Raises:
+            ValueError: 알 수 없는 효과 종류인 경우 발생합니다.
+        """
+
+        sources = set(sources)
+        if unknown := sources - set(UNION_STAT_SOURCES):
+            raise ValueError(f"Unknown union stat sources: {sorted(unknown)}")
+
+        matrix = cls()
+        for union in unions:
+            stats = []
+            if "raider" in sources:
+                stats.extend(union.raider_info.raider_stats)
+            if "occupied" in sources:
+                stats.extend(union.raider_info.occupied_stats)
+            artifact_effects = (
+                [effect.name for effect in union.artifact.effects]
+                if "artifact" in sources
+                else []
+            )
+            matrix.add(union.character_name or union.ocid, stats, artifact_effects)
+        return matrix
+
+    def column(self, name: str, percent: bool = False) -> array:
+        """효과의 계정별 값 배열을 반환합니다. 효과가 없으면 0으로 채운 배열을 반환합니다."""
+
+        if (column := self.columns.get((name, percent))) is not None:
+            return column
+        return array("d", bytes(8 * len(self.accounts)))
+
+    def row(self, account: str) -> dict[StatKey, float]:
+        """계정의 효과별 값을 반환합니다. 값이 0인 효과는 제외합니다.
+
+        Raises:
+            ValueError: 없는 계정인 경우 발생합니다.
+        """
+
+        i = self.accounts.index(account)
+        return {key: column[i] for key, column in self.columns.items() if column[i]}
+
+    def score(self, weights: dict[StatKey, float]) -> array:
+        """효과별 가중치를 곱해 더한 계정별 점수 배열을 반환합니다.
+
+        Args:
+            weights (dict[StatKey, float]): (효과 이름, % 단위 여부)별 가중치
+        """
+
+        scores = array("d", bytes(8 * len(self.accounts)))
+        for (name, percent), weight in weights.items():
+            for i, value in enumerate(self.column(name, percent)):
+                scores[i] += weight * value
+        return scores
+
+    def rank(
+        self, name: str, percent: bool = False, top: int | None = None
+    ) -> list[tuple[str, float]]:
+        """효과 값이 큰 순서대로 (계정 이름, 값) 목록을 반환합니다."""
+
+        ranking = sorted(
+            zip(self.accounts, self.column(name, percent)),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return ranking[:top]
+
+    def rank_by_score(
+        self, weights: dict[StatKey, float], top: int | None = None
+    ) -> list[tuple[str, float]]:
+        """가중치 점수가 큰 순서대로 (계정 이름, 점수) 목록을 반환합니다."""
+
+        ranking = sorted(
+            zip(self.accounts, self.score(weights)),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        return ranking[:top]
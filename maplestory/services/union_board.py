@@ -0,0 +1,277 @@
+"""유니온 공격대 배치판을 비트보드로 다루는 기능을 제공하는 모듈입니다.
+
+- `UnionBoard` 클래스는 유니온 블록 배치 정보를 22×20 배치판의 점유 비트보드로 한 번만 변환하고,
+  지역별 점령 칸 수, 지역 효과별 합계, 겹침 검사, 배치판 이미지를 제공합니다.
+
+배치판의 한 칸은 정수의 한 비트입니다. 맨 윗줄 왼쪽 칸이 0번 비트이고, 오른쪽으로 1씩, 아래로 22씩 증가합니다.
+지역별 점령 칸 수는 블록 비트보드와 지역 비트보드의 AND 결과의 비트 수(`int.bit_count`)로 계산합니다.
+
+Examples:
+    >>> board = UnionBoard.from_raider(get_union_raider_info("온앤온"))
+    >>> board.region_counts()
+    [10, 9, 12, 8, 11, 10, 7, 9, 0, 0, 4, 5, 0, 0, 3, 2]
+    >>> board.stat_totals(raider.inner_stats)
+    {'유니온 STR': 10, '유니온 DEX': 9, ...}
+    >>> board.render().save("union.png")
+"""
+
+from __future__ import annotations
+
+from typing import Iterable
+
+from PIL import Image, ImageDraw
+
+from maplestory.models.union import (
+    UnionRaider,
+    UnionRaiderBlock,
+    UnionRaiderBlockPosition,
+    UnionRaiderInnerStat,
+)
+
+BOARD_WIDTH = 22
+BOARD_HEIGHT = 20
+X_MIN = -11
+"""가장 왼쪽 칸의 X좌표 (가장 오른쪽 칸은 10). 중앙 4칸의 X좌표는 -1, 0입니다."""
+Y_MAX = 10
+"""가장 위쪽 칸의 Y좌표 (가장 아래쪽 칸은 -9). 중앙 4칸의 Y좌표는 0, 1입니다."""
+
+INNER_WIDTH = 12
+INNER_HEIGHT = 10
+"""안쪽 지역의 크기. 배치판 중앙의 12×10 칸이 안쪽 지역입니다."""
+
+REGION_COUNT = 8
+"""안쪽, 바깥쪽 지역 각각의 개수. 11시 방향부터 시계 방향 순서대로 0~7번입니다."""
+
+BLOCK_COLORS = {
+    "전사": (221, 85, 85),
+    "마법사": (85, 119, 221),
+    "궁수": (85, 187, 102),
+    "도적": (153, 102, 204),
+    "해적": (119, 119, 119),
+    "메이플M": (238, 153, 51),
+    "메이플 M 캐릭터": (238, 153, 51),
+    "하이브리드": (51, 170, 170),
+}
+"""블록 모양별 배치판 이미지 색상"""
+
+
+def cell_index(x: int, y: int) -> int:
+    """좌표에 해당하는 칸의 비트 번호를 반환합니다.
+
+    Raises:
+        ValueError: 좌표가 배치판 밖인 경우 발생합니다.
+    """
+
+    column, row = x - X_MIN, Y_MAX - y
+    if not (0 <= column < BOARD_WIDTH and 0 <= row < BOARD_HEIGHT):
+        raise ValueError(f"({x}, {y}) is out of the union board")
+    return row * BOARD_WIDTH + column
+
+
+def cell_of(index: int) -> tuple[int, int]:
+    """비트 번호에 해당하는 칸의 좌표 (x, y)를 반환합니다."""
+
+    row, column = divmod(index, BOARD_WIDTH)
+    return column + X_MIN, Y_MAX - row
+
+
+def region_of(x: int, y: int) -> int:
+    """칸이 속한 지역 번호를 반환합니다.
+
+    배치판을 가로, 세로 중앙선과 두 대각선으로 8개 방향으로 나누고,
+    중앙의 `INNER_WIDTH`×`INNER_HEIGHT` 칸은 안쪽 지역(0~7), 나머지는 바깥쪽 지역(8~15)으로 구분합니다.
+    방향 번호는 `UnionRaiderInnerStat.stat_field_id`와 같이 11시 방향부터 시계 방향 순서입니다.
+
+    Returns:
+        int: 안쪽 지역이면 0~7, 바깥쪽 지역이면 8~15
+    """
+
+    # 칸 중심과 배치판 중심의 거리를 2배하여 정수로 계산합니다. (항상 홀수이므로 경계에 걸치지 않습니다.)
+    dx, dy = 2 * x + 1, 2 * y - 1
+    right, upper = dx > 0, dy > 0
+    vertical = abs(dy) * BOARD_WIDTH > abs(dx) * BOARD_HEIGHT
+
+    if upper:
+        direction = (1 if right else 0) if vertical else (2 if right else 7)
+    else:
+        direction = (4 if right else 5) if vertical else (3 if right else 6)
+
+    inner = abs(dx) < INNER_WIDTH and abs(dy) < INNER_HEIGHT
+    return direction if inner else direction + REGION_COUNT
+
+
+def _region_masks() -> list[int]:
+    masks = [0] * (2 * REGION_COUNT)
+    for index in range(BOARD_WIDTH * BOARD_HEIGHT):
+        masks[region_of(*cell_of(index))] |= 1 << index
+    return masks
+
+
+REGION_MASKS = _region_masks()
+"""지역 번호별 지역 비트보드"""
+
+
+def positions_mask(positions: Iterable[UnionRaiderBlockPosition]) -> int:
+    """블록이 차지하는 칸들의 비트보드를 반환합니다."""
+
+    mask = 0
+    for position in positions:
+        mask |= 1 << cell_index(position.x, position.y)
+    return mask
+
+
+def cells(mask: int) -> list[tuple[int, int]]:
+    """비트보드의 칸 좌표 목록을 비트 번호 순서대로 반환합니다."""
+
+    result = []
+    while mask:
+        low = mask & -mask
+        result.append(cell_of(low.bit_length() - 1))
+        mask ^= low
+    return result
+
+
+class UnionBoard:
+    """유니온 공격대 배치판
+
+    블록마다 차지하는 칸을 비트보드로 한 번만 변환해 두고, 이후 계산은 비트 연산으로 처리합니다.
+    API 응답에는 배치판 밖 좌표의 칸이 포함되는 경우가 있으므로, 기본적으로 그런 칸은 `outside`에 모으고
+    비트보드에서는 제외합니다.
+
+    Args:
+        blocks (list[UnionRaiderBlock]): 유니온 블록 배치 정보
+        strict (bool): True이면 배치판 밖에 놓인 칸이 있을 때 ValueError를 발생시킵니다. 기본값은 False입니다.
+
+    Attributes:
+        blocks: 유니온 블록 배치 정보
+        block_masks: 블록별 비트보드. 배치판 밖의 칸은 포함하지 않습니다.
+        occupied: 블록이 하나 이상 놓인 칸의 비트보드
+        overlapped: 블록이 두 개 이상 놓인 칸의 비트보드
+        outside: 배치판 밖에 놓인 칸의 (블록, X좌표, Y좌표) 목록
+
+    Raises:
+        ValueError: strict가 True이고 블록이 배치판 밖에 놓인 경우 발생합니다.
+    """
+
+    def __init__(self, blocks: list[UnionRaiderBlock], strict: bool = False):
+        self.blocks = blocks
+        self.block_masks = []
+        self.outside: list[tuple[UnionRaiderBlock, int, int]] = []
+        for block in blocks:
+            mask = 0
+            for position in block.position:
+                try:
+                    mask |= 1 << cell_index(position.x, position.y)
+                except ValueError as error:
+                    if strict:
+                        raise ValueError(
+                            f"{block.type} block ({block.character_class} {block.level}): {error}"
+                        ) from error
+                    self.outside.append((block, position.x, position.y))
+            self.block_masks.append(mask)
+
+        self.occupied = self.overlapped = 0
+        for mask in self.block_masks:
+            self.overlapped |= self.occupied & mask
+            self.occupied |= mask
+
+    @classmethod
+    def from_raider(cls, raider: UnionRaider, strict: bool = False) -> UnionBoard:
+        return cls(raider.blocks, strict)
+
+    def __len__(self) -> int:
+        """점령한 칸 수"""
+        return self.occupied.bit_count()
+
+    @property
+    def has_overlap(self) -> bool:
+        return self.overlapped != 0
+
+    def overlaps(self, positions: Iterable[UnionRaiderBlockPosition] | int) -> bool:
+        """주어진 칸들(또는 비트보드) 중 이미 블록이 놓인 칸이 있는지 확인합니다."""
+
+        mask = positions if isinstance(positions, int) else positions_mask(positions)
+        return self.occupied & mask != 0
+
+    def region_counts(self) -> list[int]:
+        """지역 번호(0~15)별 점령한 칸 수를 반환합니다."""
+
+        return [(self.occupied & mask).bit_count() for mask in REGION_MASKS]
+
+    def inner_counts(self) -> list[int]:
+        """안쪽 지역(0~7)별 점령한 칸 수를 반환합니다."""
+
+        return self.region_counts()[:REGION_COUNT]
+
+    def outer_counts(self) -> list[int]:
+        """바깥쪽 지역(0~7)별 점령한 칸 수를 반환합니다."""
+
+        return self.region_counts()[REGION_COUNT:]
+
+    def stat_totals(
+        self,
+        inner_stats: Iterable[UnionRaiderInnerStat],
+        outer_effects: dict[int, str] | None = None,
+    ) -> dict[str, int]:
+        """지역 효과별 점령한 칸 수를 반환합니다.
+
+        Args:
+            inner_stats (Iterable[UnionRaiderInnerStat]): 안쪽 지역 효과 배치 정보
+            outer_effects (dict[int, str], optional): 바깥쪽 지역 번호(0~7)별 효과 이름
+
+        Returns:
+            dict[str, int]: 효과 이름별 점령한 칸 수. 같은 효과의 지역은 더합니다.
+        """
+
+        counts = self.region_counts()
+        effects = [
+            (int(stat.stat_field_id), stat.stat_field_effect) for stat in inner_stats
+        ]
+        if outer_effects:
+            effects.extend(
+                (REGION_COUNT + region, effect)
+                for region, effect in outer_effects.items()
+            )
+
+        totals: dict[str, int] = {}
+        for region, effect in effects:
+            totals[effect] = totals.get(effect, 0) + counts[region]
+        return totals
+
+    def render(self, cell_size: int = 16) -> Image.Image:
+        """배치판 이미지를 반환합니다.
+
+        블록은 모양별 색상(`BLOCK_COLORS`)으로, 겹친 칸은 검은색으로 칠하고,
+        지역 경계는 굵은 선으로 표시합니다.
+        """
+
+        image = Image.new(
+            "RGB", (BOARD_WIDTH * cell_size, BOARD_HEIGHT * cell_size), "white"
+        )
+        draw = ImageDraw.Draw(image)
+
+        def box(index: int) -> tuple[int, int, int, int]:
+            row, column = divmod(index, BOARD_WIDTH)
+            left, top = column * cell_size, row * cell_size
+            return left, top, left + cell_size - 1, top + cell_size - 1
+
+        for block, mask in zip(self.blocks, self.block_masks):
+            color = BLOCK_COLORS.get(block.type, (204, 204, 204))
+            for x, y in cells(mask):
+                draw.rectangle(box(cell_index(x, y)), fill=color, outline="white")
+
+        for x, y in cells(self.overlapped):
+            draw.rectangle(box(cell_index(x, y)), fill="black")
+
+        for index in range(BOARD_WIDTH * BOARD_HEIGHT):
+            left, top, right, bottom = box(index)
+            region = region_of(*cell_of(index))
+            draw.rectangle((left, top, right, bottom), outline=(224, 224, 224))
+            if index % BOARD_WIDTH + 1 < BOARD_WIDTH:
+                if region_of(*cell_of(index + 1)) != region:
+                    draw.line((right, top, right, bottom), fill="black", width=2)
+            if index + BOARD_WIDTH < BOARD_WIDTH * BOARD_HEIGHT:
+                if region_of(*cell_of(index + BOARD_WIDTH)) != region:
+                    draw.line((left, bottom, right, bottom), fill="black", width=2)
+
+        return image
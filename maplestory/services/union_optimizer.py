@@ -0,0 +1,459 @@
+"""유니온 공격대원 배치를 최적화하는 기능을 제공하는 모듈입니다.
+
+- `RaiderMember` 클래스는 배치할 공격대원(블록 모양, 직업, 레벨)을 나타냅니다.
+- `optimize_union_placement` 함수는 지역 효과별 가중치의 합이 가장 큰 블록 배치를 찾습니다.
+
+배치판과 블록은 `maplestory.services.union_board`와 같은 비트보드로 다룹니다.
+블록 모양마다 회전, 뒤집기한 모든 방향과 위치의 비트보드를 미리 만들어 두고,
+분기 한정법(branch and bound)으로 탐색합니다. 블록은 중앙 4칸에서 시작하여 이미 놓인 블록과 맞닿도록 배치합니다.
+
+Examples:
+    >>> raider = get_union_raider_info("온앤온")
+    >>> members = [RaiderMember.from_block(block) for block in raider.blocks]
+    >>> placement = optimize_union_placement(
+    ...     members,
+    ...     {"유니온 STR": 1, "유니온 공격력": 3},
+    ...     raider.inner_stats,
+    ...     time_budget=10,
+    ...     max_workers=4,
+    ... )
+    >>> placement.board.render().save("optimized.png")
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Iterable
+
+from pydantic import BaseModel, ConfigDict
+
+from maplestory.models.union import UnionRaiderBlock, UnionRaiderInnerStat
+from maplestory.services.union_board import (
+    BOARD_HEIGHT,
+    BOARD_WIDTH,
+    REGION_COUNT,
+    REGION_MASKS,
+    UnionBoard,
+    cell_index,
+    cells,
+)
+
+Shape = tuple[tuple[int, int], ...]
+"""블록이 차지하는 칸의 (열, 행) 상대 좌표. 행은 아래로 갈수록 증가합니다."""
+
+BLOCK_SHAPES: dict[str, dict[int, str]] = {
+    "전사": {1: "#", 2: "##", 3: "###", 4: "##/##", 5: "##/##/#."},
+    "마법사": {1: "#", 2: "##", 3: "##/#.", 4: "###/.#.", 5: ".#./###/.#."},
+    "궁수": {1: "#", 2: "##", 3: "###", 4: "####", 5: "#####"},
+    "도적": {1: "#", 2: "##", 3: "##/#.", 4: "##/#./#.", 5: "#../###/..#"},
+    "해적": {1: "#", 2: "##", 3: "##/#.", 4: "##./.##", 5: ".###/##.."},
+    "하이브리드": {1: "#", 2: "##", 3: "##/#.", 4: ".#/.#/##", 5: "#.../####"},
+    "메이플M": {1: "#", 2: "##", 3: "###", 4: "####"},
+}
+"""블록 모양별, 칸 수별 블록 모양. `#`은 블록이 차지하는 칸, `/`는 줄바꿈입니다."""
+
+LEVEL_CELLS = ((250, 5), (200, 4), (140, 3), (100, 2), (60, 1))
+"""(최소 레벨, 칸 수)"""
+
+MOBILE_LEVEL_CELLS = ((120, 4), (70, 3), (50, 2), (30, 1))
+"""메이플M 캐릭터의 (최소 레벨, 칸 수)"""
+
+CENTER_MASK = sum(1 << cell_index(x, y) for x in (-1, 0) for y in (0, 1))
+"""배치판 중앙 4칸의 비트보드. 첫 블록은 중앙 칸을 덮어야 합니다."""
+
+_FULL_MASK = (1 << BOARD_WIDTH * BOARD_HEIGHT) - 1
+_LEFT_COLUMN = sum(1 << row * BOARD_WIDTH for row in range(BOARD_HEIGHT))
+_RIGHT_COLUMN = _LEFT_COLUMN << BOARD_WIDTH - 1
+
+_DEADLINE_CHECK_INTERVAL = 1024
+
+
+def _block_kind(block_type: str) -> str:
+    # API는 메이플M 캐릭터 블록을 '메이플 M 캐릭터'로 표기합니다.
+    return (
+        "메이플M" if block_type.replace(" ", "").startswith("메이플M") else block_type
+    )
+
+
+def block_shape(block_type: str, level: int) -> str | None:
+    """블록 모양과 레벨에 해당하는 블록 모양 문자열을 반환합니다.
+
+    Returns:
+        str | None: 블록 모양 문자열. 레벨이 낮아 배치할 수 없으면 None
+
+    Raises:
+        ValueError: 알 수 없는 블록 모양인 경우 발생합니다.
+    """
+
+    kind = _block_kind(block_type)
+    if (shapes := BLOCK_SHAPES.get(kind)) is None:
+        raise ValueError(f"Unknown block type: {block_type}")
+
+    table = MOBILE_LEVEL_CELLS if kind == "메이플M" else LEVEL_CELLS
+    for min_level, size in table:
+        if level >= min_level:
+            return shapes[size]
+    return None
+
+
+def _parse_shape(pattern: str) -> Shape:
+    return tuple(
+        (column, row)
+        for row, line in enumerate(pattern.split("/"))
+        for column, char in enumerate(line)
+        if char == "#"
+    )
+
+
+def _normalize(shape: Iterable[tuple[int, int]]) -> Shape:
+    shape = list(shape)
+    min_column = min(column for column, _ in shape)
+    min_row = min(row for _, row in shape)
+    return tuple(sorted((column - min_column, row - min_row) for column, row in shape))
+
+
+@lru_cache
+def orientations(pattern: str) -> tuple[Shape, ...]:
+    """블록 모양을 회전, 뒤집기한 서로 다른 모든 방향을 반환합니다. (최대 8개)"""
+
+    shape = _parse_shape(pattern)
+    result = []
+    for _ in range(4):
+        shape = _normalize((-row, column) for column, row in shape)
+        for variant in (shape, _normalize((-column, row) for column, row in shape)):
+            if variant not in result:
+                result.append(variant)
+    return tuple(result)
+
+
+@lru_cache
+def placement_masks(pattern: str) -> tuple[tuple[int, tuple[int, ...]], ...]:
+    """블록 모양을 배치판에 놓을 수 있는 모든 (비트보드, 비트 번호들)을 반환합니다."""
+
+    result = []
+    for shape in orientations(pattern):
+        width = max(column for column, _ in shape) + 1
+        height = max(row for _, row in shape) + 1
+        for top in range(BOARD_HEIGHT - height + 1):
+            for left in range(BOARD_WIDTH - width + 1):
+                bits = tuple(
+                    (top + row) * BOARD_WIDTH + left + column for column, row in shape
+                )
+                result.append((sum(1 << bit for bit in bits), bits))
+    return tuple(result)
+
+
+def region_weights(
+    weights: dict[str, float],
+    inner_stats: Iterable[UnionRaiderInnerStat],
+    outer_effects: dict[int, str] | None = None,
+) -> list[float]:
+    """효과 이름별 가중치를 지역 번호(0~15)별 가중치로 변환합니다.
+
+    Args:
+        weights (dict[str, float]): 효과 이름별 칸 하나의 가중치
+        inner_stats (Iterable[UnionRaiderInnerStat]): 안쪽 지역 효과 배치 정보
+        outer_effects (dict[int, str], optional): 바깥쪽 지역 번호(0~7)별 효과 이름
+
+    Returns:
+        list[float]: 지역 번호별 가중치
+    """
+
+    result = [0.0] * (2 * REGION_COUNT)
+    for stat in inner_stats:
+        result[int(stat.stat_field_id)] = weights.get(stat.stat_field_effect, 0.0)
+    for region, effect in (outer_effects or {}).items():
+        result[REGION_COUNT + region] = weights.get(effect, 0.0)
+    return result
+
+
+def _adjacent(mask: int) -> int:
+    return (
+        ((mask << 1) & ~_LEFT_COLUMN)
+        | ((mask >> 1) & ~_RIGHT_COLUMN)
+        | ((mask << BOARD_WIDTH) & _FULL_MASK)
+        | (mask >> BOARD_WIDTH)
+    )
+
+
+class RaiderMember(BaseModel):
+    """배치할 공격대원
+
+    Attributes:
+        type: 블록 모양 (전사, 마법사, 궁수, 도적, 해적, 메이플M, 하이브리드)
+        character_class: 캐릭터 직업
+        level: 캐릭터 레벨
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    type: str
+    character_class: str = ""
+    level: int
+
+    @classmethod
+    def from_block(cls, block: UnionRaiderBlock) -> RaiderMember:
+        return cls(
+            type=block.type,
+            character_class=block.character_class,
+            level=int(block.level),
+        )
+
+    @property
+    def shape(self) -> str | None:
+        return block_shape(self.type, self.level)
+
+
+class UnionPlacement(BaseModel):
+    """유니온 공격대원 배치 결과
+
+    Attributes:
+        score: 배치한 칸의 가중치 합
+        blocks: 배치한 블록 정보
+        unplaced: 배치하지 못한 공격대원
+        complete: 시간 제한 안에 탐색을 마쳐 최적 배치임이 보장되는지 여부
+    """
+
+    score: float
+    blocks: list[UnionRaiderBlock]
+    unplaced: list[RaiderMember]
+    complete: bool
+
+    @property
+    def board(self) -> UnionBoard:
+        return UnionBoard(self.blocks)
+
+
+class _Timeout(Exception):
+    pass
+
+
+class _Search:
+    """분기 한정법으로 블록 배치를 탐색합니다.
+
+    노드마다 남은 블록 모양 중 하나를 골라 이미 놓인 블록과 맞닿는 위치에 놓습니다. 놓는 순서를 고정하지 않으므로
+    중앙 칸을 덮는 연결된 모든 배치를 탐색합니다. 점수는 점령한 칸에만 의존하므로,
+    (점령한 칸, 모양별 남은 블록 수)가 같은 상태는 한 번만 탐색합니다.
+
+    블록 모양마다 후보 배치를 가중치 합의 내림차순으로 정렬해 두고, 현재 점수와 남은 점수의 상한의 합이
+    지금까지 찾은 최고 점수를 넘지 못하면 탐색을 중단합니다. 남은 점수의 상한은 남은 블록별 최대 점수의 합과,
+    빈 칸 중 가중치가 큰 칸부터 남은 블록의 칸 수만큼 채운 점수 중 작은 값입니다.
+    """
+
+    def __init__(
+        self,
+        candidates: list[list[tuple[float, int]]],
+        sizes: list[int],
+        counts: list[int],
+        regions: list[tuple[float, int]],
+    ):
+        self.candidates = candidates
+        self.sizes = sizes
+        self.counts = counts
+        self.best_gains = [
+            max(group[0][0], 0.0) if group else 0.0 for group in candidates
+        ]
+        self.regions = sorted(
+            (region for region in regions if region[0] > 0), key=lambda r: -r[0]
+        )
+
+    def _free_cell_bound(self, occupied: int, cells_left: int) -> float:
+        bound = 0.0
+        for weight, mask in self.regions:
+            if cells_left <= 0:
+                break
+            free = min((mask & ~occupied).bit_count(), cells_left)
+            bound += weight * free
+            cells_left -= free
+        return bound
+
+    def first_moves(self) -> list[tuple[int, int]]:
+        """첫 블록으로 놓을 수 있는 (블록 모양 번호, 후보 번호) 목록"""
+
+        return [
+            (g, k)
+            for g, group in enumerate(self.candidates)
+            for k, (_, mask) in enumerate(group)
+            if mask & CENTER_MASK
+        ]
+
+    def run(
+        self, first: list[tuple[int, int]] | None, time_budget: float
+    ) -> tuple[float, list[tuple[int, int]], bool]:
+        self.first = first
+        self.deadline = time.monotonic() + time_budget
+        self.nodes = 0
+        self.visited: set[tuple[int, tuple[int, ...]]] = set()
+        self.remaining = list(self.counts)
+        self.chosen: list[tuple[int, int]] = []
+        self.best_score, self.best = 0.0, []
+
+        try:
+            self._visit(0, 0.0)
+        except _Timeout:
+            return self.best_score, self.best, False
+        return self.best_score, self.best, True
+
+    def _visit(self, occupied: int, score: float) -> None:
+        self.nodes += 1
+        if (
+            self.nodes % _DEADLINE_CHECK_INTERVAL == 0
+            and time.monotonic() > self.deadline
+        ):
+            raise _Timeout
+
+        # 남은 블록을 놓지 않아도 되므로 모든 노드가 배치 후보입니다.
+        if score > self.best_score:
+            self.best_score, self.best = score, list(self.chosen)
+
+        remaining = self.remaining
+        rest_best = sum(gain * n for gain, n in zip(self.best_gains, remaining))
+        if score + rest_best <= self.best_score:
+            return
+        cells_left = sum(size * n for size, n in zip(self.sizes, remaining))
+        if score + self._free_cell_bound(occupied, cells_left) <= self.best_score:
+            return
+
+        if (key := (occupied, tuple(remaining))) in self.visited:
+            return
+        self.visited.add(key)
+
+        if not occupied and self.first is not None:
+            moves = self.first
+        else:
+            moves = (
+                (g, k)
+                for g, n in enumerate(remaining)
+                if n
+                for k in range(len(self.candidates[g]))
+            )
+
+        frontier = _adjacent(occupied) & ~occupied if occupied else CENTER_MASK
+        exhausted = set()
+        for g, k in moves:
+            if g in exhausted:
+                continue
+            gain, mask = self.candidates[g][k]
+            if score + gain + rest_best - self.best_gains[g] <= self.best_score:
+                # 후보는 가중치 합의 내림차순이므로 이 모양의 남은 후보도 건너뜁니다.
+                exhausted.add(g)
+                continue
+            if mask & occupied or not mask & frontier:
+                continue
+            remaining[g] -= 1
+            self.chosen.append((g, k))
+            self._visit(occupied | mask, score + gain)
+            self.chosen.pop()
+            remaining[g] += 1
+
+
+def _run_search(
+    search: _Search, first: list[tuple[int, int]] | None, time_budget: float
+) -> tuple[float, list[tuple[int, int]], bool]:
+    return search.run(first, time_budget)
+
+
+def optimize_union_placement(
+    members: Iterable[RaiderMember],
+    weights: dict[str, float],
+    inner_stats: Iterable[UnionRaiderInnerStat],
+    outer_effects: dict[int, str] | None = None,
+    time_budget: float = 5.0,
+    max_workers: int = 1,
+) -> UnionPlacement:
+    """지역 효과별 가중치의 합이 가장 큰 공격대원 배치를 찾습니다.
+
+    Args:
+        members (Iterable[RaiderMember]): 배치할 공격대원. 레벨이 낮아 블록이 없는 공격대원은 배치하지 않습니다.
+        weights (dict[str, float]): 효과 이름별 칸 하나의 가중치 (예: {"유니온 공격력": 3, "유니온 STR": 1})
+        inner_stats (Iterable[UnionRaiderInnerStat]): 안쪽 지역 효과 배치 정보
+        outer_effects (dict[int, str], optional): 바깥쪽 지역 번호(0~7)별 효과 이름
+        time_budget (float): 탐색 시간 제한(초). 시간이 지나면 지금까지 찾은 가장 좋은 배치를 반환합니다.
+        max_workers (int): 탐색에 사용할 프로세스 수. 첫 블록의 후보 배치를 나누어 각 프로세스가 탐색합니다.
+
+    Returns:
+        UnionPlacement: 배치 결과
+
+    Raises:
+        ValueError: max_workers가 1보다 작거나 알 수 없는 블록 모양인 경우 발생합니다.
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+
+    regions = list(
+        zip(region_weights(weights, inner_stats, outer_effects), REGION_MASKS)
+    )
+    cell_weights = [0.0] * (BOARD_WIDTH * BOARD_HEIGHT)
+    for weight, mask in regions:
+        for x, y in cells(mask):
+            cell_weights[cell_index(x, y)] = weight
+
+    members = [member for member in members if member.shape is not None]
+    shapes = sorted(
+        {member.shape for member in members},
+        key=lambda shape: (-len(_parse_shape(shape)), shape),
+    )
+
+    candidates = [
+        sorted(
+            (
+                (sum(cell_weights[bit] for bit in bits), mask)
+                for mask, bits in placement_masks(shape)
+            ),
+            key=lambda candidate: -candidate[0],
+        )
+        for shape in shapes
+    ]
+    search = _Search(
+        candidates,
+        [len(_parse_shape(shape)) for shape in shapes],
+        [sum(member.shape == shape for member in members) for shape in shapes],
+        regions,
+    )
+
+    if max_workers == 1 or not members:
+        score, chosen, complete = search.run(None, time_budget)
+    else:
+        first = search.first_moves()
+        chunks = [first[worker::max_workers] for worker in range(max_workers)]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(
+                    _run_search,
+                    [search] * max_workers,
+                    chunks,
+                    [time_budget] * max_workers,
+                )
+            )
+        score, chosen, _ = max(results, key=lambda result: result[0])
+        complete = all(result[2] for result in results)
+
+    # 같은 모양의 공격대원은 서로 바꾸어도 점수가 같으므로 입력 순서대로 배치합니다.
+    waiting = {shape: [] for shape in shapes}
+    for member in members:
+        waiting[member.shape].append(member)
+
+    blocks = []
+    for g, k in chosen:
+        member = waiting[shapes[g]].pop(0)
+        positions = [{"x": x, "y": y} for x, y in cells(candidates[g][k][1])]
+        blocks.append(
+            UnionRaiderBlock.model_validate(
+                {
+                    "block_type": member.type,
+                    "block_class": member.character_class,
+                    "block_level": str(member.level),
+                    "block_control_point": positions[0],
+                    "block_position": positions,
+                }
+            )
+        )
+    left = {id(member) for group in waiting.values() for member in group}
+    unplaced = [member for member in members if id(member) in left]
+
+    return UnionPlacement(
+        score=score, blocks=blocks, unplaced=unplaced, complete=complete
+    )
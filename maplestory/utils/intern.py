@@ -0,0 +1,47 @@
+"""이 모듈은 같은 키의 값을 한 번만 만들어 공유하는 표를 제공합니다.
+
+- `InternTable` 클래스는 키별로 값을 처음 요청될 때 한 번만 만들고, 이후에는 같은 객체를 반환합니다.
+"""
+
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class InternTable(Generic[K, V]):
+    """키별로 값을 한 번만 만들어 공유하는 표
+
+    이미 만든 값은 잠금 없이 조회하고, 처음 보는 키만 잠금 안에서 다시 확인한 뒤 만들므로
+    여러 스레드에서 동시에 요청해도 키마다 값은 하나입니다.
+    `factory`에서 예외가 발생하면 값을 저장하지 않고 예외를 그대로 전달합니다.
+
+    Args:
+        factory (Callable): 키로 값을 만드는 함수입니다. 잠금 안에서 호출되므로 `len(table)`로 순번을 매길 수 있습니다.
+
+    Examples:
+        >>> table = InternTable(str.upper)
+        >>> table.get("str") is table.get("str")
+        True
+        >>> len(table)
+        1
+    """
+
+    def __init__(self, factory: Callable[[K], V]):
+        self.factory = factory
+        self._values: dict[K, V] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: K) -> V:
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+        with self._lock:
+            if key not in self._values:
+                self._values[key] = self.factory(key)
+            return self._values[key]
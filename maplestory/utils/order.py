@@ -0,0 +1,70 @@
+"""이 모듈은 이미 정렬된 데이터를 다시 정렬하지 않도록 돕는 함수를 제공합니다.
+
+- `is_sorted` 함수는 주어진 목록이 정렬되어 있는지 O(n)으로 확인합니다.
+- `sorted_if_needed` 함수는 정렬되어 있지 않은 경우에만 목록을 정렬합니다.
+- `merge_sorted` 함수는 정렬된 여러 목록을 k-way 병합합니다.
+"""
+
+from heapq import merge
+from itertools import pairwise
+from typing import Any, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+KeyFunc = Callable[[T], Any] | None
+
+
+def is_sorted(items: list[T], key: KeyFunc = None) -> bool:
+    """주어진 목록이 오름차순으로 정렬되어 있는지 확인합니다.
+
+    Args:
+        items (list): 확인할 목록입니다.
+        key (Callable, optional): 정렬 기준 값을 반환하는 함수입니다.
+
+    Returns:
+        bool: 정렬되어 있으면 True를 반환합니다.
+
+    Examples:
+        >>> is_sorted([1, 2, 2, 3])
+        True
+        >>> is_sorted(["b", "a"])
+        False
+    """
+
+    keys = items if key is None else map(key, items)
+    return all(a <= b for a, b in pairwise(keys))
+
+
+def sorted_if_needed(items: list[T], key: KeyFunc = None) -> list[T]:
+    """목록이 정렬되어 있지 않은 경우에만 정렬합니다.
+
+    API 응답은 대부분 이미 정렬되어 있으므로, O(n) 확인으로 O(n log n) 정렬을 피합니다.
+
+    Args:
+        items (list): 정렬할 목록입니다.
+        key (Callable, optional): 정렬 기준 값을 반환하는 함수입니다.
+
+    Returns:
+        list: 정렬된 목록입니다. 이미 정렬되어 있으면 주어진 목록을 그대로 반환합니다.
+    """
+
+    return items if is_sorted(items, key) else sorted(items, key=key)
+
+
+def merge_sorted(lists: Iterable[list[T]], key: KeyFunc = None) -> list[T]:
+    """정렬된 여러 목록을 하나의 정렬된 목록으로 병합합니다.
+
+    정렬되지 않은 목록이 있으면 해당 목록만 먼저 정렬합니다.
+
+    Args:
+        lists (Iterable[list]): 병합할 목록들입니다.
+        key (Callable, optional): 정렬 기준 값을 반환하는 함수입니다.
+
+    Returns:
+        list: 병합된 목록입니다.
+
+    Examples:
+        >>> merge_sorted([[1, 4], [2, 3], [5]])
+        [1, 2, 3, 4, 5]
+    """
+
+    return list(merge(*(sorted_if_needed(items, key) for items in lists), key=key))
@@ -0,0 +1,64 @@
+"""이 모듈은 여러 API 요청을 동시에 처리하는 함수를 제공합니다.
+
+- `map_concurrently` 함수는 주어진 함수를 여러 인자에 대해 스레드 풀에서 동시에 실행하고,
+    인자 순서대로 결과를 반환합니다.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_MAX_WORKERS = 8
+
+
+def map_concurrently(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    return_exceptions: bool = False,
+) -> list[R | Exception]:
+    """주어진 함수를 여러 인자에 대해 동시에 실행합니다.
+
+    네트워크 요청은 대부분의 시간을 응답 대기에 사용하므로, 스레드 풀로 요청을 겹쳐서 보냅니다.
+    동시 요청 수는 `max_workers`로 제한되어 API 호출량 제한을 넘지 않도록 조절할 수 있습니다.
+
+    Args:
+        func (Callable): 실행할 함수입니다.
+        items (Iterable): 함수에 전달할 인자 목록입니다.
+        max_workers (int, optional): 최대 동시 실행 수입니다. 기본값은 8입니다.
+        return_exceptions (bool, optional): True이면 예외를 발생시키지 않고 결과 목록에 담아 반환합니다.
+
+    Returns:
+        list: 인자 순서대로 정렬된 실행 결과 목록입니다.
+
+    Raises:
+        ValueError: max_workers가 1보다 작은 경우 발생합니다.
+        Exception: return_exceptions가 False이고 실행 중 예외가 발생한 경우, 첫 번째 예외를 다시 발생시킵니다.
+
+    Examples:
+        >>> map_concurrently(get_character_id, ["아델", "온앤온"])
+        ['...', '...']
+    """
+
+    if max_workers < 1:
+        raise ValueError("max_workers must be greater than 0")
+
+    items = list(items)
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+
+    results = []
+    for future in futures:
+        if (error := future.exception()) is not None:
+            if not return_exceptions:
+                raise error
+            results.append(error)
+        else:
+            results.append(future.result())
+
+    return results
@@ -0,0 +1,47 @@
+"""이 모듈은 파일로 저장하는 상태와 집계 색인이 함께 쓰는 함수를 제공합니다.
+
+- `write_atomic` 함수는 임시 파일에 쓴 뒤 교체하여, 저장 중 중단되어도 이전 파일이 깨지지 않도록 합니다.
+- `ensure_disjoint` 함수는 병합할 두 색인이 같은 데이터를 이미 포함하고 있지 않은지 확인합니다.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Iterable
+
+
+def write_atomic(path: str | Path, text: str) -> None:
+    """파일을 교체 방식으로 저장합니다.
+
+    같은 디렉터리의 `{파일 명}.tmp`에 먼저 쓰고 `os.replace`로 바꾸므로,
+    저장 중 중단되면 이전 파일이 그대로 남습니다.
+
+    Args:
+        path (str | Path): 파일 경로
+        text (str): 저장할 내용 (UTF-8)
+    """
+
+    path = Path(path)
+    temp_path = path.with_name(f"{path.name}.tmp")
+    temp_path.write_text(text, encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def ensure_disjoint(overlaps: Iterable[Any], unit: str) -> None:
+    """병합할 두 색인에 함께 포함된 데이터가 없는지 확인합니다.
+
+    Args:
+        overlaps (Iterable): 양쪽 색인에 모두 포함된 범위 (예: 날짜, 순위 구간)
+        unit (str): 오류 메시지에 쓸 범위의 이름
+
+    Raises:
+        ValueError: 양쪽 색인에 모두 포함된 범위가 있는 경우 발생합니다.
+
+    Examples:
+        >>> ensure_disjoint(left.keys() & right.keys(), "date")
+    """
+
+    for overlap in overlaps:
+        raise ValueError(
+            f"Cannot merge indexes that both contain {unit} {overlap}. "
+            "Add the records with update() instead."
+        )
@@ -0,0 +1,111 @@
+import pytest
+
+
+def make_starforce_record(
+    id: str,
+    date_create: str = "2024-02-17T22:22:26.201+09:00",
+    before: int = 9,
+    after: int = 10,
+    result: str = "성공",
+    target_item: str = "이클레틱 파라온",
+    starforce_event_list: list[dict] | None = None,
+) -> dict:
+    return {
+        "id": id,
+        "item_upgrade_result": result,
+        "before_starforce_count": before,
+        "after_starforce_count": after,
+        "starcatch_result": "실패/해제",
+        "superior_item_flag": "슈페리얼 장비 미해당",
+        "destroy_defence": "파괴 방지 미적용",
+        "chance_time": "찬스타임 미적용",
+        "event_field_flag": "파괴 방지 이벤트맵 미적용",
+        "upgrade_item": "",
+        "protect_shield": "프로텍트 실드 미적용/소멸되지 않음",
+        "bonus_stat_upgrade": "보너스 스탯 미적용 아이템",
+        "character_name": "귀농미인",
+        "world_name": "엘리시움",
+        "target_item": target_item,
+        "date_create": date_create,
+        "starforce_event_list": starforce_event_list,
+    }
+
+
+def make_cube_record(
+    id: str,
+    date_create: str = "2024-01-23T17:28:31.000+09:00",
+    cube_type: str = "수상한 큐브",
+    result: str = "실패",
+    before_grade: str = "레어",
+    after_grade: str = "레어",
+    guarantee_count: int = 0,
+    target_item: str = "도미네이터 펜던트",
+    options: list[tuple[str, str]] = (("STR : +6", "레어"), ("DEX : +6", "레어")),
+) -> dict:
+    after_options = [{"value": value, "grade": grade} for value, grade in options]
+    return {
+        "id": id,
+        "character_name": "귀농미인",
+        "date_create": date_create,
+        "cube_type": cube_type,
+        "item_upgrade_result": result,
+        "miracle_time_flag": "이벤트 적용되지 않음",
+        "item_equipment_part": "펜던트",
+        "item_level": 140,
+        "target_item": target_item,
+        "potential_option_grade": after_grade,
+        "additional_potential_option_grade": "레어",
+        "upgrade_guarantee": False,
+        "upgrade_guarantee_count": guarantee_count,
+        "before_potential_option": [],
+        "before_additional_potential_option": [],
+        "after_potential_option": after_options,
+        "after_additional_potential_option": [],
+    }
+
+
+def cursor_of(page_number: int) -> str:
+    return f"{page_number:064d}"
+
+
+class FakeHistoryAPI:
+    """페이지 크기만큼 나눈 히스토리를 cursor로 이어서 반환하는 가짜 API"""
+
+    def __init__(self, records_by_date: dict[str, list[dict]], page_size: int = 2):
+        self.pages = {}
+        self.first_cursor = {}
+        self.calls = []
+        page_number = 0
+        for date, records in records_by_date.items():
+            chunks = [
+                records[i : i + page_size] for i in range(0, len(records), page_size)
+            ] or [[]]
+            self.first_cursor[date] = cursor_of(page_number)
+            for i, chunk in enumerate(chunks):
+                next_cursor = (
+                    cursor_of(page_number + 1) if i < len(chunks) - 1 else None
+                )
+                self.pages[cursor_of(page_number)] = (chunk, next_cursor)
+                page_number += 1
+
+    def __call__(self, history_type, result_count=1000, date=None, page_cursor=None):
+        self.calls.append((date.strftime("%Y-%m-%d") if date else None, page_cursor))
+        cursor = page_cursor or self.first_cursor.get(date.strftime("%Y-%m-%d"))
+        records, next_cursor = self.pages.get(cursor, ([], None))
+        key = f"{getattr(history_type, 'value', history_type)}_history"
+        return {"count": len(records), "next_cursor": next_cursor, key: records}
+
+
+@pytest.fixture
+def fake_history_api():
+    return FakeHistoryAPI
+
+
+@pytest.fixture
+def starforce_record():
+    return make_starforce_record
+
+
+@pytest.fixture
+def cube_record():
+    return make_cube_record
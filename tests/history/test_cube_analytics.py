@@ -0,0 +1,79 @@
+import pytest
+
+from maplestory.models.history import CubeHistoryInfo
+from maplestory.services.cube_analytics import (
+    CubeColumns,
+    TierUpRate,
+    expected_cubes_to_legendary,
+    guarantee_distribution,
+    tier_up_rate,
+    tier_up_rates,
+)
+
+
+@pytest.fixture
+def columns(cube_record):
+    records = [
+        cube_record("c-0", after_grade="에픽", result="성공"),
+        cube_record("c-1", guarantee_count=1),
+        cube_record("c-2", guarantee_count=2),
+        cube_record("c-3", after_grade="유니크", result="성공", guarantee_count=3),
+        cube_record("c-4", cube_type="수상한 에디셔널 큐브", guarantee_count=1),
+    ]
+    records[3]["upgrade_guarantee"] = True
+    records[3]["potential_option_grade"] = "유니크"
+    return CubeColumns.from_history(
+        CubeHistoryInfo.model_validate(record) for record in records
+    )
+
+
+class TestCubeAnalytics:
+    def test_columns(self, columns):
+        assert len(columns) == 5
+        assert columns.cube_types == ["수상한 큐브", "수상한 에디셔널 큐브"]
+        assert list(columns.cube_type) == [0, 0, 0, 0, 1]
+        assert list(columns.from_grade) == [1, 1, 1, 2, 1]
+
+    def test_tier_up_rate(self, columns):
+        rate = tier_up_rate(columns)
+
+        assert rate == TierUpRate(count=5, upgraded=2, guaranteed=1)
+        assert rate.rate == 0.4
+        low, high = rate.confidence_interval
+        assert 0 < low < 0.4 < high < 1
+
+    def test_tier_up_rates(self, columns):
+        assert tier_up_rates(columns, by="cube_type") == {
+            "수상한 큐브": TierUpRate(count=4, upgraded=2, guaranteed=1),
+            "수상한 에디셔널 큐브": TierUpRate(count=1, upgraded=0),
+        }
+        assert tier_up_rates(columns, by="grade") == {
+            "레어": TierUpRate(count=4, upgraded=1),
+            "에픽": TierUpRate(count=1, upgraded=1, guaranteed=1),
+        }
+        with pytest.raises(ValueError):
+            tier_up_rates(columns, by="item_level")
+
+    def test_guarantee_distribution(self, columns):
+        assert guarantee_distribution(columns) == {0: 1, 1: 2, 2: 1, 3: 1}
+
+    def test_empty_rate(self):
+        rate = tier_up_rate(CubeColumns())
+        assert rate.rate == 0.0
+        assert rate.confidence_interval == (0.0, 1.0)
+
+    def test_expected_cubes_to_legendary(self):
+        assert expected_cubes_to_legendary({"에픽": 0.05, "유니크": 0.01}) == {
+            "레전드리": 0.0,
+            "유니크": pytest.approx(100.0),
+            "에픽": pytest.approx(120.0),
+        }
+
+        with_ceiling = expected_cubes_to_legendary(
+            {"유니크": 0.01}, ceilings={"유니크": 10}
+        )
+        assert with_ceiling["유니크"] == pytest.approx((1 - 0.99**10) / 0.01)
+        assert expected_cubes_to_legendary({}, ceilings={"유니크": 214}) == {
+            "레전드리": 0.0,
+            "유니크": 214.0,
+        }
@@ -324,6 +324,35 @@ class TestGetStarforceHistory:
             == "53ea968f49332fa90c402ee39ae75b80fd842dab14be2a956555625b37c97bff"
         )
 
+    def test_malformed_event_list(self, mocker, starforce_record):
+        events = [
+            {
+                "success_rate": "100,?",
+                "cost_discount_rate": "null",
+                "plus_value": "1+1",
+                "starforce_event_range": "전체",
+            }
+        ]
+        mocker.patch(
+            "maplestory.apis.history.fetch_history_page",
+            return_value={
+                "count": 1,
+                "next_cursor": None,
+                "starforce_history": [
+                    starforce_record("s-0", starforce_event_list=events)
+                ],
+            },
+        )
+
+        result = get_starforce_history(date=kst_datetime(2024, 2, 17))
+
+        event = result.history[0].starforce_event_list[0]
+        assert event.success_rate == "100,?"
+        assert event.stars == () and event.success_rates == ()
+        assert event.plus_values == ()
+        assert result.history[0].applied_events == []
+        assert event.success_rate_at(10) is None
+
 
 class TestGetCubeUsageHistory:
     # Should return a CubeHistory object
@@ -529,3 +558,77 @@ class TestGetPotentialHistory:
     def test_invalid_arguments_date_and_cursor(self):
         with pytest.raises(APIError, match="Please input valid id"):
             get_potential_history(date=datetime(2022, 1, 1), page_cursor="abc123")
+
+
+class TestPotentialOption:
+    def test_parsed_values(self):
+        option = PotentialOption(value="최대 HP : +5%", grade="에픽")
+
+        assert option.name == "최대 HP"
+        assert option.value == 5
+        assert option.percent is True
+
+        option = PotentialOption(value="올스탯 : +5", grade="레어")
+        assert option.value == 5
+        assert option.percent is False
+
+    def test_value_without_number(self):
+        option = PotentialOption(value="<쓸만한 헤이스트> 스킬 사용 가능", grade="에픽")
+
+        assert option.name == "<쓸만한 헤이스트> 스킬 사용 가능"
+        assert option.value is None
+
+        option = PotentialOption(
+            value="모든 스킬의 재사용 대기시간 : -2초(10초 이하는 5%씩 감소, 5초 미만으로 감소 불가)",
+            grade="레전드리",
+        )
+        assert option.value == -2
+
+    def test_shared_parse_result(self):
+        first = PotentialOption(value="STR : +12%", grade="유니크")
+        second = PotentialOption(value="STR : +12%", grade="레전드리")
+
+        assert first.option_id == second.option_id
+        assert (
+            first.option_id
+            != PotentialOption(value="DEX : +12%", grade="유니크").option_id
+        )
+
+    def test_history_shares_options(self):
+        option = {"value": "데미지 : +6%", "grade": "에픽"}
+        first, second = (
+            CubeHistory.model_validate(
+                {
+                    "count": 1,
+                    "next_cursor": None,
+                    "cube_history": [
+                        {
+                            "id": history_id,
+                            "character_name": "귀농남친",
+                            "date_create": "2024-01-23T21:56:29.737+09:00",
+                            "cube_type": "수상한 에디셔널 큐브",
+                            "item_upgrade_result": "실패",
+                            "miracle_time_flag": "이벤트 적용되지 않음",
+                            "item_equipment_part": "보조무기",
+                            "item_level": 100,
+                            "target_item": "에레브의 광휘",
+                            "potential_option_grade": "에픽",
+                            "additional_potential_option_grade": "에픽",
+                            "upgrade_guarantee": False,
+                            "upgrade_guarantee_count": 0,
+                            "before_potential_option": [],
+                            "before_additional_potential_option": [option],
+                            "after_potential_option": [],
+                            "after_additional_potential_option": [option],
+                        }
+                    ],
+                }
+            ).history[0]
+            for history_id in ("a", "b")
+        )
+
+        assert first.after_additional_potential_option[0] == PotentialOption(**option)
+        assert (
+            first.after_additional_potential_option[0]
+            is second.before_additional_potential_option[0]
+        )
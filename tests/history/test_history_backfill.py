@@ -0,0 +1,98 @@
+import pytest
+
+import maplestory.utils.kst as kst
+from maplestory.enums import HistoryTypeEnum
+from maplestory.services.history import BackfillCheckpoint, backfill_history
+
+MODULE = "maplestory.services.history"
+
+
+@pytest.fixture
+def records_by_date(starforce_record):
+    return {
+        "2024-02-17": [starforce_record(f"17-{i}") for i in range(5)],
+        "2024-02-18": [],
+        "2024-02-19": [starforce_record(f"19-{i}") for i in range(3)],
+    }
+
+
+class TestBackfillHistory:
+    def test_fetches_every_day(self, mocker, fake_history_api, records_by_date):
+        api = fake_history_api(records_by_date)
+        mocker.patch(f"{MODULE}.fetch_history_page", side_effect=api)
+        received = {}
+
+        counts = backfill_history(
+            "starforce",
+            lambda day, records: received.setdefault(day, []).extend(records),
+            start_date=kst.datetime(2024, 2, 17),
+            end_date=kst.datetime(2024, 2, 19),
+        )
+
+        assert counts == {"2024-02-17": 5, "2024-02-18": 0, "2024-02-19": 3}
+        assert [r.id for r in received["2024-02-17"]] == [f"17-{i}" for i in range(5)]
+        assert [r.id for r in received["2024-02-19"]] == [f"19-{i}" for i in range(3)]
+        assert len(api.calls) == 3 + 1 + 2
+
+    def test_resumes_from_checkpoint(
+        self, mocker, tmp_path, fake_history_api, records_by_date
+    ):
+        api = fake_history_api(records_by_date)
+        mocker.patch(f"{MODULE}.fetch_history_page", side_effect=api)
+        checkpoint_path = tmp_path / "starforce.json"
+        received = []
+
+        def failing_sink(day, records):
+            if any(record.id == "17-2" for record in records):
+                raise ConnectionError("interrupted")
+            received.extend(record.id for record in records)
+
+        with pytest.raises(ConnectionError):
+            backfill_history(
+                "starforce",
+                failing_sink,
+                start_date=kst.datetime(2024, 2, 17),
+                end_date=kst.datetime(2024, 2, 19),
+                checkpoint_path=checkpoint_path,
+            )
+
+        checkpoint = BackfillCheckpoint.load(checkpoint_path, "starforce")
+        assert checkpoint.cursors["2024-02-17"] == f"{1:064d}"
+        assert checkpoint.is_done("2024-02-19")
+
+        api.calls.clear()
+        counts = backfill_history(
+            "starforce",
+            lambda day, records: received.extend(record.id for record in records),
+            start_date=kst.datetime(2024, 2, 17),
+            end_date=kst.datetime(2024, 2, 19),
+            checkpoint_path=checkpoint_path,
+        )
+
+        assert counts == {"2024-02-17": 3, "2024-02-18": 0, "2024-02-19": 0}
+        assert api.calls == [(None, f"{1:064d}"), (None, f"{2:064d}")]
+        assert sorted(received) == sorted(
+            [f"17-{i}" for i in range(5)] + [f"19-{i}" for i in range(3)]
+        )
+        assert all(
+            BackfillCheckpoint.load(checkpoint_path, "starforce").is_done(day)
+            for day in records_by_date
+        )
+
+    def test_checkpoint_type_mismatch(self, tmp_path):
+        path = tmp_path / "cube.json"
+        BackfillCheckpoint(history_type=HistoryTypeEnum.CUBE).save(path)
+
+        with pytest.raises(ValueError):
+            BackfillCheckpoint.load(path, "starforce")
+
+    def test_invalid_range(self):
+        with pytest.raises(ValueError):
+            backfill_history(
+                "starforce",
+                print,
+                start_date=kst.datetime(2024, 2, 19),
+                end_date=kst.datetime(2024, 2, 17),
+            )
+        with pytest.raises(ValueError):
+            backfill_history("potential", print, start_date=kst.datetime(2024, 1, 1))
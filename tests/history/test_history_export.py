@@ -0,0 +1,108 @@
+import csv
+import gzip
+import json
+
+import pytest
+
+import maplestory.utils.kst as kst
+from maplestory.models.history import CubeHistoryInfo, StarforceHistoryInfo
+from maplestory.services.history_export import (
+    export_csv,
+    export_history,
+    export_jsonl,
+    flatten_history,
+    history_columns,
+)
+
+EVENT = {
+    "success_rate": "null",
+    "cost_discount_rate": "30",
+    "plus_value": "null",
+    "starforce_event_range": "0~24",
+}
+
+
+@pytest.fixture
+def cube_infos(cube_record):
+    return [CubeHistoryInfo.model_validate(cube_record(f"c-{i}")) for i in range(3)]
+
+
+class TestFlattenHistory:
+    def test_cube_columns(self, cube_infos):
+        row = flatten_history(cube_infos[0])
+
+        assert row["after_potential_option_1"] == "STR : +6"
+        assert row["after_potential_option_2_grade"] == "레어"
+        assert "after_potential_option_3" not in row
+        assert row["date_create"] == "2024-01-23T17:28:31+09:00"
+        assert set(row) <= set(history_columns("cube"))
+
+    def test_starforce_events(self, starforce_record):
+        info = StarforceHistoryInfo.model_validate(
+            starforce_record("s-0", starforce_event_list=[EVENT])
+        )
+        row = flatten_history(info)
+
+        assert json.loads(row["starforce_event_list"])[0]["starforce_event_range"] == (
+            "0~24"
+        )
+        assert set(row) == set(history_columns("starforce"))
+
+    def test_alias_columns(self, tmp_path, starforce_record):
+        info = StarforceHistoryInfo.model_validate(starforce_record("s-0"))
+        csv_path, jsonl_path = tmp_path / "sf.csv", tmp_path / "sf.jsonl"
+        export_csv([info], csv_path, "starforce")
+        export_jsonl([info], jsonl_path)
+
+        with open(csv_path, encoding="utf-8", newline="") as file:
+            columns = csv.DictReader(file).fieldnames
+        assert "destroy_defence" in columns
+        assert "destroy_defense" not in columns
+        assert set(columns) == set(json.loads(jsonl_path.read_text(encoding="utf-8")))
+
+
+class TestExport:
+    def test_jsonl(self, tmp_path, cube_infos):
+        path = tmp_path / "cube.jsonl"
+
+        assert export_jsonl(iter(cube_infos), path) == 3
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["id"] for line in lines] == ["c-0", "c-1", "c-2"]
+        assert CubeHistoryInfo.model_validate_json(lines[0]) == cube_infos[0]
+
+    def test_gzip_csv(self, tmp_path, cube_infos):
+        path = tmp_path / "cube.csv.gz"
+
+        assert export_csv(iter(cube_infos), path, "cube") == 3
+        with gzip.open(path, "rt", encoding="utf-8", newline="") as file:
+            rows = list(csv.DictReader(file))
+        assert [row["id"] for row in rows] == ["c-0", "c-1", "c-2"]
+        assert rows[0]["after_potential_option_1"] == "STR : +6"
+        assert rows[0]["before_potential_option_1"] == ""
+
+    def test_export_history(self, mocker, tmp_path, fake_history_api, cube_record):
+        api = fake_history_api(
+            {
+                "2024-01-23": [cube_record(f"23-{i}") for i in range(3)],
+                "2024-01-24": [cube_record("24-0")],
+            }
+        )
+        mocker.patch("maplestory.services.history.fetch_history_page", side_effect=api)
+        path = tmp_path / "cube.jsonl.gz"
+
+        count = export_history(
+            "cube", path, [kst.datetime(2024, 1, 23), kst.datetime(2024, 1, 24)]
+        )
+
+        assert count == 4
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            assert [json.loads(line)["id"] for line in file] == [
+                "23-0",
+                "23-1",
+                "23-2",
+                "24-0",
+            ]
+
+    def test_invalid_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            export_history("cube", tmp_path / "cube.xml", [], format="xml")
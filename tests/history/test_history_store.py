@@ -0,0 +1,75 @@
+import pytest
+
+from maplestory.models.history import CubeHistoryInfo
+from maplestory.models.history.potential import PotentialHistoryInfo
+from maplestory.services.history_store import GradeUpRate, PotentialHistoryStore
+
+
+@pytest.fixture
+def cube_infos(cube_record):
+    return [
+        CubeHistoryInfo.model_validate(cube_record("c-0", result="성공")),
+        CubeHistoryInfo.model_validate(cube_record("c-1")),
+        CubeHistoryInfo.model_validate(
+            cube_record(
+                "c-2",
+                cube_type="수상한 에디셔널 큐브",
+                options=[("데미지 : +6%", "에픽"), ("STR : +6", "레어")],
+            )
+        ),
+    ]
+
+
+@pytest.fixture
+def potential_info(cube_record):
+    record = cube_record("p-0", result="성공")
+    del record["cube_type"]
+    record["potential_type"] = "잠재능력 재설정"
+    return PotentialHistoryInfo.model_validate(record)
+
+
+class TestPotentialHistoryStore:
+    def test_insert_is_idempotent(self, cube_infos, potential_info):
+        with PotentialHistoryStore() as store:
+            assert store.insert(iter(cube_infos), batch_size=2) == 3
+            assert store.insert(cube_infos + [potential_info]) == 1
+            assert len(store) == 4
+            assert store.query("SELECT COUNT(*) FROM options") == [(8,)]
+
+    def test_grade_up_rate(self, cube_infos, potential_info):
+        with PotentialHistoryStore() as store:
+            store.insert(cube_infos + [potential_info])
+
+            assert store.grade_up_rate("cube_type", kind="cube") == [
+                GradeUpRate(key="수상한 에디셔널 큐브", count=1, upgraded=0),
+                GradeUpRate(key="수상한 큐브", count=2, upgraded=1),
+            ]
+            assert store.grade_up_rate("kind")[1].key == "potential"
+            (miracle,) = store.grade_up_rate("miracle_time")
+            assert miracle.key is False
+            assert miracle.rate == 0.5
+
+    def test_option_counts(self, cube_infos):
+        with PotentialHistoryStore() as store:
+            store.insert(cube_infos)
+
+            assert store.option_counts() == {
+                "STR : +6": 3,
+                "DEX : +6": 2,
+                "데미지 : +6%": 1,
+            }
+            assert store.option_counts(grade="에픽") == {"데미지 : +6%": 1}
+            assert store.option_counts(stage="before") == {}
+
+    def test_persists_to_file(self, tmp_path, cube_infos):
+        path = tmp_path / "history.db"
+        with PotentialHistoryStore(path) as store:
+            store.insert(cube_infos)
+
+        with PotentialHistoryStore(path) as store:
+            assert len(store) == 3
+
+    def test_invalid_group_column(self):
+        with PotentialHistoryStore() as store:
+            with pytest.raises(ValueError):
+                store.grade_up_rate("id; DROP TABLE uses")
@@ -0,0 +1,151 @@
+import asyncio
+import types
+
+import pytest
+
+import maplestory.utils.kst as kst
+from maplestory.enums import HistoryTypeEnum
+from maplestory.models.history import CubeHistoryInfo, StarforceHistoryInfo
+from maplestory.services.history import (
+    aiter_starforce_history,
+    fetch_all_history,
+    iter_cube_usage_history,
+    iter_history,
+    iter_starforce_history,
+)
+
+
+@pytest.fixture
+def starforce_api(mocker, fake_history_api, starforce_record):
+    api = fake_history_api(
+        {
+            "2024-02-17": [starforce_record(f"sf-{i}") for i in range(5)],
+            "2024-02-18": [],
+        }
+    )
+    mocker.patch("maplestory.services.history.fetch_history_page", side_effect=api)
+    return api
+
+
+class TestIterHistory:
+    def test_follows_next_cursor(self, starforce_api):
+        stream = iter_starforce_history(date=kst.datetime(2024, 2, 17))
+
+        assert isinstance(stream, types.GeneratorType)
+        records = list(stream)
+        assert [record.id for record in records] == [f"sf-{i}" for i in range(5)]
+        assert all(isinstance(record, StarforceHistoryInfo) for record in records)
+        assert len(starforce_api.calls) == 3
+
+    def test_starts_from_cursor(self, starforce_api):
+        records = list(iter_starforce_history(page_cursor=f"{1:064d}"))
+
+        assert [record.id for record in records] == ["sf-2", "sf-3", "sf-4"]
+
+    def test_empty_day(self, starforce_api):
+        assert list(iter_starforce_history(date=kst.datetime(2024, 2, 18))) == []
+        assert len(starforce_api.calls) == 1
+
+    def test_lazy(self, starforce_api):
+        stream = iter_history("starforce", date=kst.datetime(2024, 2, 17))
+        assert starforce_api.calls == []
+
+        assert next(stream).id == "sf-0"
+        stream.close()
+        assert len(starforce_api.calls) <= 2
+
+    def test_cube_model(self, mocker, fake_history_api, cube_record):
+        api = fake_history_api({"2024-01-23": [cube_record("cube-0")]})
+        mocker.patch("maplestory.services.history.fetch_history_page", side_effect=api)
+
+        records = list(iter_cube_usage_history(date=kst.datetime(2024, 1, 23)))
+
+        assert isinstance(records[0], CubeHistoryInfo)
+
+    def test_invalid_type(self):
+        with pytest.raises(ValueError):
+            next(iter_history("scroll", date=kst.datetime(2024, 2, 17)))
+
+
+class TestAiterHistory:
+    def test_follows_next_cursor(self, starforce_api):
+        async def collect():
+            return [
+                record.id
+                async for record in aiter_starforce_history(
+                    date=kst.datetime(2024, 2, 17)
+                )
+            ]
+
+        assert asyncio.run(collect()) == [f"sf-{i}" for i in range(5)]
+        assert len(starforce_api.calls) == 3
+
+
+class TestFetchAllHistory:
+    @pytest.fixture
+    def apis(self, mocker, fake_history_api, starforce_record, cube_record):
+        def times(prefix, minutes):
+            return [
+                (f"{prefix}-{minute}", f"2024-02-17T10:{minute:02d}:00.000+09:00")
+                for minute in sorted(minutes, reverse=True)
+            ]
+
+        cube_potential = {
+            HistoryTypeEnum.CUBE: times("cube", [1, 4, 5]),
+            HistoryTypeEnum.POTENTIAL: times("potential", [2, 6]),
+        }
+        apis = {
+            HistoryTypeEnum.STARFORCE: fake_history_api(
+                {
+                    "2024-02-17": [
+                        starforce_record(id, date_create=date_create)
+                        for id, date_create in times("starforce", [0, 3, 7])
+                    ]
+                }
+            )
+        }
+        for history_type, items in cube_potential.items():
+            records = []
+            for id, date_create in items:
+                record = cube_record(id, date_create=date_create)
+                if history_type == HistoryTypeEnum.POTENTIAL:
+                    record["potential_type"] = record.pop("cube_type")
+                records.append(record)
+            apis[history_type] = fake_history_api({"2024-02-17": records})
+
+        mocker.patch(
+            "maplestory.services.history.fetch_history_page",
+            side_effect=lambda history_type, *args: apis[history_type](
+                history_type, *args
+            ),
+        )
+        return apis
+
+    def test_merges_by_date_create(self, apis):
+        timeline = fetch_all_history(kst.datetime(2024, 2, 17))
+
+        assert [info.id for info in timeline] == [
+            "starforce-0",
+            "cube-1",
+            "potential-2",
+            "starforce-3",
+            "cube-4",
+            "cube-5",
+            "potential-6",
+            "starforce-7",
+        ]
+        assert {t.value: len(api.calls) for t, api in apis.items()} == {
+            "starforce": 2,
+            "cube": 2,
+            "potential": 1,
+        }
+
+    def test_selected_types(self, apis):
+        timeline = fetch_all_history(kst.datetime(2024, 2, 17), history_types=["cube"])
+
+        assert [info.id for info in timeline] == ["cube-1", "cube-4", "cube-5"]
+        assert apis[HistoryTypeEnum.STARFORCE].calls == []
+
+    def test_unqueryable_date(self, apis):
+        with pytest.raises(ValueError):
+            fetch_all_history(kst.datetime(2023, 1, 1))
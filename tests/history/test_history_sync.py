@@ -0,0 +1,115 @@
+import pytest
+from freezegun import freeze_time
+
+import maplestory.utils.kst as kst
+from maplestory.enums import HistoryTypeEnum
+from maplestory.services.history import HistorySyncState, sync_history
+
+MODULE = "maplestory.services.history"
+DATE = kst.datetime(2024, 2, 17)
+
+
+@pytest.fixture
+def day_records(starforce_record):
+    def records(count: int) -> dict[str, list[dict]]:
+        return {
+            "2024-02-17": [
+                starforce_record(
+                    f"sf-{i}", date_create=f"2024-02-17T10:{i:02d}:00.000+09:00"
+                )
+                for i in reversed(range(count))
+            ]
+        }
+
+    return records
+
+
+class TestSyncHistory:
+    def test_first_sync_fetches_whole_day(self, mocker, fake_history_api, day_records):
+        api = fake_history_api(day_records(5))
+        mocker.patch(f"{MODULE}.fetch_history_page", side_effect=api)
+        state = HistorySyncState()
+        received = []
+
+        count = sync_history("starforce", received.extend, state, date=DATE)
+
+        assert count == 5
+        assert [record.id for record in received] == [f"sf-{i}" for i in range(5)]
+        assert len(api.calls) == 3
+        assert state.markers[HistoryTypeEnum.STARFORCE].id == "sf-4"
+
+    def test_stops_at_known_record(self, mocker, fake_history_api, day_records):
+        mocker.patch(
+            f"{MODULE}.fetch_history_page", side_effect=fake_history_api(day_records(5))
+        )
+        state = HistorySyncState()
+        sync_history("starforce", lambda records: None, state, date=DATE)
+
+        api = fake_history_api(day_records(6))
+        mocker.patch(f"{MODULE}.fetch_history_page", side_effect=api)
+        received = []
+
+        assert sync_history("starforce", received.extend, state, date=DATE) == 1
+        assert [record.id for record in received] == ["sf-5"]
+        assert len(api.calls) == 1
+
+        assert sync_history("starforce", received.extend, state, date=DATE) == 0
+        assert len(received) == 1
+        assert len(api.calls) == 2
+
+    def test_sink_error_keeps_state(
+        self, mocker, tmp_path, fake_history_api, day_records
+    ):
+        mocker.patch(
+            f"{MODULE}.fetch_history_page", side_effect=fake_history_api(day_records(3))
+        )
+        state_path = tmp_path / "sync.json"
+        state = HistorySyncState.load(state_path)
+
+        def failing_sink(records):
+            raise ConnectionError("interrupted")
+
+        with pytest.raises(ConnectionError):
+            sync_history("starforce", failing_sink, state, date=DATE)
+        assert state.markers == {}
+
+        received = []
+        sync_history(
+            "starforce", received.extend, state, date=DATE, state_path=state_path
+        )
+
+        assert len(received) == 3
+        loaded = HistorySyncState.load(state_path)
+        assert loaded.markers[HistoryTypeEnum.STARFORCE].id == "sf-2"
+
+    # 2024-02-18 00:30 KST
+    @freeze_time("2024-02-17 15:30:00")
+    def test_crosses_midnight(self, mocker, fake_history_api, starforce_record):
+        def record(i, date_create):
+            return starforce_record(f"sf-{i}", date_create=date_create)
+
+        earlier = [record(i, f"2024-02-17T10:{i:02d}:00.000+09:00") for i in range(5)]
+        mocker.patch(
+            f"{MODULE}.fetch_history_page",
+            side_effect=fake_history_api({"2024-02-17": earlier[::-1]}),
+        )
+        state = HistorySyncState()
+        sync_history("starforce", lambda records: None, state, date=DATE)
+
+        late = [
+            record(5, "2024-02-17T23:50:00.000+09:00"),
+            record(6, "2024-02-17T23:59:00.000+09:00"),
+        ]
+        api = fake_history_api(
+            {
+                "2024-02-17": (earlier + late)[::-1],
+                "2024-02-18": [record(7, "2024-02-18T00:10:00.000+09:00")],
+            }
+        )
+        mocker.patch(f"{MODULE}.fetch_history_page", side_effect=api)
+        received = []
+
+        assert sync_history("starforce", received.extend, state) == 3
+        assert [record.id for record in received] == ["sf-5", "sf-6", "sf-7"]
+        assert [date for date, _ in api.calls] == ["2024-02-18", "2024-02-17", None]
+        assert state.markers[HistoryTypeEnum.STARFORCE].id == "sf-7"
@@ -0,0 +1,103 @@
+import pytest
+
+from maplestory.models.history import CubeHistoryInfo
+from maplestory.services.option_index import PotentialOptionIndex
+
+CUBE = "수상한 큐브"
+
+
+@pytest.fixture
+def infos(cube_record):
+    records = [
+        cube_record("c-0", options=[("STR : +6", "레어"), ("DEX : +6", "레어")]),
+        cube_record("c-1", options=[("STR : +6", "레어"), ("STR : +6", "레어")]),
+        cube_record(
+            "c-2",
+            cube_type="수상한 에디셔널 큐브",
+            options=[("데미지 : +6%", "에픽")],
+        ),
+    ]
+    records[2]["after_additional_potential_option"] = records[2].pop(
+        "after_potential_option"
+    )
+    records[2]["after_potential_option"] = []
+    records[2]["additional_potential_option_grade"] = "에픽"
+    return [CubeHistoryInfo.model_validate(record) for record in records]
+
+
+class TestPotentialOptionIndex:
+    def test_counts(self, infos):
+        index = PotentialOptionIndex().update(infos)
+
+        assert index.count("STR : +6", CUBE, "펜던트", 140) == 3
+        assert index.count("STR : +6", CUBE, "펜던트", 145, position=2) == 1
+        assert index.count("STR : +6", CUBE, "펜던트", 140, grade="에픽") == 0
+        assert index.total(CUBE, "펜던트", 140) == 4
+        assert index.frequency("DEX : +6", CUBE, "펜던트", 140) == 0.25
+        assert index.frequency("DEX : +6", CUBE, "펜던트", 200) == 0.0
+        assert index.most_common(CUBE, "펜던트", 140, n=1) == [("STR : +6", 3)]
+        assert index.count("데미지 : +6%", "수상한 에디셔널 큐브", "펜던트", 140) == 1
+
+    def test_merge(self, cube_record, infos):
+        next_day = CubeHistoryInfo.model_validate(
+            cube_record("d-0", date_create="2024-01-24T09:00:00.000+09:00")
+        )
+        first = PotentialOptionIndex().update(infos)
+        second = PotentialOptionIndex().update([next_day])
+
+        merged = first.merge(second)
+
+        assert merged.cells == PotentialOptionIndex().update([*infos, next_day]).cells
+        assert set(merged.markers) == {"2024-01-23", "2024-01-24"}
+        with pytest.raises(ValueError):
+            merged.merge(PotentialOptionIndex(level_bucket_size=5))
+        with pytest.raises(ValueError, match="2024-01-23"):
+            merged.merge(PotentialOptionIndex().update(infos[:1]))
+        assert merged.count("STR : +6", CUBE, "펜던트", 140) == 4
+
+    def test_duplicate_pages(self, cube_record, infos):
+        index = PotentialOptionIndex().update(infos)
+
+        assert index.update(infos) is index
+        assert index.count("STR : +6", CUBE, "펜던트", 140) == 3
+        assert index.total(CUBE, "펜던트", 140) == 4
+        assert index.add(infos[0]) is False
+
+        # 같은 날짜를 다시 색인하면 마지막으로 색인한 히스토리 이후의 히스토리만 더합니다.
+        later = CubeHistoryInfo.model_validate(
+            cube_record("c-3", date_create="2024-01-23T18:00:00.000+09:00")
+        )
+        index.update([later, *infos])
+        assert index.count("STR : +6", CUBE, "펜던트", 140) == 4
+        assert index.markers["2024-01-23"][1] == "c-3"
+
+    def test_failed_update_keeps_index(self, infos):
+        index = PotentialOptionIndex()
+
+        def interrupted():
+            yield from infos[:2]
+            raise ConnectionError("interrupted")
+
+        with pytest.raises(ConnectionError):
+            index.update(interrupted())
+        assert index.cells == {} and index.markers == {}
+
+        index.update(infos)
+        assert index.count("STR : +6", CUBE, "펜던트", 140) == 3
+
+    def test_persist(self, tmp_path, infos):
+        path = tmp_path / "options.json"
+        assert PotentialOptionIndex.load(path).cells == {}
+
+        PotentialOptionIndex(level_bucket_size=5).update(infos).save(path)
+        loaded = PotentialOptionIndex.load(path)
+
+        assert list(tmp_path.iterdir()) == [path]
+        assert loaded.level_bucket_size == 5
+        assert loaded.cells == PotentialOptionIndex(5).update(infos).cells
+        assert loaded.count("STR : +6", CUBE, "펜던트", 140) == 3
+        assert loaded.add(infos[0]) is False
+        assert loaded.markers == PotentialOptionIndex(5).update(infos).markers
+
+        with pytest.raises(ValueError):
+            PotentialOptionIndex.load(path, level_bucket_size=10)
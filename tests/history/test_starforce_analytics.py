@@ -0,0 +1,92 @@
+import pytest
+
+from maplestory.models.history import StarforceHistoryEvent, StarforceHistoryInfo
+from maplestory.services.starforce_analytics import (
+    StarforceOutcome,
+    expected_meso_cost,
+    starforce_cost,
+    starforce_outcomes,
+)
+
+EVENT = {
+    "success_rate": "100,100,100",
+    "cost_discount_rate": "null",
+    "plus_value": "null",
+    "starforce_event_range": "5,10,15",
+}
+
+
+@pytest.fixture
+def records(starforce_record):
+    raw = [
+        starforce_record("a", before=15, after=16),
+        starforce_record("b", before=15, after=15, result="실패(유지)"),
+        starforce_record("c", before=15, after=12, result="파괴"),
+        starforce_record("d", before=16, after=15, result="실패(하락)"),
+        starforce_record("e", before=10, after=11, starforce_event_list=[EVENT]),
+    ]
+    raw[0]["starcatch_result"] = "성공"
+    return [StarforceHistoryInfo.model_validate(record) for record in raw]
+
+
+class TestStarforceHistoryEvent:
+    def test_parsed_lists(self):
+        event = StarforceHistoryEvent.model_validate(EVENT)
+
+        assert event.success_rates == (100, 100, 100)
+        assert event.plus_values == ()
+        assert event.stars == (5, 10, 15)
+        assert event.applies_to(10)
+        assert not event.applies_to(11)
+        assert event.success_rate_at(15) == 100
+        assert event.success_rate_at(11) is None
+
+    def test_star_range(self):
+        event = StarforceHistoryEvent.model_validate(
+            {
+                "success_rate": "null",
+                "cost_discount_rate": "30",
+                "plus_value": "null",
+                "starforce_event_range": "0~24",
+            }
+        )
+
+        assert event.stars == tuple(range(25))
+        assert event.success_rates == ()
+        assert event.cost_discount_rate == 0.3
+
+
+class TestStarforceOutcomes:
+    def test_by_star(self, records):
+        outcomes = starforce_outcomes(records)
+
+        assert list(outcomes) == [10, 15, 16]
+        assert outcomes[15] == StarforceOutcome(attempts=3, success=1, destroyed=1)
+        assert outcomes[15].fail == 1
+        assert outcomes[15].destroy_rate == pytest.approx(1 / 3)
+        assert outcomes[16].fail_rate == 1.0
+
+    def test_by_multiple_keys(self, records):
+        outcomes = starforce_outcomes(records, by=("before_starforce_count", "event"))
+
+        assert outcomes[(10, True)] == StarforceOutcome(attempts=1, success=1)
+        assert starforce_outcomes(records, by="starcatch")[True].success_rate == 1.0
+
+    def test_unknown_key(self, records):
+        with pytest.raises(ValueError):
+            starforce_outcomes(records, by="world_name")
+
+
+class TestStarforceCost:
+    def test_cost(self):
+        assert starforce_cost(160, 0) == 164800
+        assert starforce_cost(160, 17) == int(
+            (1000 + 160**3 * 18**2.7 / 200) // 100 * 100
+        )
+        assert starforce_cost(160, 0, discount_rate=0.3) == int(164800 * 0.7)
+
+    def test_expected_meso_cost(self, records):
+        expected = expected_meso_cost(starforce_outcomes(records), item_level=160)
+
+        assert set(expected) == {10, 15}
+        assert expected[15] == pytest.approx(starforce_cost(160, 15) * 3)
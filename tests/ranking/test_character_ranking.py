@@ -0,0 +1,97 @@
+import pytest
+
+import maplestory.utils.kst as kst
+from maplestory.enums import CharacterRankTypeEnum
+from maplestory.models.ranking import OverallRanking, UnionRanking
+from maplestory.services.rankings.character import CharacterRank, get_character_ranks
+
+MODULE = "maplestory.services.rankings.character"
+
+
+def fake_character_id(character_name: str) -> str:
+    if character_name == "뷁뷁":
+        raise ValueError("Please input valid character name")
+    return f"ocid-{character_name}"
+
+
+def fake_overall_ranking(character_id: str, date) -> OverallRanking:
+    name = character_id.removeprefix("ocid-")
+    return OverallRanking.model_validate(
+        {
+            "ranking": [
+                {
+                    "date": "2024-02-27",
+                    "ranking": len(name),
+                    "character_name": name,
+                    "world_name": "스카니아",
+                    "class_name": "전사",
+                    "sub_class_name": "히어로",
+                    "character_level": 260,
+                    "character_exp": 0,
+                    "character_popularity": 0,
+                    "character_guildname": None,
+                }
+            ]
+        }
+    )
+
+
+def fake_union_ranking(character_id: str, date) -> UnionRanking:
+    if character_id == "ocid-르샹쥬":
+        raise RuntimeError("Please wait until the data is ready")
+    return UnionRanking(ranking=[])
+
+
+@pytest.fixture
+def mock_apis(mocker):
+    mocker.patch(f"{MODULE}.get_character_id", side_effect=fake_character_id)
+    mocker.patch(
+        f"{MODULE}.get_overall_ranking_by_id", side_effect=fake_overall_ranking
+    )
+    mocker.patch(f"{MODULE}.get_union_ranking_by_id", side_effect=fake_union_ranking)
+
+
+class TestGetCharacterRanks:
+    # Returns one row per unique character name, in input order
+    def test_rows_in_input_order(self, mock_apis):
+        rows = get_character_ranks(
+            ["온앤온", "아델", "온앤온"],
+            rank_types=["overall"],
+            date=kst.datetime(2024, 2, 27),
+        )
+
+        assert [row.character_name for row in rows] == ["온앤온", "아델"]
+        assert all(isinstance(row, CharacterRank) for row in rows)
+        assert rows[0].ocid == "ocid-온앤온"
+        assert rows[0].overall.character_name == "온앤온"
+        assert rows[1].overall.ranking == 2
+        assert rows[0].union is None
+        assert all(row.ok for row in rows)
+
+    # Records ocid lookup failures per row without failing the whole batch
+    def test_ocid_error(self, mock_apis):
+        rows = get_character_ranks(
+            ["뷁뷁", "아델"], rank_types=[CharacterRankTypeEnum.종합]
+        )
+
+        assert rows[0].ok is False
+        assert rows[0].ocid is None
+        assert "ocid" in rows[0].errors
+        assert rows[1].ok is True
+
+    # Records ranking lookup failures per row and per ranking type
+    def test_ranking_error(self, mock_apis):
+        rows = get_character_ranks(
+            ["르샹쥬", "아델"],
+            rank_types=[CharacterRankTypeEnum.OVERALL, CharacterRankTypeEnum.UNION],
+        )
+
+        assert rows[0].overall.character_name == "르샹쥬"
+        assert rows[0].errors == {"union": "Please wait until the data is ready"}
+        assert rows[1].union is None
+        assert rows[1].ok is True
+
+    # Raises a ValueError for unknown ranking types
+    def test_invalid_rank_type(self, mock_apis):
+        with pytest.raises(ValueError):
+            get_character_ranks(["아델"], rank_types=["unknown"])
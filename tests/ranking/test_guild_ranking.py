@@ -5,12 +5,14 @@ import maplestory.utils.kst as kst
 from maplestory.enums import GuildRankTypeEnum
 from maplestory.models.ranking.guild import (
     AllGuildRankingInfo,
+    GuildRankingInfo,
     GuildRankingTypePoint,
     GuildTypeRanking,
     GuildTypeRankingInfo,
 )
 from maplestory.services.rankings.guild import (
     get_all_type_guild_ranking,
+    get_all_type_guild_rankings,
     get_flag_race_guild_ranking,
     get_guild_ranking,
     get_sewer_guild_ranking,
@@ -417,6 +419,10 @@ class TestGroupByGuild:
         result = group_by_guild(guild_rankings)
         assert result == expected_result
 
+    def test_group_by_guild_is_deprecated(self):
+        with pytest.deprecated_call():
+            group_by_guild([])
+
     # Tests that an empty list of rankings returns an empty dictionary
     def test_group_by_empty_list_returns_empty_dict(self):
         guild_rankings = []
@@ -469,6 +475,122 @@ class TestGetAllTypeGuildRanking:
             get_all_type_guild_ranking(guild=guild, world_name=world_name, date=date)
 
 
+def fake_guild_ranking(ranking_type, world_name, guild, page_number, date):
+    points = {
+        GuildRankTypeEnum.WEEKLY_FAME: [("스카니아", 4288, 11600), ("베라", 10, 99000)],
+        GuildRankTypeEnum.FLAG_RACE: [],
+        GuildRankTypeEnum.SEWER: [("스카니아", 570, 15596)],
+    }[ranking_type]
+    return GuildTypeRanking(
+        ranking=[
+            GuildTypeRankingInfo(
+                date=date,
+                ranking=rank,
+                guild_name=guild,
+                world_name=world,
+                guild_level=11,
+                guild_master_name="온앤온",
+                guild_mark="",
+                guild_point=point,
+                type=ranking_type,
+            )
+            for world, rank, point in points
+            if world_name in (None, world)
+        ]
+    )
+
+
+class TestGuildTypeRankingInfo:
+    def test_from_info_validates_type(self, mocker):
+        info = GuildRankingInfo(
+            date="2024-02-25",
+            ranking=25279,
+            guild_name="온앤온",
+            world_name="스카니아",
+            guild_level=11,
+            guild_master_name="온앤온",
+            guild_mark="",
+            guild_point=11600,
+        )
+
+        dump = mocker.patch.object(
+            GuildRankingInfo, "model_dump", side_effect=AssertionError
+        )
+        typed = GuildTypeRankingInfo.from_info(info, 0)
+        assert dump.call_count == 0
+        assert typed.type is GuildRankTypeEnum.WEEKLY_FAME
+        assert typed.date == info.date
+        assert typed.guild_point == 11600
+
+        result = AllGuildRankingInfo.from_rankings([typed])
+        assert result.weekly_fame == GuildRankingTypePoint(
+            ranking=25279, guild_point=11600
+        )
+
+        with pytest.raises(ValueError):
+            GuildTypeRankingInfo.from_info(info, 9)
+
+
+class TestGetAllTypeGuildRankings:
+    @pytest.fixture
+    def mock_api(self, mocker):
+        return mocker.patch(
+            "maplestory.services.rankings.guild.get_guild_ranking_by_id",
+            side_effect=fake_guild_ranking,
+        )
+
+    def test_groups_by_world(self, mock_api):
+        date = kst.datetime(2024, 2, 25)
+        result = get_all_type_guild_rankings(guild="온앤온", date=date)
+
+        assert mock_api.call_count == 3
+        assert [info.world_name for info in result] == ["베라", "스카니아"]
+
+        bera, scania = result
+        assert scania.weekly_fame == GuildRankingTypePoint(
+            ranking=4288, guild_point=11600
+        )
+        assert scania.flag_race is None
+        assert scania.sewer == GuildRankingTypePoint(ranking=570, guild_point=15596)
+        assert bera.weekly_fame.rank == 10
+        assert bera.sewer is None
+
+    def test_single_guild(self, mock_api):
+        result = get_all_type_guild_ranking(
+            guild="온앤온", world_name="스카니아", date=kst.datetime(2024, 2, 25)
+        )
+
+        assert isinstance(result, AllGuildRankingInfo)
+        assert result.guild_level == 11
+        assert result.weekly_fame.point == 11600
+        assert result.sewer.rank == 570
+
+    def test_follows_full_pages(self, mocker):
+        full_page = fake_guild_ranking(
+            GuildRankTypeEnum.SEWER, "스카니아", "온앤온", 1, kst.datetime(2024, 2, 25)
+        )
+        full_page.ranking *= 200
+        empty_page = GuildTypeRanking(ranking=[])
+        mock_api = mocker.patch(
+            "maplestory.services.rankings.guild.get_guild_ranking_by_id",
+            side_effect=lambda ranking_type, page_number, **kwargs: (
+                full_page
+                if ranking_type == GuildRankTypeEnum.SEWER and page_number == 1
+                else empty_page
+            ),
+        )
+
+        result = get_all_type_guild_rankings(guild="온앤온")
+
+        assert mock_api.call_count == 4
+        assert len(result) == 1
+
+    def test_nonexistent_guild(self, mock_api):
+        assert get_all_type_guild_rankings(guild="온앤온", world_name="루나") == []
+        with pytest.raises(ValidationError):
+            get_all_type_guild_ranking(guild="온앤온", world_name="루나")
+
+
 class TestGetWeeklyFameGuildRanking:
     # Retrieve weekly fame guild ranking for a specific date, world, and page number
     def test_retrieve_weekly_fame_guild_ranking_for_specific_world_and_guild(self):
@@ -1,4 +1,5 @@
 import sys
+from datetime import date as _date
 
 import pytest
 
@@ -7,7 +8,9 @@ from maplestory.enums import NormalWorld, RebootWorld
 from maplestory.error import APIError
 from maplestory.models.ranking.overall import OverallRanking, OverallRankingInfo
 from maplestory.services.rankings.overall import (
+    _get_past_overall_rank_by_id,
     get_character_overall_rank,
+    get_character_overall_rank_history,
     get_job_class_overall_ranking,
     get_normal_world_overall_ranking,
     get_overall_ranking,
@@ -262,3 +265,73 @@ class TestGetCharacterOverallRank:
         date = kst.datetime(2023, 12, 22)  # A date before the character's creation
         rank = get_character_overall_rank(character_name=character_name, date=date)
         assert rank is None
+
+
+def fake_overall_ranking_by_id(character_id: str, date) -> OverallRanking:
+    if date.day == 3:
+        return OverallRanking(ranking=[])
+    return OverallRanking.model_validate(
+        {
+            "ranking": [
+                {
+                    "date": date.strftime("%Y-%m-%d"),
+                    "ranking": 100 - date.day,
+                    "character_name": "온앤온",
+                    "world_name": "스카니아",
+                    "class_name": "전사",
+                    "sub_class_name": "히어로",
+                    "character_level": 260,
+                    "character_exp": date.day,
+                    "character_popularity": 0,
+                    "character_guildname": None,
+                }
+            ]
+        }
+    )
+
+
+class TestGetCharacterOverallRankHistory:
+    @pytest.fixture
+    def mock_apis(self, mocker):
+        _get_past_overall_rank_by_id.cache_clear()
+        module = "maplestory.services.rankings.overall"
+        get_id = mocker.patch(f"{module}.get_character_id", return_value="ocid")
+        get_rank = mocker.patch(
+            f"{module}.get_overall_ranking_by_id",
+            side_effect=fake_overall_ranking_by_id,
+        )
+        yield get_id, get_rank
+        _get_past_overall_rank_by_id.cache_clear()
+
+    def test_compact_arrays(self, mock_apis):
+        get_id, get_rank = mock_apis
+        history = get_character_overall_rank_history(
+            "온앤온", kst.datetime(2024, 1, 1), kst.datetime(2024, 1, 4)
+        )
+
+        assert get_id.call_count == 1
+        assert get_rank.call_count == 4
+        assert len(history) == 4
+        assert history.dates == [_date(2024, 1, day) for day in range(1, 5)]
+        assert history.ranks == [99, 98, None, 96]
+        assert history.levels == [260, 260, None, 260]
+        assert history.exps == [1, 2, None, 4]
+
+    def test_reuses_past_days(self, mock_apis):
+        _, get_rank = mock_apis
+        get_character_overall_rank_history(
+            "온앤온", kst.datetime(2024, 1, 1), kst.datetime(2024, 1, 2)
+        )
+        get_character_overall_rank_history(
+            "온앤온", kst.datetime(2024, 1, 2), kst.datetime(2024, 1, 3)
+        )
+
+        assert get_rank.call_count == 3
+
+    def test_invalid_range(self, mock_apis):
+        with pytest.raises(ValueError):
+            get_character_overall_rank_history(
+                "온앤온", kst.datetime(2024, 1, 2), kst.datetime(2024, 1, 1)
+            )
+        with pytest.raises(ValueError):
+            get_character_overall_rank_history("온앤온", kst.datetime(2023, 1, 1))
@@ -0,0 +1,169 @@
+import pytest
+
+from maplestory.models.ranking import (
+    GuildRanking,
+    OverallRanking,
+    OverallRankingInfo,
+    RankingIndex,
+)
+
+
+def make_overall_info(ranking: int, name: str, **kwargs) -> dict:
+    return {
+        "date": "2024-02-27",
+        "ranking": ranking,
+        "character_name": name,
+        "world_name": kwargs.get("world_name", "스카니아"),
+        "class_name": kwargs.get("class_name", "전사"),
+        "sub_class_name": kwargs.get("sub_class_name", "히어로"),
+        "character_level": kwargs.get("character_level", 250),
+        "character_exp": 0,
+        "character_popularity": 0,
+        "character_guildname": kwargs.get("guild_name"),
+    }
+
+
+@pytest.fixture
+def overall_pages() -> list[OverallRanking]:
+    return [
+        OverallRanking.model_validate(
+            {
+                "ranking": [
+                    make_overall_info(
+                        1, "아델", character_level=290, guild_name="리더"
+                    ),
+                    make_overall_info(
+                        2, "온앤온", world_name="베라", class_name="마법사"
+                    ),
+                ]
+            }
+        ),
+        OverallRanking.model_validate(
+            {
+                "ranking": [
+                    make_overall_info(4, "르샹쥬", character_level=260),
+                    make_overall_info(3, "르샤뜨", guild_name="리더"),
+                    make_overall_info(
+                        5,
+                        "르투이쇼",
+                        world_name="리부트",
+                        character_level=270,
+                        guild_name="리더",
+                    ),
+                ]
+            }
+        ),
+    ]
+
+
+class TestRankingIndex:
+    # Merges pages and keeps the ranking in ascending order
+    def test_from_pages_sorted(self, overall_pages):
+        index = RankingIndex.from_pages(overall_pages)
+
+        assert len(index) == 5
+        assert [info.ranking for info in index] == [1, 2, 3, 4, 5]
+        assert isinstance(index[0], OverallRankingInfo)
+
+    # Looks up a character by name, returning None for unknown names
+    def test_find_character(self, overall_pages):
+        index = RankingIndex.from_pages(overall_pages)
+
+        assert index.find_character("르샹쥬").ranking == 4
+        assert index.find_character("뷁뷁") is None
+
+    # Returns guild members in rank order, optionally filtered by world
+    def test_guild_members(self, overall_pages):
+        index = RankingIndex.from_pages(overall_pages)
+
+        members = index.guild_members("리더")
+        assert [info.character_name for info in members] == [
+            "아델",
+            "르샤뜨",
+            "르투이쇼",
+        ]
+
+        members = index.guild_members("리더", world_name="스카니아")
+        assert [info.character_name for info in members] == ["아델", "르샤뜨"]
+        assert index.guild_members("없는길드") == []
+
+    # Looks up by world and class names
+    def test_by_world_and_class(self, overall_pages):
+        index = RankingIndex.from_pages(overall_pages)
+
+        assert [info.ranking for info in index.by_world("스카니아")] == [1, 3, 4]
+        assert [info.ranking for info in index.by_class("마법사")] == [2]
+
+    # Answers rank and level range queries
+    def test_range_queries(self, overall_pages):
+        index = RankingIndex.from_pages(overall_pages)
+
+        assert [info.ranking for info in index.rank_range(2, 4)] == [2, 3, 4]
+        assert index.rank_range(10, 20) == []
+        assert [info.ranking for info in index.level_range(255, 275)] == [4, 5]
+        assert [info.ranking for info in index.level_range(290, 300)] == [1]
+
+    # Caches facet sets
+    def test_facets(self, overall_pages):
+        index = RankingIndex.from_pages(overall_pages)
+
+        assert index.world_names == {"스카니아", "베라", "리부트"}
+        assert index.class_names == {"전사", "마법사"}
+        assert index.sub_class_names == {"히어로"}
+        assert index.guild_names == {"리더"}
+        assert index.world_names is index.world_names
+
+    # Indexes guild rankings by their guild level
+    def test_guild_ranking(self):
+        ranking = GuildRanking.model_validate(
+            {
+                "ranking": [
+                    {
+                        "date": "2024-02-27",
+                        "ranking": rank,
+                        "guild_name": name,
+                        "world_name": "스카니아",
+                        "guild_level": level,
+                        "guild_master_name": "아델",
+                        "guild_mark": "",
+                        "guild_point": 0,
+                    }
+                    for rank, name, level in [(1, "리더", 30), (2, "온앤온", 11)]
+                ]
+            }
+        )
+        index = RankingIndex.from_pages([ranking])
+
+        assert index.find_character("리더") is None
+        assert index.guild_members("온앤온")[0].ranking == 2
+        assert [info.guild_name for info in index.level_range(20, 30)] == ["리더"]
+
+    # Handles an empty index
+    def test_empty(self):
+        index = RankingIndex([])
+
+        assert len(index) == 0
+        assert index.rank_range(1, 10) == []
+        assert index.level_range(1, 300) == []
+        assert index.world_names == frozenset()
+
+
+class TestRankingModel:
+    # Keeps already sorted pages as they are and sorts unsorted ones
+    def test_model_post_init(self, overall_pages):
+        assert [info.ranking for info in overall_pages[0]] == [1, 2]
+        assert [info.ranking for info in overall_pages[1]] == [3, 4, 5]
+
+    # Merges sorted pages into one ranking
+    def test_merge(self, overall_pages):
+        merged = OverallRanking.merge(reversed(overall_pages))
+
+        assert isinstance(merged, OverallRanking)
+        assert [info.ranking for info in merged] == [1, 2, 3, 4, 5]
+
+    # Keeps the ranking sorted on append
+    def test_append(self, overall_pages):
+        ranking = overall_pages[1]
+        ranking.append(overall_pages[0][1])
+
+        assert [info.ranking for info in ranking] == [2, 3, 4, 5]
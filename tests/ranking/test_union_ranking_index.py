@@ -0,0 +1,181 @@
+from datetime import date
+
+import pytest
+
+from maplestory.models.ranking import UnionRanking
+from maplestory.services.rankings.union_index import (
+    Histogram,
+    RankCoverage,
+    UnionRankingIndex,
+)
+
+
+def make_union_info(ranking: int, name: str, union_level: int, **kwargs) -> dict:
+    return {
+        "date": kwargs.get("date", "2024-02-27"),
+        "ranking": ranking,
+        "character_name": name,
+        "world_name": kwargs.get("world_name", "스카니아"),
+        "class_name": "전사",
+        "sub_class_name": "히어로",
+        "union_level": union_level,
+        "union_power": kwargs.get("union_power", union_level * 1000),
+    }
+
+
+@pytest.fixture
+def pages() -> list[UnionRanking]:
+    return [
+        UnionRanking.model_validate(
+            {
+                "ranking": [
+                    make_union_info(1, "A", 9000),
+                    make_union_info(2, "B", 8000),
+                    make_union_info(3, "C", 8000),
+                ]
+            }
+        ),
+        UnionRanking.model_validate(
+            {
+                "ranking": [
+                    make_union_info(4, "D", 7000),
+                    make_union_info(5, "E", 6000),
+                    make_union_info(1, "F", 8500, world_name="베라"),
+                ]
+            }
+        ),
+    ]
+
+
+@pytest.fixture
+def index(pages) -> UnionRankingIndex:
+    index = UnionRankingIndex(power_bucket_size=1_000_000)
+    for page in pages:
+        index.update(page)
+    return index
+
+
+class TestHistogram:
+    def test_counts(self):
+        histogram = Histogram(bucket_size=10)
+        for value in [1, 5, 12, 19, 30]:
+            histogram.add(value)
+
+        assert histogram.counts == {0: 2, 10: 2, 30: 1}
+        assert len(histogram) == 5
+        assert histogram.count_below(15) == 2
+        assert histogram.count_at_most(15) == 4
+        assert histogram.count_below(-1) == 0
+        assert histogram.count_at_most(100) == 5
+
+    def test_quantile(self):
+        histogram = Histogram()
+        for value in [1, 2, 3, 4]:
+            histogram.add(value)
+
+        assert histogram.quantile(0) == 1
+        assert histogram.quantile(0.5) == 2
+        assert histogram.quantile(0.51) == 3
+        assert histogram.quantile(1) == 4
+
+        histogram.add(0)
+        assert histogram.quantile(0) == 0
+
+        with pytest.raises(ValueError):
+            histogram.quantile(1.5)
+        with pytest.raises(ValueError):
+            Histogram().quantile(0.5)
+
+
+class TestRankCoverage:
+    def test_add(self):
+        coverage = RankCoverage()
+        for rank in [3, 1, 5, 2]:
+            assert coverage.add(rank) is True
+
+        assert coverage.ranges == [(1, 3), (5, 5)]
+        assert coverage.add(2) is False
+        assert coverage.add(4) is True
+        assert coverage.ranges == [(1, 5)]
+        assert len(coverage) == 5
+        assert 5 in coverage and 6 not in coverage
+
+    def test_overlaps(self):
+        left = RankCoverage([(1, 200), (401, 600)])
+        right = RankCoverage([(150, 450), (601, 800)])
+
+        assert left.overlaps(right) == [(150, 200), (401, 450)]
+        assert left.union(right).ranges == [(1, 800)]
+        assert RankCoverage([(1, 5), (3, 8), (9, 9)]).ranges == [(1, 9)]
+
+
+class TestUnionRankingIndex:
+    def test_cells(self, index):
+        assert set(index.cells) == {("스카니아", "2024-02-27"), ("베라", "2024-02-27")}
+        assert index.count("스카니아", date(2024, 2, 27)) == 5
+        assert index.count("스카니아", "2024-02-28") == 0
+
+    def test_duplicate_pages(self, index, pages):
+        assert index.update(pages[0]) is index
+        assert index.count("스카니아", "2024-02-27") == 5
+        assert index.add(pages[0][0]) is False
+
+    def test_distribution(self, index):
+        assert index.distribution("스카니아", "2024-02-27") == {
+            6000: 1,
+            7000: 1,
+            8000: 2,
+            9000: 1,
+        }
+        assert index.distribution("베라", "2024-02-27", "union_power") == {8000000: 1}
+
+    def test_percentile(self, index):
+        day = "2024-02-27"
+        assert index.percentile("스카니아", day, union_level=9000) == 90
+        assert index.percentile("스카니아", day, union_level=8000) == 60
+        assert index.percentile("스카니아", day, union_level=10000) == 100
+        assert index.percentile("스카니아", day, union_power=6_500_000) == 10
+
+        with pytest.raises(ValueError):
+            index.percentile("스카니아", day)
+        with pytest.raises(KeyError):
+            index.percentile("루나", day, union_level=8000)
+
+    def test_quantile(self, index):
+        assert index.quantile("스카니아", "2024-02-27", 0.5) == 8000
+        assert index.quantile("스카니아", "2024-02-27", 1, "union_power") == 9000000
+
+    def test_merge(self, pages):
+        left = UnionRankingIndex().update(pages[0])
+        right = UnionRankingIndex().update(pages[1])
+
+        left.merge(right)
+        assert left.count("스카니아", "2024-02-27") == 5
+        assert left.quantile("스카니아", "2024-02-27", 0) == 6000
+
+        with pytest.raises(ValueError, match="베라 2024-02-27 1~1"):
+            left.merge(UnionRankingIndex().update(pages[1]))
+        with pytest.raises(ValueError):
+            left.merge(UnionRankingIndex(power_bucket_size=1))
+
+    def test_save_load(self, index, pages, tmp_path):
+        path = tmp_path / "union.json"
+        assert len(UnionRankingIndex.load(path).cells) == 0
+
+        index.save(path)
+        loaded = UnionRankingIndex.load(path)
+
+        assert loaded.power_bucket_size == 1_000_000
+        assert set(loaded.cells) == set(index.cells)
+        assert loaded.distribution("스카니아", "2024-02-27") == index.distribution(
+            "스카니아", "2024-02-27"
+        )
+        assert loaded.percentile(
+            "스카니아", "2024-02-27", union_level=8000
+        ) == index.percentile("스카니아", "2024-02-27", union_level=8000)
+        assert loaded.add(pages[0][0]) is False
+        assert loaded.cell("스카니아", "2024-02-27").ranks.ranges == [(1, 5)]
+        assert list(tmp_path.iterdir()) == [path]
+
+        with pytest.raises(ValueError):
+            UnionRankingIndex.load(path, power_bucket_size=1)
@@ -1,3 +1,6 @@
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import pytest
@@ -5,12 +8,28 @@ from freezegun import freeze_time
 from pydantic import ValidationError
 
 from maplestory.models.union.artifact import (
+    UNION_ARTIFACT_MAX_LEVEL,
     ArtifactCrystalRequiredAP,
+    ArtifactStat,
     UnionArtifact,
     UnionArtifactCrystal,
     UnionArtifactEffect,
+    parse_artifact_effect,
+    parse_date_expire,
     parse_stat_string,
+    stat_name,
+    stat_name_id,
 )
+from maplestory.services.artifact import (
+    _allocate,
+    aggregate_artifact_effects,
+    artifact_effect_levels,
+    crystal_remaining_seconds,
+    crystal_upgrade_cost,
+    evaluate_crystal_expiry,
+    optimize_artifact_ap,
+)
+from maplestory.utils.kst import KST_TZ
 
 
 class TestParseStatString:
@@ -53,6 +72,202 @@ class TestParseStatString:
         with pytest.raises(ValueError):
             parse_stat_string(stat_str)
 
+    # Should parse stat names containing latin letters
+    def test_hp_mp_stat_string(self):
+        stat_str = "최대 HP 2250, 최대 MP 2250 증가"
+        expected_result = [("최대 HP", 2250), ("최대 MP", 2250)]
+
+        result = parse_stat_string(stat_str)
+        assert result == expected_result
+
+
+class TestParseArtifactEffect:
+    def test_typed_stats(self):
+        stats = parse_artifact_effect(
+            "추가 경험치 획득 6% 증가, 다수 공격 스킬의 최대 공격 가능 대상 수 1 증가"
+        )
+
+        assert stats == (
+            ArtifactStat(stat_name_id("추가 경험치 획득"), 0.06, True),
+            ArtifactStat(
+                stat_name_id("다수 공격 스킬의 최대 공격 가능 대상 수"), 1, False
+            ),
+        )
+        assert stats[0].name == "추가 경험치 획득"
+
+    def test_stat_name_ids(self):
+        names = [f"테스트 효과 {i}" for i in range(50)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(stat_name_id, names * 4))
+
+        assert ids[:50] == ids[50:100]
+        assert len(set(ids)) == 50
+        assert [stat_name(name_id) for name_id in ids[:50]] == names
+
+    def test_memoized(self):
+        effect = UnionArtifactEffect(name="공격력 30, 마력 30 증가", level=10)
+
+        assert effect.stats is parse_artifact_effect("공격력 30, 마력 30 증가")
+        assert effect.stat == [("공격력", 30), ("마력", 30)]
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            parse_artifact_effect("공격력 증가")
+
+
+class TestAggregateArtifactEffects:
+    def test_columns(self):
+        artifacts = [
+            UnionArtifact(
+                date=datetime(2024, 2, 20),
+                union_artifact_effect=[
+                    UnionArtifactEffect(name=name, level=10) for name in names
+                ],
+                union_artifact_crystal=[],
+                union_artifact_remain_ap=0,
+            )
+            for names in [
+                ["올스탯 150 증가", "데미지 15.00% 증가"],
+                ["올스탯 120 증가", "최대 HP 2250, 최대 MP 2250 증가"],
+            ]
+        ]
+
+        columns = aggregate_artifact_effects(artifacts)
+
+        assert list(columns["올스탯"]) == [150, 120]
+        assert list(columns["데미지"]) == [0.15, 0]
+        assert list(columns["최대 MP"]) == [0, 2250]
+        assert aggregate_artifact_effects([]) == {}
+
+
+def make_crystal(
+    name, level, options, validity_flag="0", date_expire="2099/01/02 23:59:59:999999"
+):
+    return UnionArtifactCrystal(
+        name=name,
+        validity_flag=validity_flag,
+        date_expire=date_expire,
+        level=level,
+        crystal_option_name_1=options[0],
+        crystal_option_name_2=options[1],
+        crystal_option_name_3=options[2],
+    )
+
+
+class TestOptimizeArtifactAP:
+    @pytest.fixture
+    def crystals(self):
+        return [
+            make_crystal(
+                "크리스탈 : 주황버섯",
+                5,
+                [
+                    "버프 지속시간 증가",
+                    "보스 몬스터 공격 시 데미지 증가",
+                    "몬스터 방어율 무시 증가",
+                ],
+            ),
+            make_crystal(
+                "크리스탈 : 슬라임",
+                4,
+                [
+                    "버프 지속시간 증가",
+                    "보스 몬스터 공격 시 데미지 증가",
+                    "몬스터 방어율 무시 증가",
+                ],
+            ),
+            make_crystal(
+                "크리스탈 : 스톤골렘",
+                2,
+                ["크리티컬 데미지 증가", "공격력/마력 증가", "아이템 드롭률 증가"],
+            ),
+            make_crystal(
+                "크리스탈 : 발록",
+                1,
+                ["크리티컬 데미지 증가", "아이템 드롭률 증가", "공격력/마력 증가"],
+            ),
+        ]
+
+    def test_upgrade_cost(self):
+        assert crystal_upgrade_cost(1, 5) == 8
+        assert crystal_upgrade_cost(3, 4) == 2
+        assert crystal_upgrade_cost(5, 5) == 0
+
+    def test_effect_levels(self, crystals):
+        levels = artifact_effect_levels(crystals)
+
+        assert levels["보스 몬스터 공격 시 데미지 증가"] == 9
+        assert levels["공격력/마력 증가"] == 3
+
+    def test_allocation(self, crystals):
+        values = {"보스 몬스터 공격 시 데미지 증가": 3, "공격력/마력 증가": 2}
+
+        allocation = optimize_artifact_ap(crystals, 4, values)
+
+        # 슬라임 4 -> 5 (3 AP): 보스 +1 -> 3, 발록 1 -> 2 (1 AP): 공격력/마력 +1 -> 2
+        assert allocation.upgrades == {
+            "크리스탈 : 슬라임": (4, 5),
+            "크리스탈 : 발록": (1, 2),
+        }
+        assert allocation.spent_ap == 4
+        assert allocation.gain == 5
+        assert allocation.effect_levels["보스 몬스터 공격 시 데미지 증가"] == 10
+
+    def test_effect_level_cap(self, crystals):
+        # 보스 효과는 이미 9레벨이므로 슬라임을 올려도 1레벨만 늘어납니다.
+        allocation = optimize_artifact_ap(
+            crystals, 20, {"보스 몬스터 공격 시 데미지 증가": 1}
+        )
+
+        assert allocation.upgrades == {"크리스탈 : 슬라임": (4, 5)}
+        assert allocation.gain == 1
+
+    def test_expired_crystal(self, crystals):
+        crystals[3] = make_crystal(
+            "크리스탈 : 발록",
+            1,
+            ["크리티컬 데미지 증가", "아이템 드롭률 증가", "공격력/마력 증가"],
+            "1",
+        )
+
+        allocation = optimize_artifact_ap(crystals, 8, {"공격력/마력 증가": 1})
+
+        assert "크리스탈 : 발록" not in allocation.levels
+        assert allocation.upgrades == {"크리스탈 : 스톤골렘": (2, 5)}
+
+    def test_negative_ap(self, crystals):
+        with pytest.raises(ValueError):
+            optimize_artifact_ap(crystals, -1, {})
+
+    @pytest.mark.parametrize("remain_ap", [40, 72])
+    def test_nine_crystals_fast(self, remain_ap):
+        options = [
+            "보스 몬스터 공격 시 데미지 증가",
+            "몬스터 방어율 무시 증가",
+            "공격력/마력 증가",
+            "크리티컬 데미지 증가",
+            "버프 지속시간 증가",
+            "아이템 드롭률 증가",
+            "데미지 증가",
+            "크리티컬 확률 증가",
+            "올스탯 증가",
+        ]
+        crystals = [
+            make_crystal(f"크리스탈 : {i}", 1, [options[(i + k) % 9] for k in range(3)])
+            for i in range(9)
+        ]
+        values = {option: i + 1 for i, option in enumerate(options)}
+        _allocate.cache_clear()
+
+        start = time.perf_counter()
+        allocation = optimize_artifact_ap(crystals, remain_ap, values)
+
+        assert time.perf_counter() - start < 1
+        # 모든 효과를 10레벨로 만드는 데 33 AP가 필요합니다.
+        assert allocation.gain == 315
+        assert allocation.spent_ap == 33
+        assert set(allocation.effect_levels.values()) == {UNION_ARTIFACT_MAX_LEVEL}
+
 
 class TestUnionArtifactEffect:
     # can be instantiated with a name and level
@@ -102,6 +317,38 @@ class TestUnionArtifactCrystal:
         assert crystal.remaining_time_short_str == "25.5일"
         assert crystal.remaining_days == 25
 
+    def test_parse_date_expire(self):
+        assert parse_date_expire("2024-01-26T00:00+09:00") == datetime(
+            2024, 1, 26, tzinfo=KST_TZ
+        )
+        assert parse_date_expire("2024/02/20 19:26:00:000") == datetime(
+            2024, 2, 20, 19, 26, tzinfo=KST_TZ
+        )
+        assert parse_date_expire("2099/01/02 23:59:59:999999") == datetime(
+            2099, 1, 2, 23, 59, 59, 999999, tzinfo=KST_TZ
+        )
+        assert parse_date_expire("2024/02/20 19:26:00:000") == datetime.strptime(
+            "2024/02/20 19:26:00:000", "%Y/%m/%d %H:%M:%S:%f"
+        ).replace(tzinfo=KST_TZ)
+
+        for value in ["2024.02.20", "2024/02/20 19:26:00", ""]:
+            with pytest.raises(ValueError):
+                parse_date_expire(value)
+
+    @freeze_time("2024-02-24 12:34:56", tz_offset=9)
+    def test_slash_format_remaining_time(self):
+        crystal = make_crystal(
+            "크리스탈 : 주황버섯",
+            5,
+            ["버프 지속시간 증가"] * 3,
+            date_expire="2024/03/21 20:21:00:000",
+        )
+
+        assert crystal.remaining_time == timedelta(days=25, seconds=49564)
+        assert crystal.remaining_time_at(
+            datetime(2024, 3, 21, tzinfo=KST_TZ)
+        ) == timedelta(hours=20, minutes=21)
+
     # create a UnionArtifactCrystal object with a non-string 'name' parameter
     def test_non_string_name(self):
         with pytest.raises(ValidationError):
@@ -765,3 +1012,63 @@ class TestUnionArtifact:
 
         assert artifact.crystals[0].name == "크리스탈 : 주황버섯"
         assert artifact.crystals[1].name == "크리스탈 : 슬라임"
+
+
+class TestEvaluateCrystalExpiry:
+    reference = datetime(2024, 3, 1, tzinfo=KST_TZ)
+
+    def crystals(self, *date_expires, validity_flag="0"):
+        return [
+            make_crystal(
+                "크리스탈 : 주황버섯",
+                1,
+                ["버프 지속시간 증가"] * 3,
+                validity_flag=validity_flag,
+                date_expire=date_expire,
+            )
+            for date_expire in date_expires
+        ]
+
+    def test_crystal_remaining_seconds(self):
+        crystals = self.crystals("2024-03-02T00:00+09:00", "2024/02/29 12:00:00:000")
+        assert list(crystal_remaining_seconds(crystals, self.reference)) == [
+            86400,
+            -43200,
+        ]
+
+    def test_buckets(self):
+        report = evaluate_crystal_expiry(
+            {
+                "A": self.crystals("2024-03-09T00:00+09:00", "2024-03-01T12:00+09:00"),
+                "B": self.crystals("2024-03-03T00:00+09:00"),
+                "C": self.crystals("2024-03-07T00:00+09:00"),
+                "D": self.crystals("2024-04-01T00:00+09:00"),
+                "E": self.crystals("2024-02-01T00:00+09:00"),
+                "F": self.crystals("2024-02-01T00:00+09:00", validity_flag="1"),
+                "G": [],
+                "H": self.crystals("2024-03-20T00:00+09:00", validity_flag="1"),
+            },
+            reference=self.reference,
+        )
+
+        assert report.accounts == ["A", "B", "C", "D", "E", "F", "G", "H"]
+        assert report.remaining_seconds[:2] == [43200, 172800]
+        assert report.remaining_seconds[-3:] == [-29 * 86400, math.inf, 0]
+        assert report.buckets == {0: ["E", "F", "H"], 1: ["A"], 3: ["B"], 7: ["C"]}
+
+    def test_custom_windows(self):
+        report = evaluate_crystal_expiry(
+            {"A": self.crystals("2024-03-20T00:00+09:00")},
+            windows=[30],
+            reference=self.reference,
+        )
+        assert report.buckets == {0: [], 30: ["A"]}
+
+        with pytest.raises(ValueError):
+            evaluate_crystal_expiry({}, windows=[0])
+
+    @freeze_time("2024-03-01 00:00:00", tz_offset=9)
+    def test_default_reference(self):
+        crystals = self.crystals("2024-03-02T00:00+09:00")
+        report = evaluate_crystal_expiry({"A": crystals})
+        assert report.remaining_seconds == [crystals[0].remaining_time.total_seconds()]
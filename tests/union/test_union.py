@@ -16,13 +16,22 @@ from maplestory.models.union.artifact import (
 from maplestory.models.union.raider import UnionRaider
 from maplestory.models.union.union import UnionInfo
 from maplestory.services.union import (
+    ParsedUnionStat,
     Union,
     UnionStat,
     UnionStats,
+    fetch_union_snapshot,
     get_union_artifact_info,
     get_union_info,
     get_union_raider_info,
 )
+from maplestory.services.union_board import (
+    BOARD_HEIGHT,
+    BOARD_WIDTH,
+    X_MIN,
+    Y_MAX,
+    UnionBoard,
+)
 from maplestory.utils.kst import KST_TZ, yesterday
 
 
@@ -962,6 +971,79 @@ class TestUnion:
         ]
 
 
+class TestFetchUnionSnapshot:
+    def test_fetches_once(self, mocker):
+        get = mocker.patch("httpx.get", side_effect=custom_side_effect)
+        lazy = Union(character_name="온앤온")
+        expected = lazy.model_dump(exclude={"artifact"})
+        lazy_calls = get.call_count
+
+        union = fetch_union_snapshot("온앤온")
+        assert get.call_count - lazy_calls == 4
+        assert union.is_snapshot
+
+        get.reset_mock()
+        assert union.model_dump(exclude={"artifact"}) == {
+            **expected,
+            "ocid": union.ocid,
+        }
+        assert union.model_dump()["artifact"]["remain_ap"] == 4
+        assert union.level == 8871
+        assert union.artifact.remain_ap == 4
+        assert len(union.raider_info.blocks) > 0
+        assert get.call_count == 0
+        assert lazy_calls > 4
+
+    def test_by_ocid(self, mocker):
+        get = mocker.patch("httpx.get", side_effect=custom_side_effect)
+
+        union = fetch_union_snapshot(ocid="562462037a5f3a4ef5085546bd0c7dd9")
+
+        assert get.call_count == 3
+        assert union.character_name is None
+        assert union.grade == "그랜드 마스터 유니온 2"
+        assert not any("/id" in call.args[0] for call in get.call_args_list)
+
+    def test_character_required(self):
+        with pytest.raises(ValueError):
+            fetch_union_snapshot()
+        with pytest.raises(ValueError):
+            Union()
+
+
+class TestUnionRaiderBoardBounds:
+    def test_board_from_fixture(self, mocker):
+        mocker.patch("httpx.get", side_effect=custom_side_effect)
+        raider = Union(character_name="온앤온").raider_info
+
+        positions = [
+            (position.x, position.y)
+            for block in raider.blocks
+            for position in block.position
+        ]
+        xs = [x for x, _ in positions]
+        ys = [y for _, y in positions]
+
+        # 맨 왼쪽 열과 맨 위 줄에 블록이 놓여 있으므로 배치판 좌표 범위를 옮길 수 없습니다.
+        assert min(xs) == X_MIN
+        assert max(ys) == Y_MAX
+        assert min(ys) >= Y_MAX - BOARD_HEIGHT + 1
+
+        # 나머지 칸은 모두 배치판 안에 있고, 아크메이지(불,독) 블록의 한 칸만 오른쪽 끝을 벗어납니다.
+        outside = [(x, y) for x, y in positions if x >= X_MIN + BOARD_WIDTH]
+        assert outside == [(11, -2)]
+
+        board = UnionBoard.from_raider(raider)
+        assert [(block.character_class, x, y) for block, x, y in board.outside] == [
+            ("아크메이지(불,독)", 11, -2)
+        ]
+        assert len(board) == len(set(positions)) - 1
+        assert Union(character_name="온앤온").board.outside == board.outside
+
+        with pytest.raises(ValueError, match=r"아크메이지\(불,독\).*\(11, -2\)"):
+            UnionBoard.from_raider(raider, strict=True)
+
+
 class TestUnionStat:
     # can parse a valid stat string into its components
     def test_parse_valid_stat_string(self):
@@ -1121,3 +1203,82 @@ class TestUnionStat:
 
         # Assert that the multi_name property is correct
         assert stat.multi_name == ["STR", "DEX", "LUK"]
+
+
+class TestParsedUnionStat:
+    def test_parsed_once(self, mocker):
+        parse = mocker.spy(ParsedUnionStat, "of")
+        stat = UnionStat(stat="보스 몬스터 공격 시 데미지 7% 증가")
+        stat.model_dump()
+
+        assert stat.parsed is ParsedUnionStat.of(stat.stat)
+        assert stat.value == 7 and stat.percent == "%"
+        assert parse.call_count == 2
+
+    def test_interned(self):
+        stat = UnionStat.of("공격력 20, 마력 20 증가")
+
+        assert UnionStat.of("공격력 20, 마력 20 증가") is stat
+        assert stat == UnionStat(stat="공격력/마력 20 증가")
+        assert stat.multi_name == ["공격력", "마력"]
+
+    def test_invalid_format(self):
+        stat = UnionStat(stat="유니온 스탯")
+
+        assert ParsedUnionStat.of("유니온 스탯") is None
+        with pytest.raises(ValueError, match="Invalid stat format."):
+            _ = stat.name
+
+
+class TestUnionStats:
+    STATS = [
+        "STR 80 증가",
+        "STR, DEX, LUK 40 증가",
+        "공격력/마력 20 증가",
+        "방어율 무시 5% 증가",
+        "크리티컬 데미지 0.25% 증가",
+        "STR 80 증가",
+        "방어율 무시 3% 증가",
+        "크리티컬 데미지 0.5% 증가",
+        "공격력 10 증가",
+    ]
+
+    def test_group_stats(self):
+        groups = UnionStats.parse_list(self.STATS).group_stats(split_multiple=True)
+
+        assert [stat.stat for stat in groups[("STR", False)]] == [
+            "STR 80 증가",
+            "STR 80 증가",
+            "STR 40 증가",
+        ]
+        assert [stat.stat for stat in groups[("공격력", False)]] == [
+            "공격력 10 증가",
+            "공격력 20 증가",
+        ]
+        assert len(groups[("방어율 무시", True)]) == 2
+
+    def test_summarize(self):
+        stats = UnionStats.parse_list(self.STATS * 100).summarize(split_multiple=True)
+
+        assert [stat.stat for stat in stats.root if stat.name != "방어율 무시"] == [
+            "DEX 4000 증가",
+            "LUK 4000 증가",
+            "STR 20000 증가",
+            "공격력 3000 증가",
+            "마력 2000 증가",
+            "크리티컬 데미지 75.0% 증가",
+        ]
+        assert len([stat for stat in stats.root if stat.name == "방어율 무시"]) == 200
+
+    def test_summarize_matches_sum(self):
+        stats = UnionStats.parse_list(self.STATS)
+
+        for (name, _), group in stats.group_stats().items():
+            if name != "방어율 무시":
+                assert sum(group) in stats.summarize().root
+
+    def test_summarize_different_updown(self):
+        stats = UnionStats.parse_list(["공격력 20 증가", "공격력 10 감소"])
+
+        with pytest.raises(ValueError, match="different updown"):
+            stats.summarize()
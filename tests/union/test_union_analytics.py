@@ -0,0 +1,112 @@
+from array import array
+from types import SimpleNamespace
+
+import pytest
+
+from maplestory.models.union.artifact import UnionArtifactEffect
+from maplestory.services.union import UnionStats
+from maplestory.services.union_analytics import UnionStatMatrix
+
+
+def make_union(name, raider_stats, occupied_stats=(), artifact_effects=()):
+    return SimpleNamespace(
+        character_name=name,
+        ocid=None,
+        raider_info=SimpleNamespace(
+            raider_stats=list(raider_stats), occupied_stats=list(occupied_stats)
+        ),
+        artifact=SimpleNamespace(
+            effects=[
+                UnionArtifactEffect(name=effect, level=1) for effect in artifact_effects
+            ]
+        ),
+    )
+
+
+@pytest.fixture
+def matrix():
+    matrix = UnionStatMatrix()
+    matrix.add(
+        "A",
+        [
+            "STR, DEX, LUK 40 증가",
+            "보스 몬스터 공격 시 데미지 20% 증가",
+            "몬스터 방어율 무시 40% 증가",
+        ],
+        ["공격력 18, 마력 18 증가", "몬스터 방어율 무시 20% 증가"],
+    )
+    matrix.add(
+        "B", ["STR 80 증가", "STR 10% 증가", "보스 몬스터 공격 시 데미지 30% 증가"]
+    )
+    return matrix
+
+
+class TestUnionStatMatrix:
+    def test_columns_aligned(self, matrix):
+        assert len(matrix) == 2
+        assert matrix.accounts == ["A", "B"]
+        assert all(len(column) == 2 for column in matrix.columns.values())
+
+    def test_percent_and_flat_separated(self, matrix):
+        assert matrix.column("STR") == array("d", [40, 80])
+        assert matrix.column("STR", percent=True) == array("d", [0, 10])
+        assert matrix.column("LUK") == array("d", [40, 0])
+        assert matrix.column("공격력") == array("d", [18, 0])
+
+    def test_ignore_defense_multiplicative(self, matrix):
+        # 1 - (1 - 0.4)(1 - 0.2) = 0.52
+        assert matrix.column("방어율 무시", percent=True) == array("d", [52, 0])
+
+    def test_missing_column(self, matrix):
+        assert matrix.column("없는 스탯") == array("d", [0, 0])
+
+    def test_row(self, matrix):
+        assert matrix.row("B") == {
+            ("STR", False): 80,
+            ("STR", True): 10,
+            ("보스 몬스터 공격 시 데미지", True): 30,
+        }
+
+    def test_rank(self, matrix):
+        assert matrix.rank("보스 몬스터 공격 시 데미지", percent=True) == [
+            ("B", 30),
+            ("A", 20),
+        ]
+        assert matrix.rank("STR", top=1) == [("B", 80)]
+
+    def test_score(self, matrix):
+        weights = {("STR", False): 1, ("방어율 무시", True): 2}
+        assert matrix.score(weights) == array("d", [144, 80])
+        assert matrix.rank_by_score(weights) == [("A", 144), ("B", 80)]
+
+    def test_matches_summarize(self):
+        stats = ["STR, DEX, LUK 40 증가", "STR 80 증가", "크리티컬 확률 4% 증가"]
+        matrix = UnionStatMatrix()
+        matrix.add("A", stats)
+
+        summary = UnionStats.parse_list(stats).summarize(split_multiple=True)
+        assert matrix.row("A") == {
+            (stat.name, stat.is_percent): stat.value for stat in summary.root
+        }
+
+    def test_invalid_stat(self):
+        with pytest.raises(ValueError):
+            UnionStatMatrix().add("A", ["잘못된 스탯"])
+
+    def test_from_unions(self):
+        unions = [
+            make_union(
+                "A", ["STR 10 증가"], ["유니온 DEX 5 증가"], ["올스탯 150 증가"]
+            ),
+            make_union("B", ["STR 20 증가"]),
+        ]
+
+        matrix = UnionStatMatrix.from_unions(unions)
+        assert matrix.accounts == ["A", "B"]
+        assert matrix.column("올스탯") == array("d", [150, 0])
+
+        matrix = UnionStatMatrix.from_unions(unions, sources=["raider"])
+        assert matrix.keys == [("STR", False)]
+
+        with pytest.raises(ValueError):
+            UnionStatMatrix.from_unions(unions, sources=["unknown"])
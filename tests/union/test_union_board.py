@@ -0,0 +1,96 @@
+import pytest
+from PIL import Image
+
+from maplestory.models.union import UnionRaiderBlock, UnionRaiderInnerStat
+from maplestory.services.union_board import (
+    BOARD_HEIGHT,
+    BOARD_WIDTH,
+    REGION_MASKS,
+    UnionBoard,
+    cell_index,
+    cell_of,
+    cells,
+    region_of,
+)
+
+
+def make_block(block_type, positions):
+    return UnionRaiderBlock.model_validate(
+        {
+            "block_type": block_type,
+            "block_class": "히어로",
+            "block_level": "250",
+            "block_control_point": {"x": positions[0][0], "y": positions[0][1]},
+            "block_position": [{"x": x, "y": y} for x, y in positions],
+        }
+    )
+
+
+class TestBoardGeometry:
+    def test_cell_index(self):
+        assert cell_index(-11, 10) == 0
+        assert cell_index(10, -9) == BOARD_WIDTH * BOARD_HEIGHT - 1
+        assert all(cell_of(cell_index(x, y)) == (x, y) for x, y in [(0, 0), (-5, 7)])
+
+        with pytest.raises(ValueError):
+            cell_index(11, 0)
+
+    def test_regions(self):
+        assert region_of(-1, 1) == 0
+        assert region_of(0, 1) == 1
+        assert region_of(5, 1) == 2
+        assert region_of(0, 0) == 4
+        assert region_of(-11, 10) == 8 + 7
+        assert region_of(-1, 10) == 8 + 0
+
+        assert sum(mask.bit_count() for mask in REGION_MASKS) == 440
+        assert len({mask.bit_count() for mask in REGION_MASKS[:8]}) == 1
+
+
+class TestUnionBoard:
+    @pytest.fixture
+    def board(self):
+        return UnionBoard(
+            [
+                make_block("전사", [(0, 1), (-1, 1), (0, 2), (-1, 2)]),
+                make_block("궁수", [(0, 0), (0, -1), (0, -2), (0, -3), (0, -4)]),
+                make_block("해적", [(10, -9), (10, -8)]),
+            ]
+        )
+
+    def test_region_counts(self, board):
+        counts = board.region_counts()
+
+        assert len(board) == 11
+        assert counts[0] == 2 and counts[1] == 2 and counts[4] == 5
+        assert counts[8 + 3] == 2
+        assert board.inner_counts() == counts[:8]
+        assert sum(counts) == len(board)
+
+    def test_stat_totals(self, board):
+        inner_stats = [
+            UnionRaiderInnerStat(stat_field_id="0", stat_field_effect="유니온 STR"),
+            UnionRaiderInnerStat(stat_field_id="1", stat_field_effect="유니온 STR"),
+            UnionRaiderInnerStat(stat_field_id="4", stat_field_effect="유니온 공격력"),
+        ]
+
+        assert board.stat_totals(inner_stats, {3: "크리티컬 데미지"}) == {
+            "유니온 STR": 4,
+            "유니온 공격력": 5,
+            "크리티컬 데미지": 2,
+        }
+
+    def test_overlap(self, board):
+        assert not board.has_overlap
+        assert board.overlaps(board.blocks[0].position)
+        assert not board.overlaps(1 << cell_index(5, 5))
+
+        overlapped = UnionBoard([*board.blocks, make_block("도적", [(0, 0), (1, 0)])])
+        assert cells(overlapped.overlapped) == [(0, 0)]
+
+    def test_render(self, board):
+        image = board.render(cell_size=10)
+
+        assert isinstance(image, Image.Image)
+        assert image.size == (220, 200)
+        assert image.getpixel((11 * 10 + 5, 9 * 10 + 5)) == (221, 85, 85)
@@ -0,0 +1,231 @@
+import pytest
+
+from maplestory.models.union import UnionRaiderBlock, UnionRaiderInnerStat
+from maplestory.services.union_board import (
+    BOARD_HEIGHT,
+    BOARD_WIDTH,
+    REGION_MASKS,
+    cell_index,
+)
+from maplestory.services.union_optimizer import (
+    CENTER_MASK,
+    RaiderMember,
+    block_shape,
+    optimize_union_placement,
+    orientations,
+    placement_masks,
+    region_weights,
+)
+
+INNER_STATS = [
+    UnionRaiderInnerStat(stat_field_id=str(i), stat_field_effect=effect)
+    for i, effect in enumerate(
+        [
+            "유니온 STR",
+            "유니온 DEX",
+            "유니온 최대 HP",
+            "유니온 마력",
+            "유니온 LUK",
+            "유니온 INT",
+            "유니온 공격력",
+            "유니온 최대 MP",
+        ]
+    )
+]
+
+
+class TestBlockShape:
+    def test_level_cells(self):
+        assert block_shape("궁수", 250) == "#####"
+        assert block_shape("마법사", 228) == "###/.#."
+        assert block_shape("전사", 100) == "##"
+        assert block_shape("메이플 M 캐릭터", 170) == "####"
+        assert block_shape("도적", 59) is None
+
+        with pytest.raises(ValueError):
+            block_shape("초보자", 200)
+
+    def test_orientations(self):
+        assert len(orientations("#####")) == 2
+        assert len(orientations("##/##")) == 1
+        assert len(orientations(".#./###/.#.")) == 1
+        assert len(orientations("##./.##")) == 4
+        assert len(orientations("##/#./#.")) == 8
+        assert len(placement_masks("##/##")) == 21 * 19
+
+    def test_from_block(self):
+        block = UnionRaiderBlock.model_validate(
+            {
+                "block_type": "해적",
+                "block_class": "아크",
+                "block_level": "200",
+                "block_control_point": {"x": -10, "y": 4},
+                "block_position": [
+                    {"x": -11, "y": 5},
+                    {"x": -9, "y": 4},
+                    {"x": -10, "y": 5},
+                    {"x": -10, "y": 4},
+                ],
+            }
+        )
+
+        assert RaiderMember.from_block(block) == RaiderMember(
+            type="해적", character_class="아크", level=200
+        )
+
+
+class TestOptimizeUnionPlacement:
+    members = [
+        RaiderMember(type="궁수", character_class="보우마스터", level=250),
+        RaiderMember(type="전사", character_class="히어로", level=200),
+        RaiderMember(type="전사", character_class="팔라딘", level=200),
+        RaiderMember(type="도적", character_class="섀도어", level=140),
+    ]
+    weights = {"유니온 공격력": 3, "유니온 STR": 1}
+
+    def test_optimal(self):
+        placement = optimize_union_placement(self.members, self.weights, INNER_STATS)
+        board = placement.board
+
+        assert placement.complete
+        assert placement.unplaced == []
+        assert len(board) == 16
+        assert not board.has_overlap
+        assert board.occupied & CENTER_MASK
+        counts = board.stat_totals(INNER_STATS)
+        assert placement.score == 3 * counts["유니온 공격력"] + counts["유니온 STR"]
+        assert placement.score == 42
+
+    def test_connected(self):
+        placement = optimize_union_placement(self.members, self.weights, INNER_STATS)
+
+        occupied = placement.board.occupied
+        reached = frontier = occupied & CENTER_MASK
+        while frontier:
+            bit = frontier & -frontier
+            frontier ^= bit
+            x = (bit.bit_length() - 1) % 22
+            for step, ok in ((1, x < 21), (-1, x > 0), (22, True), (-22, True)):
+                index = bit.bit_length() - 1 + step
+                if ok and 0 <= index < 440 and occupied >> index & 1:
+                    if not reached >> index & 1:
+                        reached |= 1 << index
+                        frontier |= 1 << index
+        assert reached == occupied
+
+    def test_outer_effects(self):
+        placement = optimize_union_placement(
+            self.members[:1], {"보스 데미지": 1}, INNER_STATS, {0: "보스 데미지"}
+        )
+
+        # 5칸 블록이 중앙에서 바깥쪽 0번 지역까지 닿을 수 없으므로 점수는 0입니다.
+        assert placement.score == 0
+        assert REGION_MASKS[8] & 1 << cell_index(-1, 10)
+
+    def test_multiple_workers(self):
+        single = optimize_union_placement(self.members, self.weights, INNER_STATS)
+        multiple = optimize_union_placement(
+            self.members, self.weights, INNER_STATS, max_workers=2
+        )
+
+        assert multiple.score == single.score
+        assert multiple.complete
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            optimize_union_placement(
+                self.members, self.weights, INNER_STATS, max_workers=0
+            )
+
+
+def brute_force_score(members, weights, inner_stats):
+    """중앙 칸을 덮는 연결된 모든 배치의 최고 점수를 완전 탐색으로 계산합니다."""
+
+    cell_weights = [0.0] * (BOARD_WIDTH * BOARD_HEIGHT)
+    for weight, mask in zip(region_weights(weights, inner_stats), REGION_MASKS):
+        for bit in range(BOARD_WIDTH * BOARD_HEIGHT):
+            if mask >> bit & 1:
+                cell_weights[bit] = weight
+
+    def neighbors(bits):
+        # 블록 칸과 상하좌우로 맞닿은 칸의 비트보드
+        mask = 0
+        for bit in bits:
+            row, column = divmod(bit, BOARD_WIDTH)
+            for r, c in (
+                (row - 1, column),
+                (row + 1, column),
+                (row, column - 1),
+                (row, column + 1),
+            ):
+                if 0 <= r < BOARD_HEIGHT and 0 <= c < BOARD_WIDTH:
+                    mask |= 1 << r * BOARD_WIDTH + c
+        return mask
+
+    candidates = [
+        [
+            (sum(cell_weights[bit] for bit in bits), mask, neighbors(bits))
+            for mask, bits in placement_masks(member.shape)
+        ]
+        for member in members
+    ]
+
+    best, seen = 0.0, set()
+
+    def visit(occupied, used, score):
+        nonlocal best
+        best = max(best, score)
+        if (occupied, used) in seen:
+            return
+        seen.add((occupied, used))
+        for i, member_candidates in enumerate(candidates):
+            if used >> i & 1:
+                continue
+            for gain, mask, around in member_candidates:
+                if mask & occupied:
+                    continue
+                if not (around & occupied if occupied else mask & CENTER_MASK):
+                    continue
+                visit(occupied | mask, used | 1 << i, score + gain)
+
+    visit(0, 0, 0.0)
+    return best
+
+
+class TestOptimalityRegression:
+    # 크기순 고정 배치 순서와 같은 모양의 후보 번호 순서 제한으로 놓치던 배치입니다.
+    inner_stats = [
+        UnionRaiderInnerStat(stat_field_id=str(i), stat_field_effect=f"E{i}")
+        for i in range(8)
+    ]
+
+    @pytest.mark.parametrize(
+        "members, weights, expected",
+        [
+            ([("궁수", 250), ("궁수", 250), ("전사", 60)], {"E2": 1}, 10),
+            ([("전사", 200), ("궁수", 60), ("마법사", 250)], {"E6": 1}, 8),
+            ([("도적", 200), ("전사", 60), ("도적", 200)], {"E3": 1}, 8),
+        ],
+    )
+    def test_known_optimum(self, members, weights, expected):
+        members = [RaiderMember(type=kind, level=level) for kind, level in members]
+        placement = optimize_union_placement(members, weights, self.inner_stats)
+
+        assert placement.complete
+        assert placement.score == expected
+
+    @pytest.mark.parametrize(
+        "members, weights",
+        [
+            ([("궁수", 250), ("궁수", 250), ("전사", 60)], {"E2": 1}),
+            ([("전사", 200), ("궁수", 60), ("마법사", 250)], {"E6": 1}),
+            ([("해적", 140), ("하이브리드", 100), ("해적", 140)], {"E1": 2, "E5": 1}),
+            ([("마법사", 140), ("도적", 140)], {"E0": 1, "E7": 3}),
+        ],
+    )
+    def test_matches_brute_force(self, members, weights):
+        members = [RaiderMember(type=kind, level=level) for kind, level in members]
+        placement = optimize_union_placement(members, weights, self.inner_stats)
+
+        assert placement.complete
+        assert placement.score == brute_force_score(members, weights, self.inner_stats)
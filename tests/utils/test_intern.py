@@ -0,0 +1,34 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from maplestory.utils.intern import InternTable
+
+
+class TestInternTable:
+    def test_shared_value(self):
+        table = InternTable(lambda key: [key])
+
+        assert table.get("a") is table.get("a")
+        assert table.get("b") == ["b"]
+        assert len(table) == 2
+
+    def test_sequential_ids(self):
+        table = InternTable(lambda key: len(table))
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            ids = list(executor.map(table.get, [i % 10 for i in range(1000)]))
+
+        assert sorted(set(ids)) == list(range(10))
+        assert [table.get(i) for i in range(10)] == ids[:10]
+
+    def test_factory_error_not_stored(self):
+        def factory(key):
+            if key < 0:
+                raise ValueError("negative")
+            return key
+
+        table = InternTable(factory)
+        with pytest.raises(ValueError):
+            table.get(-1)
+        assert len(table) == 0
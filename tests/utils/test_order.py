@@ -0,0 +1,50 @@
+from operator import itemgetter
+
+from maplestory.utils.order import is_sorted, merge_sorted, sorted_if_needed
+
+
+class TestIsSorted:
+    # Returns True for sorted lists, including duplicates and empty lists
+    def test_sorted(self):
+        assert is_sorted([]) is True
+        assert is_sorted([1]) is True
+        assert is_sorted([1, 2, 2, 3]) is True
+
+    # Returns False for unsorted lists
+    def test_unsorted(self):
+        assert is_sorted([2, 1]) is False
+
+    # Uses the key function when provided
+    def test_with_key(self):
+        assert is_sorted([("b", 1), ("a", 2)], key=itemgetter(1)) is True
+        assert is_sorted([("b", 1), ("a", 2)], key=itemgetter(0)) is False
+
+
+class TestSortedIfNeeded:
+    # Returns the same list object when already sorted
+    def test_returns_same_list_when_sorted(self):
+        items = [1, 2, 3]
+        assert sorted_if_needed(items) is items
+
+    # Sorts unsorted lists
+    def test_sorts_unsorted_list(self):
+        assert sorted_if_needed([3, 1, 2]) == [1, 2, 3]
+
+
+class TestMergeSorted:
+    # Merges pre-sorted lists
+    def test_merges_sorted_lists(self):
+        assert merge_sorted([[1, 4, 7], [2, 5], [3, 6]]) == [1, 2, 3, 4, 5, 6, 7]
+
+    # Sorts unsorted inputs before merging
+    def test_merges_unsorted_lists(self):
+        assert merge_sorted([[4, 1], [3, 2]]) == [1, 2, 3, 4]
+
+    # Merges with a key function
+    def test_merges_with_key(self):
+        result = merge_sorted([[("a", 1), ("c", 3)], [("b", 2)]], key=itemgetter(1))
+        assert result == [("a", 1), ("b", 2), ("c", 3)]
+
+    # Returns an empty list for no input
+    def test_empty(self):
+        assert merge_sorted([]) == []
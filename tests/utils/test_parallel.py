@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from maplestory.utils.parallel import map_concurrently
+
+
+class TestMapConcurrently:
+    # Returns results in input order
+    def test_returns_results_in_order(self):
+        def slow_square(n: int) -> int:
+            time.sleep(0.01 * (5 - n))
+            return n * n
+
+        assert map_concurrently(slow_square, range(5)) == [0, 1, 4, 9, 16]
+
+    # Runs the function on multiple threads at once
+    def test_runs_concurrently(self):
+        barrier = threading.Barrier(3, timeout=1)
+
+        def wait(n: int) -> int:
+            barrier.wait()
+            return n
+
+        assert map_concurrently(wait, range(3), max_workers=3) == [0, 1, 2]
+
+    # Raises the first exception by default
+    def test_raises_exception(self):
+        def fail_on_two(n: int) -> int:
+            if n == 2:
+                raise ValueError("two")
+            return n
+
+        with pytest.raises(ValueError, match="two"):
+            map_concurrently(fail_on_two, range(4))
+
+    # Returns exceptions in place when return_exceptions is True
+    def test_return_exceptions(self):
+        def fail_on_two(n: int) -> int:
+            if n == 2:
+                raise ValueError("two")
+            return n
+
+        results = map_concurrently(fail_on_two, range(4), return_exceptions=True)
+        assert results[:2] == [0, 1]
+        assert isinstance(results[2], ValueError)
+        assert results[3] == 3
+
+    # Returns an empty list for no input
+    def test_empty(self):
+        assert map_concurrently(str, []) == []
+
+    # Raises a ValueError for invalid max_workers
+    def test_invalid_max_workers(self):
+        with pytest.raises(ValueError):
+            map_concurrently(str, [1], max_workers=0)
@@ -0,0 +1,22 @@
+import pytest
+
+from maplestory.utils.persist import ensure_disjoint, write_atomic
+
+
+class TestWriteAtomic:
+    def test_replaces_file(self, tmp_path):
+        path = tmp_path / "state.json"
+        write_atomic(path, "{}")
+        write_atomic(path, '{"a": 1}')
+
+        assert path.read_text(encoding="utf-8") == '{"a": 1}'
+        assert list(tmp_path.iterdir()) == [path]
+
+
+class TestEnsureDisjoint:
+    def test_disjoint(self):
+        ensure_disjoint([], "date")
+
+    def test_overlap(self):
+        with pytest.raises(ValueError, match="date 2024-01-23"):
+            ensure_disjoint(["2024-01-23"], "date")